@@ -1,5 +1,14 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import authentrics_client as authrx
 
+# Number of checkpoint uploads to run at the same time. The server orders checkpoints
+# by arrival, and static analysis compares each checkpoint with the one before it, so
+# uploads run one at a time unless AAI_UPLOAD_CONCURRENCY is raised for checkpoints
+# whose order does not matter.
+upload_concurrency = int(os.getenv("AAI_UPLOAD_CONCURRENCY", "1"))
+
 client = authrx.AuthentricsClient("https://api.authentrics.ai")
 
 client.auth.login(
@@ -19,24 +28,28 @@ checkpoints = [
     "path/to/checkpoint3.onnx",
     "path/to/checkpoint4.onnx",
 ]
-for checkpoint in checkpoints:
-    client.checkpoint.upload_checkpoint(
+
+
+# Checkpoint files are streamed from disk, so uploads do not load them into memory.
+def upload_checkpoint(checkpoint: str) -> dict:
+    return client.checkpoint.add_checkpoint(
         project["id"],
         checkpoint,
         "onnx",
     )
 
+
+with ThreadPoolExecutor(max_workers=upload_concurrency) as executor:
+    list(executor.map(upload_checkpoint, checkpoints))
+
 project = client.project.get_project_by_id(project["id"])
 
 checkpoint_ids = [checkpoint["id"] for checkpoint in project["fileList"]]
 
-results = []
-for checkpoint_id in checkpoint_ids[1:]:
-    results.append(
-        client.static.static_analysis(
-            project_id=project["id"],
-            checkpoint_id=checkpoint_id,
-        )
-    )
+# Analyze every checkpoint after the first in a single request. Servers without the
+# batch endpoint get the analyses concurrently, one request per checkpoint. For
+# hundreds of checkpoints, `authrx.AsyncAuthentricsClient.from_client(client)` runs
+# them on a single event loop instead of a thread pool (requires the 'http2' extra).
+results = client.static.static_analysis_batch(project["id"], checkpoint_ids[1:])
 
 print(results)
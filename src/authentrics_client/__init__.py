@@ -1,15 +1,36 @@
-from .client import (
-    AuthentricsClient,
-    BaseClient,
-    ComparisonType,
-    FileType,
-    generate_multipart_json,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import (
+        AsyncAuthentricsClient,
+        AuthentricsClient,
+        BaseClient,
+        ComparisonType,
+        FileType,
+        generate_multipart_json,
+        generate_multipart_stream,
+    )
 
 __all__ = [
+    "AsyncAuthentricsClient",
     "AuthentricsClient",
     "BaseClient",
     "ComparisonType",
     "FileType",
     "generate_multipart_json",
+    "generate_multipart_stream",
 ]
+
+
+def __getattr__(name: str):
+    # The client (and with it `requests`) is only imported on first use, so that
+    # `authrx --help` and other entry points under this package start quickly.
+    if name in __all__:
+        from . import client
+
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,67 +1,57 @@
-import json
-import time
+from __future__ import annotations
+
+import importlib
 
 import click
-import requests
 
-from .config import BASE_DIR, TOKEN_PATH
+from .config import BASE_DIR, TOKEN_PATH  # noqa: F401
+
+# Moved to .login, and still importable from here without importing it eagerly
+_LOGIN_NAMES = frozenset(
+    {
+        "TOKEN_TTL_NS",
+        "load_cached_token",
+        "login",
+        "parse_url",
+        "post_login",
+        "store_token",
+    }
+)
 
 
-def parse_url(url: str) -> str:
-    parsed_url = requests.models.parse_url(url)
-    assert parsed_url.path is None or parsed_url.path == "/"
-    assert parsed_url.query is None
-    assert parsed_url.fragment is None
-    return parsed_url.url.rstrip("/")
+def __getattr__(name: str):
+    if name in _LOGIN_NAMES:
+        return getattr(importlib.import_module(f"{__package__}.login"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-def post_login(base_url: str, username: str, password: str) -> str:
-    response = requests.post(
-        base_url + "/api/auth/login",
-        json={"username": username, "password": password},
-    )
-    response.raise_for_status()
-    return response.content.decode()
+class LazyGroup(click.Group):
+    """A click group whose subcommands are imported only when they are used.
 
+    Subcommands are given as `{"name": "module.path:attribute"}`, so `authrx --help`
+    and `authrx --version` do not import the modules behind the commands.
+    """
 
-def store_token(token: str, url: str):
-    """Stores a token securely in ~/.cache/authrx/token.json."""
-    # Ensure the directory exists
-    BASE_DIR.mkdir(parents=True, exist_ok=True)
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
 
-    # Store the token in a JSON file
-    with TOKEN_PATH.open("w") as f:  # Open Path directly
-        json.dump({"token": token, "url": url, "COD": str(time.time_ns())}, f)
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
 
-    # Set file permissions to be readable only by the user
-    TOKEN_PATH.chmod(0o600)
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attribute)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
 
 
-@click.command()
-@click.argument("url", type=str)
-@click.option("--username", prompt="Enter username", help="Your username")
-@click.option(
-    "--password",
-    prompt="Enter password",
-    hide_input=True,
-    confirmation_prompt=True,
-    help="Your password",
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={"login": "authentrics_client.cli.login:login"},
 )
-def login(url, username, password):
-    """Simple CLI to take a username and password securely."""
-    click.echo(f"Username: {username}")
-    click.echo("Password received securely!")
-
-    base_url = parse_url(url)
-    token = post_login(base_url, username, password)
-    store_token(token, base_url)
-
-
-@click.group()
 @click.version_option(package_name="authentrics-client")
 def cli():
     """AuthRX CLI - Authentrics Command Line Tool"""
     pass
-
-
-cli.add_command(login)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import TYPE_CHECKING
+
+import click
+
+from .config import BASE_DIR, TOKEN_PATH
+
+if TYPE_CHECKING:
+    import requests
+
+# `requests` is imported lazily: `authrx --help` and `--version` never need it.
+_SESSION: requests.Session | None = None
+"""Session shared by every request made during a single CLI process."""
+
+TOKEN_TTL_NS = 10 * 60 * 1_000_000_000
+"""How long a stored token is reused before `authrx login` asks the server again."""
+
+
+def _get_session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=0)
+        _SESSION = requests.Session()
+        _SESSION.mount("http://", adapter)
+        _SESSION.mount("https://", adapter)
+    return _SESSION
+
+
+def parse_url(url: str) -> str:
+    from ..client.base_client import normalize_base_url
+
+    return normalize_base_url(url)
+
+
+def post_login(
+    base_url: str,
+    username: str,
+    password: str,
+    session: requests.Session | None = None,
+) -> str:
+    session = session or _get_session()
+    response = session.post(
+        base_url + "/api/auth/login",
+        json={"username": username, "password": password},
+    )
+    response.raise_for_status()
+    return response.content.decode()
+
+
+def _token_owner(username: str, url: str) -> str:
+    """Fingerprint of the account a token was issued to, without storing the name."""
+    return hashlib.sha256(f"{username}\n{url}".encode()).hexdigest()
+
+
+def load_cached_token(base_url: str, username: str) -> str | None:
+    """Return the stored token if it was issued to this user and URL within the TTL
+    and has not expired."""
+    try:
+        # Refuse to follow a symlink planted in place of the token file
+        fd = os.open(TOKEN_PATH, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+        with os.fdopen(fd, "rb") as f:
+            data = json.load(f)
+        # Older versions stored the timestamp as a string
+        issued_at = int(data["COD"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if data.get("url") != base_url or data.get("owner") != _token_owner(
+        username, base_url
+    ):
+        return None
+    if time.time_ns() - issued_at >= TOKEN_TTL_NS:
+        return None
+
+    from ..client.handlers.authentication_handler import decode_token
+
+    token = data.get("token")
+    try:
+        # The token may expire before the TTL runs out
+        decode_token(token)
+    except ValueError:
+        return None
+    return token
+
+
+def store_token(token: str, url: str, username: str | None = None):
+    """Stores a token securely in ~/.cache/authrx/token.json."""
+    # Ensure the directory exists
+    BASE_DIR.mkdir(parents=True, exist_ok=True)
+
+    data = {"token": token, "url": url, "COD": time.time_ns()}
+    if username is not None:
+        data["owner"] = _token_owner(username, url)
+
+    # Write to a private temporary file and rename it over the token file, so
+    # readers never see a partial file and an existing symlink is replaced, not
+    # followed. mkstemp creates the file readable only by the user (0o600).
+    fd, tmp_path = tempfile.mkstemp(dir=BASE_DIR, prefix=".token-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, TOKEN_PATH)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+@click.command()
+@click.argument("url", type=str)
+@click.option("--username", prompt="Enter username", help="Your username")
+@click.option("--password", help="Your password (prompted for if needed)")
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Log in again even if a recent token is cached",
+)
+def login(url, username, password, refresh):
+    """Simple CLI to take a username and password securely."""
+    click.echo(f"Username: {username}")
+
+    base_url = parse_url(url)
+    if not refresh and load_cached_token(base_url, username) is not None:
+        click.echo("Using cached token.")
+        return
+
+    if password is None:
+        password = click.prompt(
+            "Enter password", hide_input=True, confirmation_prompt=True
+        )
+    click.echo("Password received securely!")
+
+    token = post_login(base_url, username, password)
+    store_token(token, base_url, username)
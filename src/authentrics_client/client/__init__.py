@@ -1,12 +1,26 @@
+from .async_client import AsyncAuthentricsClient, AsyncBaseClient
 from .authentrics_client import AuthentricsClient
 from .base_client import BaseClient
-from .types import ComparisonType, FileType, MOEAnalysisType, generate_multipart_json
+from .types import (
+    ComparisonType,
+    FileType,
+    MOEAnalysisType,
+    MultipartStream,
+    TarStream,
+    generate_multipart_json,
+    generate_multipart_stream,
+)
 
 __all__ = [
+    "AsyncAuthentricsClient",
+    "AsyncBaseClient",
     "AuthentricsClient",
     "BaseClient",
     "ComparisonType",
     "MOEAnalysisType",
     "FileType",
+    "MultipartStream",
+    "TarStream",
     "generate_multipart_json",
+    "generate_multipart_stream",
 ]
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Any, Optional
+
+from .base_client import (
+    BaseClient,
+    _as_httpx_kwargs,
+    _encode_json_body,
+    _httpx_status_error,
+    normalize_base_url,
+)
+from .handlers.async_admin_handler import AsyncAdminHandler
+from .handlers.async_authentication_handler import AsyncAuthenticationHandler
+from .handlers.async_checkpoint_handler import AsyncCheckpointHandler
+from .handlers.async_membership_handler import AsyncMembershipHandler
+from .handlers.async_project_handler import AsyncProjectHandler
+from .handlers.async_result_handler import AsyncResultHandler
+from .handlers.async_static_handler import AsyncStaticHandler
+from .types import MethodType
+
+__all__ = ["AsyncAuthentricsClient", "AsyncBaseClient"]
+
+
+def _make_httpx_async_client(proxy_url: Optional[str], pool_maxsize: int) -> Any:
+    """Create an HTTP/2-capable `httpx.AsyncClient`."""
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(
+            "The async client requires the 'http2' extra to be installed."
+            " Please install with: pip install authentrics-client[http2]"
+        ) from None
+
+    return httpx.AsyncClient(
+        http2=True,
+        proxy=proxy_url or None,
+        limits=httpx.Limits(
+            max_keepalive_connections=pool_maxsize, max_connections=pool_maxsize
+        ),
+        # Analyses can run for minutes; match requests, which never times out
+        timeout=None,
+    )
+
+
+class AsyncBaseClient:
+    """An asyncio client for interacting with a given URL, built on `httpx`.
+
+    A single event loop can keep many requests in flight without a thread per
+    request. Requests accept the same keyword arguments as :class:`BaseClient`, and
+    HTTP errors are raised as `requests.exceptions.HTTPError`.
+
+    Usage:
+        >>> async with AsyncBaseClient("https://api.authentrics.ai") as client:
+        ...     await client.get("/v3/api-docs")
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        proxy_url: Optional[str] = None,
+        *,
+        pool_maxsize: int = 20,
+    ) -> None:
+        """An asyncio client for interacting with a given URL.
+
+        Args:
+            base_url: The base URL of the API server
+            proxy_url: Optional proxy URL (e.g., 'socks5h://localhost:1080')
+            pool_maxsize: The maximum number of connections to the server. Over HTTP/2
+            many concurrent requests share each connection.
+        """
+        self.base_url = normalize_base_url(base_url)
+        """The parsed base URL of the API server."""
+
+        self._session = _make_httpx_async_client(proxy_url, pool_maxsize)
+        """The session for the API server."""
+
+        self._missing_endpoints: set[str] = set()
+        """Optional endpoints, e.g. "POST /static_analysis/batch", that the server
+        answered with 404 or 405, so handlers use their fallback right away."""
+
+    async def _request(self, request_method: MethodType, route: str, **kwargs):
+        """Make a request to the API using the pre-initialized session.
+
+        Args:
+            request_method: The HTTP method to use
+            route: The API route to request
+            **kwargs: Additional arguments, as for `BaseClient`
+
+        Returns:
+            The response from the API
+
+        Raises:
+            requests.exceptions.HTTPError: If the request fails
+        """
+        stream = kwargs.pop("stream", False)
+        request = self._session.build_request(
+            request_method.value,
+            self.base_url + route,
+            **_as_httpx_kwargs(_encode_json_body(kwargs)),
+        )
+        response = await self._session.send(request, stream=stream)
+        if response.is_error:
+            await response.aread()
+            await response.aclose()
+            raise _httpx_status_error(response)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the connections to the server."""
+        await self._session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    # REST methods
+    async def get(self, route: str, **kwargs):
+        return await self._request(MethodType.GET, route, **kwargs)
+
+    async def post(self, route: str, **kwargs):
+        return await self._request(MethodType.POST, route, **kwargs)
+
+    async def delete(self, route: str, **kwargs):
+        return await self._request(MethodType.DELETE, route, **kwargs)
+
+    async def put(self, route: str, **kwargs):
+        return await self._request(MethodType.PUT, route, **kwargs)
+
+    async def patch(self, route: str, **kwargs):
+        return await self._request(MethodType.PATCH, route, **kwargs)
+
+
+class AsyncAuthentricsClient(AsyncBaseClient):
+    """An asyncio client for the Authentrics API, for running many requests at once.
+
+    It covers authentication, project reads, memberships, checkpoint and result
+    artifact downloads and the bulk operations of :class:`AuthentricsClient`. It can
+    also be created from a logged-in synchronous client with :meth:`from_client`.
+
+    Usage:
+        >>> async with AsyncAuthentricsClient("https://api.authentrics.ai") as client:
+        ...     await client.auth.login(username="...", password="...")
+        ...     results = await client.static.static_analysis_batch(
+        ...         project_id, checkpoint_ids
+        ...     )
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        proxy_url: Optional[str] = None,
+        *,
+        pool_maxsize: int = 20,
+    ) -> None:
+        """Initialize the Authentrics client.
+
+        Args:
+            base_url: The base URL of the Authentrics API.
+            proxy_url: Optional proxy URL to use for requests. If not provided, no proxy
+            will be used.
+            pool_maxsize: The maximum number of connections to the server.
+        """
+        super().__init__(base_url, proxy_url, pool_maxsize=pool_maxsize)
+        self._session.headers["clientName"] = "authrx-client"
+
+    @classmethod
+    def from_client(
+        cls,
+        client: BaseClient,
+        proxy_url: Optional[str] = None,
+        *,
+        pool_maxsize: int = 20,
+    ) -> AsyncAuthentricsClient:
+        """Create an async client for the same server and login as `client`."""
+        async_client = cls(client.base_url, proxy_url, pool_maxsize=pool_maxsize)
+        for header in ("Authorization", "clientName"):
+            value = client._session.headers.get(header)
+            if value is not None:
+                async_client._session.headers[header] = value
+        return async_client
+
+    @cached_property
+    def admin(self) -> AsyncAdminHandler:
+        """The admin handler for the Authentrics API. Can only be used by admins."""
+        return AsyncAdminHandler(self)
+
+    @cached_property
+    def auth(self) -> AsyncAuthenticationHandler:
+        """The authentication handler for the Authentrics API."""
+        return AsyncAuthenticationHandler(self)
+
+    @cached_property
+    def checkpoint(self) -> AsyncCheckpointHandler:
+        """Handler for downloading checkpoints."""
+        return AsyncCheckpointHandler(self)
+
+    @cached_property
+    def membership(self) -> AsyncMembershipHandler:
+        """Handles membership-related operations."""
+        return AsyncMembershipHandler(self)
+
+    @cached_property
+    def project(self) -> AsyncProjectHandler:
+        """Handles reading projects."""
+        return AsyncProjectHandler(self)
+
+    @cached_property
+    def result(self) -> AsyncResultHandler:
+        """Handler for downloading analysis result artifacts."""
+        return AsyncResultHandler(self)
+
+    @cached_property
+    def static(self) -> AsyncStaticHandler:
+        """Handler for running static analysis on a checkpoint."""
+        return AsyncStaticHandler(self)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import cached_property
+from pathlib import Path
 from typing import Optional
 
 from .base_client import BaseClient
@@ -22,85 +24,102 @@ __all__ = ["AuthentricsClient"]
 class AuthentricsClient(BaseClient):
     """A client for interacting with the Authentrics API.
 
+    Handlers (e.g. `client.project`) are created the first time they are accessed.
+
     For requests involving file uploads, use the
     :func:`authentrics_client.generate_multipart_json`
     function as the argument to the `files` keyword argument. For all other requests,
     use the `json` keyword argument.
     """
 
-    def __init__(self, base_url: str, proxy_url: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        proxy_url: Optional[str] = None,
+        *,
+        transport: str = "requests",
+        pool_maxsize: int = 16,
+        cache_ttl: float = 0,
+        metadata_cache: str | Path | None = None,
+    ) -> None:
         """Initialize the Authentrics client.
 
         Args:
             base_url: The base URL of the Authentrics API.
             proxy_url: Optional proxy URL to use for requests. If not provided, no proxy
             will be used.
+            transport: The HTTP library to send requests with, "requests" (default) or
+            "httpx" for HTTP/2 multiplexing. The latter requires the 'http2' extra.
+            pool_maxsize: The number of connections kept open to the server, which
+            should be at least the number of threads sharing the client.
+            cache_ttl: Number of seconds to reuse the result of repeated reads, such
+            as `project.get_project_by_id`. Any other request clears the cache.
+            Disabled (0) by default.
+            metadata_cache: Optional SQLite file that keeps the ETags and bodies of
+            reads such as `result.getAnalysisResults` between processes, so a later
+            run only revalidates them. By default they are only kept in memory.
         """
-        super().__init__(base_url, proxy_url)
+        super().__init__(
+            base_url,
+            proxy_url,
+            transport=transport,
+            pool_maxsize=pool_maxsize,
+            cache_ttl=cache_ttl,
+            metadata_cache=metadata_cache,
+        )
         self._session.headers["clientName"] = "authrx-client"
 
-        self._admin = AdminHandler(self)
-        self._auth = AuthenticationHandler(self)
-        self._checkpoint = CheckpointHandler(self)
-        self._dynamic = DynamicHandler(self)
-        self._membership = MembershipHandler(self)
-        self._project = ProjectHandler(self)
-        self._static = StaticHandler(self)
-        self._user = UserHandler(self)
-        self._base_model = BaseModelHandler(self)
-        self._result = ResultHandler(self)
-
-    @property
+    @cached_property
     def admin(self) -> AdminHandler:
         """The admin handler for the Authentrics API. Can only be used by admins."""
-        return self._admin
+        return AdminHandler(self)
 
-    @property
+    @cached_property
     def auth(self) -> AuthenticationHandler:
         """The authentication handler for the Authentrics API."""
-        return self._auth
+        return AuthenticationHandler(self)
 
-    @property
+    @cached_property
     def checkpoint(self) -> CheckpointHandler:
         """Handles checkpoint-related operations."""
-        return self._checkpoint
+        return CheckpointHandler(self)
 
-    @property
+    @cached_property
     def base_model(self) -> BaseModelHandler:
         """Handles base model-related operations."""
-        return self._base_model
+        return BaseModelHandler(self)
 
-    @property
+    @cached_property
     def dynamic(self) -> DynamicHandler:
         """Handler for running dynamic analysis (analysis during inference) on a
         checkpoint.
         """
-        return self._dynamic
+        return DynamicHandler(self)
 
-    @property
+    @cached_property
     def membership(self) -> MembershipHandler:
         """Handles membership-related operations."""
-        return self._membership
+        return MembershipHandler(self)
 
-    @property
+    @cached_property
     def project(self) -> ProjectHandler:
         """Handles project-related operations."""
-        return self._project
+        return ProjectHandler(self)
 
-    @property
+    @cached_property
     def result(self) -> ResultHandler:
         """Handler for interacting with analysis results in the Authentrics API."""
-        return self._result
+        return ResultHandler(self)
 
-    @property
+    @cached_property
     def static(self) -> StaticHandler:
         """Handler for running static analysis on a checkpoint."""
-        return self._static
+        return StaticHandler(self)
 
-    @property
+    @cached_property
     def user(self) -> UserHandler:
         """Handles operations a user can perform on their own account."""
-        return self._user
+        return UserHandler(self)
 
     @property
     def client_name(self) -> str:
@@ -1,13 +1,127 @@
 from __future__ import annotations
 
-from typing import Optional
+import os
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.poolmanager import PoolKey
+from urllib3.util.retry import Retry
 
+from .cache import SQLiteCache, TTLCache
+from .serialization import json_dumpb
 from .types import MethodType
 
 __all__ = ["BaseClient"]
 
+UPLOAD_BLOCKSIZE = 1 << 20
+"""Number of bytes read from a file-like request body per socket send."""
+
+ETAG_CACHE_TTL = 300
+"""Number of seconds a response body is kept for revalidation with its ETag."""
+
+
+class _HTTPAdapter(HTTPAdapter):
+    """An `HTTPAdapter` that sends file-like bodies in `UPLOAD_BLOCKSIZE` blocks.
+
+    urllib3 reads streamed uploads (e.g. `MultipartStream`) 16 KiB at a time by
+    default, which makes multi-gigabyte checkpoint uploads CPU-bound on fast links.
+    Only urllib3 2 accepts the setting; older versions keep their default.
+    """
+
+    def init_poolmanager(self, *args, **pool_kwargs) -> None:
+        if "key_blocksize" in PoolKey._fields:
+            pool_kwargs.setdefault("blocksize", UPLOAD_BLOCKSIZE)
+        super().init_poolmanager(*args, **pool_kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        if "key_blocksize" in PoolKey._fields:
+            proxy_kwargs.setdefault("blocksize", UPLOAD_BLOCKSIZE)
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+@lru_cache(maxsize=128)
+def normalize_base_url(url: str) -> str:
+    """Validate that `url` is a bare origin and return it without a trailing slash.
+
+    The result only depends on the input string, so it is memoized for scripts that
+    construct many clients against the same server.
+    """
+    parsed_url = requests.models.parse_url(url)
+    assert parsed_url.path is None or parsed_url.path == "/"
+    assert parsed_url.query is None
+    assert parsed_url.fragment is None
+    return parsed_url.url.rstrip("/")
+
+
+def _make_httpx_client(proxy_url: Optional[str], pool_maxsize: int) -> Any:
+    """Create an HTTP/2-capable `httpx.Client` for the "httpx" transport."""
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(
+            "The httpx transport requires the 'http2' extra to be installed."
+            " Please install with: pip install authentrics-client[http2]"
+        ) from None
+
+    return httpx.Client(
+        http2=True,
+        proxy=proxy_url or None,
+        limits=httpx.Limits(
+            max_keepalive_connections=pool_maxsize, max_connections=pool_maxsize
+        ),
+        # Analyses can run for minutes; match requests, which never times out
+        timeout=None,
+    )
+
+
+def _as_httpx_form_value(value: Any) -> Any:
+    """Coerce a multipart field value to something httpx can encode."""
+    if isinstance(value, (str, bytes)) or hasattr(value, "read"):
+        return value
+    return str(value)
+
+
+def _as_httpx_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Translate requests-style keyword arguments for `httpx.Client.build_request`.
+
+    Non-mapping `data` is sent as raw content and multipart values are coerced.
+    """
+    if "data" in kwargs and not isinstance(kwargs["data"], Mapping):
+        kwargs["content"] = kwargs.pop("data")
+    if "files" in kwargs:
+        kwargs["files"] = {
+            name: (filename, _as_httpx_form_value(value), content_type)
+            for name, (filename, value, content_type) in kwargs["files"].items()
+        }
+    return kwargs
+
+
+def _encode_json_body(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Serialize a `json=` body with :func:`json_dumpb`, which uses `orjson` if it is
+    installed, instead of leaving it to the HTTP library's standard `json`."""
+    if kwargs.get("json") is None or kwargs.get("data"):
+        return kwargs
+    kwargs = dict(kwargs)
+    kwargs["data"] = json_dumpb(kwargs.pop("json"))
+    kwargs["headers"] = {
+        "Content-Type": "application/json",
+        **(kwargs.get("headers") or {}),
+    }
+    return kwargs
+
+
+def _httpx_status_error(response: Any) -> requests.HTTPError:
+    """The `requests` error for an httpx error response, so callers can handle both
+    transports the same way."""
+    return requests.HTTPError(
+        f"{response.status_code} Error: {response.reason_phrase} for url: {response.url}",
+        response=response,
+    )
+
 
 class BaseClient:
     """A client for interacting with a given URL.
@@ -22,27 +136,83 @@ class BaseClient:
         ... })
     """
 
-    def __init__(self, base_url: str, proxy_url: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        proxy_url: Optional[str] = None,
+        *,
+        transport: str = "requests",
+        pool_maxsize: int = 16,
+        cache_ttl: float = 0,
+        metadata_cache: str | Path | None = None,
+    ) -> None:
         """A client for interacting with a given URL.
 
         Args:
             base_url: The base URL of the API server
             proxy_url: Optional proxy URL (e.g., 'socks5h://localhost:1080')
+            transport: The HTTP library to send requests with. "requests" (default)
+            uses HTTP/1.1; "httpx" uses HTTP/2 so concurrent requests share a single
+            connection, and requires the 'http2' extra.
+            pool_maxsize: The number of connections kept open to the server. Set this
+            to at least the number of threads sharing the client, otherwise the extra
+            threads wait for a free connection.
+            cache_ttl: Number of seconds that handlers may reuse the result of a
+            read (e.g. `get_project_by_id`) instead of asking the server again. Any
+            other request clears the cache. Disabled (0) by default.
+            metadata_cache: Optional SQLite file to keep the ETags and bodies of reads
+            in, so that later processes can revalidate them instead of downloading
+            them again. By default they are only kept in memory. Setting the
+            `AAI_METADATA_CACHE` environment variable to "ignore" disables the file.
         """
-        self.base_url = base_url
+        self.base_url = normalize_base_url(base_url)
         """The parsed base URL of the API server."""
 
-        self._session = requests.Session()
-        """The requests session for the API server."""
-        parsed_url = requests.models.parse_url(base_url)
-        assert parsed_url.path is None or parsed_url.path == "/"
-        assert parsed_url.query is None
-        assert parsed_url.fragment is None
+        if transport not in ("requests", "httpx"):
+            raise ValueError(f"Unsupported transport: {transport}")
+        self.transport = transport
+        """The HTTP library used to send requests."""
+
+        if transport == "httpx":
+            self._session = _make_httpx_client(proxy_url, pool_maxsize)
+        else:
+            self._session = requests.Session()
+            adapter = _HTTPAdapter(
+                pool_connections=pool_maxsize,
+                pool_maxsize=pool_maxsize,
+                # Only idempotent methods are retried on these statuses; the last
+                # response is returned so raise_for_status still raises HTTPError
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=(502, 503, 504),
+                    raise_on_status=False,
+                ),
+            )
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+            if proxy_url:
+                self._session.proxies = {"http": proxy_url, "https": proxy_url}
+        """The session for the API server."""
+
+        self._cache = TTLCache(ttl=cache_ttl) if cache_ttl > 0 else None
+        """Results of reads shared by the handlers, or None if caching is disabled."""
 
-        self.base_url = parsed_url.url.rstrip("/")
+        self._etag_cache = (
+            TTLCache(maxsize=128, ttl=ETAG_CACHE_TTL)
+            if metadata_cache is None or os.getenv("AAI_METADATA_CACHE") == "ignore"
+            else SQLiteCache(metadata_cache, namespace=self.base_url)
+        )
+        """The ETag and body of recent reads, keyed by route, for `If-None-Match`."""
+
+        self._missing_endpoints: set[str] = set()
+        """Optional endpoints, e.g. "POST /static_analysis/batch", that the server
+        answered with 404 or 405, so handlers use their fallback right away."""
 
-        if proxy_url:
-            self._session.proxies = {"http": proxy_url, "https": proxy_url}
+    def clear_cache(self) -> None:
+        """Forget all cached results, so the next reads go to the server."""
+        if self._cache is not None:
+            self._cache.clear()
 
     def _request(self, request_method: MethodType, route: str, **kwargs):
         """Make a request to the API using the pre-initialized session.
@@ -58,12 +228,38 @@ class BaseClient:
         Raises:
             requests.exceptions.HTTPError: If the request fails
         """
+        if request_method is not MethodType.GET:
+            # Anything but a read may change what the cached reads would return
+            self.clear_cache()
+
+        kwargs = _encode_json_body(kwargs)
+        if self.transport == "httpx":
+            return self._httpx_request(request_method, route, **kwargs)
+
         response = self._session.request(
             request_method.value, self.base_url + route, **kwargs
         )
         response.raise_for_status()
         return response
 
+    def _httpx_request(self, request_method: MethodType, route: str, **kwargs):
+        """Make a request through the httpx session, accepting requests-style kwargs.
+
+        `stream=True` defers reading the body, non-mapping `data` is sent as raw
+        content, and HTTP errors are raised as `requests.exceptions.HTTPError` so
+        callers can handle both transports the same way.
+        """
+        stream = kwargs.pop("stream", False)
+        request = self._session.build_request(
+            request_method.value, self.base_url + route, **_as_httpx_kwargs(kwargs)
+        )
+        response = self._session.send(request, stream=stream)
+        if response.is_error:
+            response.read()
+            response.close()
+            raise _httpx_status_error(response)
+        return response
+
     # REST methods
     def get(self, route: str, **kwargs):
         return self._request(MethodType.GET, route, **kwargs)
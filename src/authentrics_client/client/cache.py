@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional
+
+__all__ = ["SQLiteCache", "TTLCache"]
+
+_MISSING = object()
+
+
+class TTLCache:
+    """A thread-safe, size-bounded mapping whose entries expire after a fixed time.
+
+    When full, the least recently used entry is evicted. Expiry uses a monotonic
+    clock, so it is unaffected by changes to the system time.
+
+    Usage:
+        >>> cache = TTLCache(maxsize=64, ttl=5)
+        >>> cache.set("key", "value")
+        >>> cache.get("key")
+        'value'
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 5.0) -> None:
+        """Create an empty cache.
+
+        Args:
+            maxsize: The maximum number of entries to keep.
+            ttl: The default number of seconds an entry stays valid.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for `key`, or `default` if it is missing or expired."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value` under `key` for `ttl` seconds (the cache's default if None)."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove `key` and return its value, or `default` if it is missing or expired."""
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+        if entry is _MISSING or entry[0] <= time.monotonic():
+            return default
+        return entry[1]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class SQLiteCache:
+    """A thread-safe store of `(etag, body)` pairs in an SQLite file, shared between
+    processes.
+
+    It has the `get`, `set`, `pop` and `clear` methods of :class:`TTLCache`, so a
+    client can keep the ETags of its reads here instead of in memory. Every read
+    is revalidated with the server anyway, so entries are kept for long: they
+    expire `ttl` seconds after they were last stored or revalidated. Each write
+    deletes the expired entries and, beyond `maxsize` entries in the file, the
+    least recently stored ones. Keys are prefixed with `namespace`, so clients of
+    different servers can share a file.
+
+    The `AAI_METADATA_CACHE` environment variable can be set to "clear" to empty
+    the file when it is opened.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        namespace: str = "",
+        maxsize: int = 1024,
+        ttl: float = 7 * 24 * 3600,
+    ) -> None:
+        """Open the cache file at `path`, creating it and its directory if needed.
+
+        Args:
+            path: The SQLite database file.
+            namespace: The prefix of every key, e.g. the base URL of the server.
+            maxsize: The maximum number of entries to keep in the file, across all
+            namespaces.
+            ttl: The number of seconds an entry stays valid (default: a week).
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses"
+                " (key TEXT PRIMARY KEY, etag TEXT, body BLOB, fetched REAL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_fetched ON responses (fetched)"
+            )
+            if os.getenv("AAI_METADATA_CACHE") == "clear":
+                self._connection.execute("DELETE FROM responses")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the `(etag, body)` pair for `key`, or `default` if it is missing or
+        expired."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT etag, body FROM responses WHERE key = ? AND fetched > ?",
+                (self.namespace + key, time.time() - self.ttl),
+            ).fetchone()
+        return default if row is None else (row[0], row[1])
+
+    def set(
+        self, key: str, value: tuple[str, bytes], ttl: Optional[float] = None
+    ) -> None:
+        """Store an `(etag, body)` pair under `key`, and evict expired and surplus
+        entries. `ttl` is ignored."""
+        etag, body = value
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (self.namespace + key, etag, body, now),
+            )
+            self._connection.execute(
+                "DELETE FROM responses WHERE fetched <= ?", (now - self.ttl,)
+            )
+            self._connection.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses"
+                " ORDER BY fetched DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """Remove `key` and return its pair, or `default` if it is missing."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM responses WHERE key = ?", (self.namespace + key,)
+            )
+        return value
+
+    def clear(self) -> None:
+        """Remove every entry of this namespace."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM responses WHERE substr(key, 1, ?) = ?",
+                (len(self.namespace), self.namespace),
+            )
+
+    def close(self) -> None:
+        """Close the database file."""
+        with self._lock:
+            self._connection.close()
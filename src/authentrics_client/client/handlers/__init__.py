@@ -1,4 +1,11 @@
 from .admin_handler import AdminHandler
+from .async_admin_handler import AsyncAdminHandler
+from .async_authentication_handler import AsyncAuthenticationHandler
+from .async_checkpoint_handler import AsyncCheckpointHandler
+from .async_membership_handler import AsyncMembershipHandler
+from .async_project_handler import AsyncProjectHandler
+from .async_result_handler import AsyncResultHandler
+from .async_static_handler import AsyncStaticHandler
 from .authentication_handler import AuthenticationHandler
 from .base_model_handler import BaseModelHandler
 from .checkpoint_handler import CheckpointHandler
@@ -11,6 +18,13 @@ from .user_handler import UserHandler
 
 __all__ = [
     "AdminHandler",
+    "AsyncAdminHandler",
+    "AsyncAuthenticationHandler",
+    "AsyncCheckpointHandler",
+    "AsyncMembershipHandler",
+    "AsyncProjectHandler",
+    "AsyncResultHandler",
+    "AsyncStaticHandler",
     "AuthenticationHandler",
     "CheckpointHandler",
     "DynamicHandler",
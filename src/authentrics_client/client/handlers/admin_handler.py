@@ -1,11 +1,40 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Optional
+
+import requests
 
 from .base_handler import BaseHandler
 
 __all__ = ["AdminHandler"]
 
+_USER_INDEX_KEY = "/api/auth/admin/user#emailAddress"
+"""Client cache key of the users indexed by email."""
+
+
+def _user_payload(
+    username: str,
+    email: str,
+    password: str,
+    first_name: str,
+    last_name: str,
+    **kwargs,
+) -> dict:
+    """The request body for creating a user or an admin."""
+    return {
+        "username": username,
+        "emailAddress": email,
+        "password": password,
+        "firstName": first_name,
+        "lastName": last_name,
+        **kwargs,
+    }
+
+
+def _find_user(users: list[dict], email: str) -> dict | None:
+    """The first of `users` with the email address `email`, if any."""
+    return next((user for user in users if user["emailAddress"] == email), None)
+
 
 class AdminHandler(BaseHandler):
     """Handler for the admin API.
@@ -15,7 +44,7 @@ class AdminHandler(BaseHandler):
 
     def get_all_admins(self) -> list[dict]:
         """Get the info of all admins."""
-        return self.get("/api/auth/admin").json()
+        return self._json(self.get("/api/auth/admin"))
 
     def create_admin(
         self,
@@ -29,19 +58,14 @@ class AdminHandler(BaseHandler):
         """Create a new admin user."""
         self.post(
             "/api/auth/admin",
-            json={
-                "username": username,
-                "emailAddress": email,
-                "password": password,
-                "firstName": first_name,
-                "lastName": last_name,
-                **kwargs,
-            },
+            json=_user_payload(
+                username, email, password, first_name, last_name, **kwargs
+            ),
         )
 
     def get_all_users(self) -> list[dict]:
         """Get all users."""
-        return self.get("/api/auth/admin/user").json()
+        return self._json(self.get("/api/auth/admin/user"))
 
     def create_user(
         self,
@@ -55,16 +79,55 @@ class AdminHandler(BaseHandler):
         """Create a new user."""
         self.post(
             "/api/auth/admin/user",
-            json={
-                "username": username,
-                "emailAddress": email,
-                "password": password,
-                "firstName": first_name,
-                "lastName": last_name,
-                **kwargs,
-            },
+            json=_user_payload(
+                username, email, password, first_name, last_name, **kwargs
+            ),
         )
 
+    def create_users(self, users: list[dict], *, max_workers: int = 16) -> None:
+        """Create several users in one request.
+
+        Args:
+            users: The users to create, each a dict of the keyword arguments of
+            `create_user`.
+            max_workers: If the server does not provide the bulk endpoint, the number
+            of users to create concurrently instead.
+        """
+        self._create_many("/api/auth/admin/user", users, self.create_user, max_workers)
+
+    def create_admins(self, admins: list[dict], *, max_workers: int = 16) -> None:
+        """Create several admin users in one request.
+
+        Args:
+            admins: The admins to create, each a dict of the keyword arguments of
+            `create_admin`.
+            max_workers: If the server does not provide the bulk endpoint, the number
+            of admins to create concurrently instead.
+        """
+        self._create_many("/api/auth/admin", admins, self.create_admin, max_workers)
+
+    def _create_many(
+        self,
+        route: str,
+        users: list[dict],
+        create_one: Callable[..., None],
+        max_workers: int,
+    ) -> None:
+        """POST `users` to the bulk endpoint under `route`, or one at a time if the
+        server does not provide it."""
+        endpoint = f"POST {route}/bulk"
+        if self._has_endpoint(endpoint):
+            try:
+                self.post(
+                    f"{route}/bulk", json={"users": [_user_payload(**u) for u in users]}
+                )
+                return
+            except requests.HTTPError as e:
+                if not self._is_missing_endpoint(e, endpoint):
+                    raise
+
+        self._map_concurrently(lambda user: create_one(**user), users, max_workers)
+
     def delete_admin(self, user_id: str, email: str) -> None:
         """Delete a user."""
         self.delete(f"/api/auth/admin/{user_id}", json={"emailAddress": email})
@@ -110,9 +173,22 @@ class AdminHandler(BaseHandler):
         self.patch(f"/api/auth/admin/user/{user_id}", json=data)
 
     def get_user_by_email(self, email: str) -> dict | None:
-        """Get a user by email."""
-        all_users = self.get_all_users()
-        for user in all_users:
-            if user["emailAddress"] == email:
+        """Get a user by email.
+
+        The email is sent as a query parameter so the server only returns the matching
+        user. Servers that ignore the parameter return every user, so the result is
+        still filtered here. If the client was created with a `cache_ttl`, those users
+        are also indexed by email, so further lookups are answered without a request.
+        """
+        cache = self._client._cache
+        if cache is not None:
+            user = cache.get(_USER_INDEX_KEY, {}).get(email)
+            if user is not None:
                 return user
-        return None
+
+        users = self._json(
+            self.get("/api/auth/admin/user", params={"emailAddress": email})
+        )
+        if cache is not None and len(users) > 1:
+            cache.set(_USER_INDEX_KEY, {user["emailAddress"]: user for user in users})
+        return _find_user(users, email)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from .admin_handler import _find_user
+from .async_base_handler import AsyncBaseHandler
+
+__all__ = ["AsyncAdminHandler"]
+
+
+class AsyncAdminHandler(AsyncBaseHandler):
+    """An asyncio handler for the admin API.
+
+    To access this API, you need to be logged in as an admin user.
+    """
+
+    async def get_all_users(self) -> list[dict]:
+        """Get all users."""
+        return self._json(await self.get("/api/auth/admin/user"))
+
+    async def get_user_by_email(self, email: str) -> dict | None:
+        """Get a user by email.
+
+        See :meth:`AdminHandler.get_user_by_email`.
+        """
+        response = await self.get("/api/auth/admin/user", params={"emailAddress": email})
+        users = self._json(response)
+        return _find_user(users, email)
+
+    async def get_users_by_email(
+        self, emails: list[str], *, max_concurrency: int = 32
+    ) -> list[dict | None]:
+        """Look up several users by email concurrently.
+
+        Returns:
+            The users, or None for emails without a user, in the order of `emails`.
+        """
+        return await self._gather_limited(self.get_user_by_email, emails, max_concurrency)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import requests
+
+from .async_base_handler import AsyncBaseHandler
+from .authentication_handler import (
+    _VALIDATED_TOKENS,
+    _credentials,
+    _probe_order,
+    _role_claims,
+    _token_key,
+    decode_token,
+)
+
+__all__ = ["AsyncAuthenticationHandler"]
+
+
+class AsyncAuthenticationHandler(AsyncBaseHandler):
+    """An asyncio handler for the Authentrics API authentication endpoints."""
+
+    async def login(
+        self,
+        *,
+        username: str | None = None,
+        password: str | None = None,
+        token: str | None = None,
+    ):
+        """Login to the Authentrics API.
+
+        See :meth:`AuthenticationHandler.login`. Prompting for missing credentials
+        blocks the event loop, so pass them in (or set the environment variables)
+        when other tasks are running.
+        """
+
+        if token is not None:
+            await self._validate_and_set_token(token)
+            return
+
+        response = await self.post(
+            "/api/auth/login", json=_credentials(username, password)
+        )
+        await self._validate_and_set_token(response.content.decode())
+
+    async def _validate_and_set_token(self, token: str) -> None:
+        """Validate a token.
+
+        If the token is invalid, the old authorization header will be restored.
+        """
+
+        decoded = decode_token(token)
+
+        old_authorization = self._client._session.headers.get("Authorization")
+        self._client._session.headers["Authorization"] = f"Bearer {token}"
+
+        key = _token_key(self._client.base_url, token)
+        if key in _VALIDATED_TOKENS:
+            return
+        ttl = decoded["exp"] - time.time()
+
+        # Is this a valid user or admin token? Without role claims there is no way to
+        # tell which route will accept it, so both are asked at once
+        probes = _probe_order(decoded)
+        role = None
+        if _role_claims(decoded):
+            for probe_role, route in probes:
+                if await self._probe(route):
+                    role = probe_role
+                    break
+        else:
+            role = await self._probe_concurrently(probes)
+        if role is not None:
+            _VALIDATED_TOKENS.set(key, role, ttl)
+            return
+
+        if old_authorization is not None:
+            self._client._session.headers["Authorization"] = old_authorization
+        else:
+            self._client._session.headers.pop("Authorization")
+
+        raise ValueError("Invalid token")
+
+    async def _probe(self, route: str) -> bool:
+        """Whether the current token is accepted by `route`."""
+        try:
+            await self.get(route)
+            return True
+        except requests.HTTPError:
+            return False
+
+    async def _probe_concurrently(
+        self, probes: tuple[tuple[str, str], ...]
+    ) -> str | None:
+        """Send all probes at once and return the role of the first that succeeds."""
+
+        async def probe(role: str, route: str) -> str | None:
+            return role if await self._probe(route) else None
+
+        tasks = [asyncio.ensure_future(probe(role, route)) for role, route in probes]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                role = await next_done
+                if role is not None:
+                    return role
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
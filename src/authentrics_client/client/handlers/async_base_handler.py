@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable
+
+from .base_handler import _HandlerCore
+
+if TYPE_CHECKING:
+    from ..async_client import AsyncBaseClient
+
+__all__ = ["AsyncBaseHandler"]
+
+
+class AsyncBaseHandler(_HandlerCore):
+    """Base class for the API handlers of :class:`AsyncAuthentricsClient`.
+
+    The request methods are coroutines; the data transformation helpers are shared
+    with :class:`BaseHandler`, but not its synchronous helpers such as
+    `_get_revalidated` or `_map_concurrently`.
+    """
+
+    def __init__(self, client: AsyncBaseClient) -> None:
+        """Initialize the handler with a client instance.
+
+        Args:
+            client: The AsyncBaseClient instance that provides the session and base URL
+        """
+        self._client = client
+
+    # Convenience methods for common HTTP methods
+    async def get(self, route: str, **kwargs):
+        """Make a GET request."""
+        return await self._client.get(route, **kwargs)
+
+    async def post(self, route: str, **kwargs):
+        """Make a POST request."""
+        return await self._client.post(route, **kwargs)
+
+    async def delete(self, route: str, **kwargs):
+        """Make a DELETE request."""
+        return await self._client.delete(route, **kwargs)
+
+    async def put(self, route: str, **kwargs):
+        """Make a PUT request."""
+        return await self._client.put(route, **kwargs)
+
+    async def patch(self, route: str, **kwargs):
+        """Make a PATCH request."""
+        return await self._client.patch(route, **kwargs)
+
+    @staticmethod
+    async def _gather_limited(
+        fn: Callable[[Any], Awaitable[Any]], items: Iterable[Any], limit: int
+    ) -> list:
+        """Await `fn` on every item with at most `limit` running at once.
+
+        Results are returned in the order of `items`.
+        """
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(item: Any) -> Any:
+            async with semaphore:
+                return await fn(item)
+
+        return list(await asyncio.gather(*(run(item) for item in items)))
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from .async_base_handler import AsyncBaseHandler
+from .base_handler import DOWNLOAD_CHUNK_SIZE
+from .checkpoint_handler import (
+    _checkpoint_paths,
+    _checkpoint_route,
+    _select_checkpoints,
+)
+
+__all__ = ["AsyncCheckpointHandler"]
+
+
+class AsyncCheckpointHandler(AsyncBaseHandler):
+    """An asyncio handler for downloading model checkpoints."""
+
+    async def download_checkpoint(
+        self,
+        project_id: str,
+        checkpoint_id: str,
+        new_checkpoint_path: str | Path,
+        *,
+        overwrite: bool = True,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        **kwargs,
+    ) -> None:
+        """Download a checkpoint.
+
+        See :meth:`CheckpointHandler.download_checkpoint`. The file is written from a
+        worker thread so that other downloads keep running on the event loop.
+        """
+        new_checkpoint_path = Path(new_checkpoint_path)
+        if new_checkpoint_path.exists() and not overwrite:
+            raise FileExistsError(f"File {new_checkpoint_path} already exists")
+
+        new_checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+
+        response = await self.get(
+            _checkpoint_route(checkpoint_id),
+            params={"projectId": project_id, **kwargs},
+            stream=True,
+        )
+        try:
+            self._warn_if_not_octet_stream(response)
+            with open(new_checkpoint_path, "wb") as f:
+                with self._preallocated(response, f):
+                    async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                        await asyncio.to_thread(f.write, chunk)
+                self._release_page_cache(f)
+        finally:
+            await response.aclose()
+
+    async def download_checkpoints(
+        self,
+        project_id: str,
+        target_dir: str | Path,
+        *,
+        checkpoint_ids: list[str] | None = None,
+        max_concurrency: int = 8,
+        overwrite: bool = True,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> dict[str, Path]:
+        """Download checkpoints as separate files, several at a time.
+
+        See :meth:`CheckpointHandler.download_checkpoints`. Up to `max_concurrency`
+        downloads run at once on the event loop.
+
+        Returns:
+            The path of each downloaded checkpoint, by checkpoint ID.
+        """
+        project = self._json(await self.get(f"/project/{project_id}"))
+        checkpoints = _select_checkpoints(project, checkpoint_ids)
+
+        paths = _checkpoint_paths(checkpoints, Path(target_dir))
+
+        async def download(checkpoint_id: str) -> None:
+            await self.download_checkpoint(
+                project_id,
+                checkpoint_id,
+                paths[checkpoint_id],
+                overwrite=overwrite,
+                chunk_size=chunk_size,
+            )
+
+        await self._gather_limited(download, paths, max_concurrency)
+        return paths
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from .async_base_handler import AsyncBaseHandler
+from .membership_handler import _member_payload, _member_update_payload
+
+__all__ = ["AsyncMembershipHandler"]
+
+
+class AsyncMembershipHandler(AsyncBaseHandler):
+    """An asyncio handler for the Authentrics API membership endpoints."""
+
+    async def get_project_members(self, project_id: str) -> list[dict]:
+        """Get all members on a project."""
+        return self._json(await self.get(f"/project/{project_id}/user"))
+
+    async def add_project_member(
+        self,
+        *,
+        project_id: str,
+        email: str,
+        permissions: list[str],
+        **kwargs,
+    ) -> dict:
+        """Add a member to a project."""
+        return self._json(
+            await self.post(
+                f"/project/{project_id}/user",
+                json=_member_payload(email, permissions, **kwargs),
+            )
+        )
+
+    async def delete_project_member(self, project_id: str, user_id: str) -> None:
+        """Delete a member from a project."""
+        await self.delete(f"/project/{project_id}/user/{user_id}")
+
+    async def update_project_member(
+        self,
+        *,
+        project_id: str,
+        user_id: str,
+        permissions: list[str],
+        **kwargs,
+    ) -> dict:
+        """Update a member's details on a project."""
+        data = _member_update_payload(
+            permissions, self._convert_kwargs_to_camel_case(kwargs)
+        )
+
+        return self._json(
+            await self.patch(f"/project/{project_id}/user/{user_id}", json=data)
+        )
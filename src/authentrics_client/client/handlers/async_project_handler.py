@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from .async_base_handler import AsyncBaseHandler
+from .project_handler import _find_project
+
+__all__ = ["AsyncProjectHandler"]
+
+
+class AsyncProjectHandler(AsyncBaseHandler):
+    """An asyncio handler for reading projects."""
+
+    async def get_projects(self) -> list[dict]:
+        """Get all projects."""
+        return self._json(await self.get("/project"))
+
+    async def get_project_by_id(self, project_id: str) -> dict:
+        """Get a project by ID."""
+        return self._json(await self.get(f"/project/{project_id}"))
+
+    async def get_projects_by_id(
+        self, project_ids: list[str], *, max_concurrency: int = 32
+    ) -> list[dict]:
+        """Get several projects by ID concurrently.
+
+        Returns:
+            The projects, in the order of `project_ids`.
+        """
+        return await self._gather_limited(
+            self.get_project_by_id, project_ids, max_concurrency
+        )
+
+    async def get_project_by_name(self, name: str) -> dict | None:
+        """Get a project by name.
+
+        See :meth:`ProjectHandler.get_project_by_name`.
+        """
+        projects = self._json(await self.get("/project", params={"name": name}))
+        return _find_project(projects, name)
+
+    async def get_model_metadata(self, project_id: str) -> dict | None:
+        """Get the metadata for a project's model.
+
+        Returns:
+            The metadata for a project's model, or None if the project has no metadata.
+        """
+        response = await self.get(f"/project/{project_id}/metadata")
+        if len(response.content) == 0:
+            return None
+        return self._json(response)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from .async_base_handler import AsyncBaseHandler
+from .base_handler import DOWNLOAD_CHUNK_SIZE
+from .result_handler import (
+    _artifact_paths,
+    _artifact_route,
+    _stream_params,
+    _warn_if_not_artifact,
+)
+
+__all__ = ["AsyncResultHandler"]
+
+
+class AsyncResultHandler(AsyncBaseHandler):
+    """An asyncio handler for downloading analysis result artifacts."""
+
+    async def downloadAnalysisResultArtifact(
+        self,
+        project_id: str,
+        request_id: str,
+        file_path: str | Path,
+        *,
+        overwrite: bool = True,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> None:
+        """Download the analysis result artifact (streams bytes).
+
+        See :meth:`ResultHandler.downloadAnalysisResultArtifact`. The file is written
+        from a worker thread so that other downloads keep running on the event loop.
+        """
+        file_path = Path(file_path)
+        if file_path.exists() and not overwrite:
+            raise FileExistsError(f"File {file_path} already exists.")
+
+        response = await self.get(
+            _artifact_route(project_id),
+            params=_stream_params(request_id),
+            stream=True,
+        )
+        try:
+            _warn_if_not_artifact(response)
+            with open(file_path, "wb") as f:
+                with self._preallocated(response, f):
+                    async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                        await asyncio.to_thread(f.write, chunk)
+                self._release_page_cache(f)
+        finally:
+            await response.aclose()
+
+    async def downloadAnalysisResultArtifacts(
+        self,
+        project_id: str,
+        request_ids: list[str],
+        target_dir: str | Path,
+        *,
+        overwrite: bool = True,
+        max_concurrency: int = 8,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> dict[str, Path]:
+        """Download the artifacts of several requests into `target_dir`.
+
+        See :meth:`ResultHandler.downloadAnalysisResultArtifacts`. Up to
+        `max_concurrency` downloads run at once on the event loop.
+
+        Returns:
+            The path of each downloaded artifact, by request ID.
+        """
+        paths = _artifact_paths(request_ids, target_dir)
+
+        async def download(request_id: str) -> None:
+            await self.downloadAnalysisResultArtifact(
+                project_id,
+                request_id,
+                paths[request_id],
+                overwrite=overwrite,
+                chunk_size=chunk_size,
+            )
+
+        await self._gather_limited(download, paths, max_concurrency)
+        return paths
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import requests
+
+from ..types import ComparisonType
+from .async_base_handler import AsyncBaseHandler
+from .static_handler import _BATCH_ENDPOINT, _analysis_data
+
+__all__ = ["AsyncStaticHandler"]
+
+
+class AsyncStaticHandler(AsyncBaseHandler):
+    """An asyncio handler for running static analysis on a project."""
+
+    async def static_analysis(
+        self,
+        *,
+        project_id: str,
+        checkpoint_id: str,
+        comparison_type: ComparisonType | str = ComparisonType.CHOSEN,
+        weight_names: list[str] | None = None,
+        bias_names: list[str] | None = None,
+        **kwargs,
+    ) -> dict:
+        """Run static analysis on a checkpoint.
+
+        See :meth:`StaticHandler.static_analysis`.
+        """
+        data = _analysis_data(
+            {"projectId": project_id, "fileId": checkpoint_id},
+            comparison_type,
+            weight_names,
+            bias_names,
+            self._convert_kwargs_to_camel_case(kwargs),
+        )
+        return self._json(await self.post("/static_analysis", json=data))
+
+    async def static_analysis_batch(
+        self,
+        project_id: str,
+        checkpoint_ids: list[str],
+        *,
+        comparison_type: ComparisonType | str = ComparisonType.CHOSEN,
+        weight_names: list[str] | None = None,
+        bias_names: list[str] | None = None,
+        max_concurrency: int = 32,
+        **kwargs,
+    ) -> list[dict]:
+        """Run static analysis on several checkpoints of a project.
+
+        See :meth:`StaticHandler.static_analysis_batch`. If the server does not
+        provide the batch endpoint, up to `max_concurrency` single-checkpoint
+        analyses run at once on the event loop.
+
+        Returns:
+            The static analysis results, in the same order as `checkpoint_ids`.
+        """
+        data = _analysis_data(
+            {"projectId": project_id, "fileIds": checkpoint_ids},
+            comparison_type,
+            weight_names,
+            bias_names,
+            self._convert_kwargs_to_camel_case(kwargs),
+        )
+        if self._has_endpoint(_BATCH_ENDPOINT):
+            try:
+                return self._json(await self.post("/static_analysis/batch", json=data))
+            except requests.HTTPError as e:
+                if not self._is_missing_endpoint(e, _BATCH_ENDPOINT):
+                    raise
+
+        async def analyze(checkpoint_id: str) -> dict:
+            return await self.static_analysis(
+                project_id=project_id,
+                checkpoint_id=checkpoint_id,
+                comparison_type=comparison_type,
+                weight_names=weight_names,
+                bias_names=bias_names,
+                **kwargs,
+            )
+
+        return await self._gather_limited(analyze, checkpoint_ids, max_concurrency)
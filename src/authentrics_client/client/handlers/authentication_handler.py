@@ -1,16 +1,60 @@
 from __future__ import annotations
 
+import hashlib
 import os
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from getpass import getpass
 
 import jwt
 import requests
 
+from ..cache import TTLCache
 from .base_handler import BaseHandler
 
 __all__ = ["AuthenticationHandler"]
 
+_VALIDATED_TOKENS = TTLCache(maxsize=1024)
+"""Tokens the server accepted, so setting them again skips the probe requests. Each
+entry expires with its token."""
+
+
+def _role_claims(decoded: dict) -> list[str]:
+    """The roles named by a token's `roles` or `scope` claim, if any."""
+    roles = decoded.get("roles") or decoded.get("scope") or ()
+    if isinstance(roles, str):
+        roles = roles.split()
+    return [str(role) for role in roles]
+
+
+def _probe_order(decoded: dict) -> tuple[tuple[str, str], ...]:
+    """The (role, route) pairs to validate a token with, most likely first.
+
+    Tokens whose `roles` or `scope` claim mentions an admin role try the admin route
+    first, so they are validated with a single request. Both routes are always tried,
+    as the claims are not verified here.
+    """
+    if any("admin" in role.lower() for role in _role_claims(decoded)):
+        return (("admin", "/api/auth/admin"), ("user", "/api/auth/user"))
+    return (("user", "/api/auth/user"), ("admin", "/api/auth/admin"))
+
+
+def _token_key(base_url: str, token: str) -> bytes:
+    """Cache key for a token, hashed so the cache does not hold the tokens."""
+    return hashlib.blake2b(f"{base_url}\n{token}".encode(), digest_size=16).digest()
+
+
+def _credentials(username: str | None, password: str | None) -> dict[str, str]:
+    """The body of a login request, completing the credentials from `AAI_USERNAME`
+    and `AAI_PASSWORD` or by prompting for them."""
+    username = username or os.getenv("AAI_USERNAME")
+    password = password or os.getenv("AAI_PASSWORD")
+    if username is None:
+        username = input("Username: ")
+    if password is None:
+        password = getpass()
+    return {"username": username, "password": password}
+
 
 class AuthenticationHandler(BaseHandler):
     """A handler for interacting with the Authentrics API authentication endpoints."""
@@ -38,16 +82,8 @@ class AuthenticationHandler(BaseHandler):
             self._validate_and_set_token(token)
             return
 
-        username = username or os.getenv("AAI_USERNAME")
-        password = password or os.getenv("AAI_PASSWORD")
-        if username is None:
-            username = input("Username: ")
-        if password is None:
-            password = getpass()
-
         token = self.post(
-            "/api/auth/login",
-            json={"username": username, "password": password},
+            "/api/auth/login", json=_credentials(username, password)
         ).content.decode()
         self._validate_and_set_token(token)
 
@@ -79,25 +115,29 @@ class AuthenticationHandler(BaseHandler):
         """
 
         decoded = decode_token(token)
-        if decoded["exp"] < datetime.now().timestamp():
-            raise ValueError("Token has expired")
 
         old_authorization = self._client._session.headers.get("Authorization")
         self._client._session.headers["Authorization"] = f"Bearer {token}"
+        if old_authorization not in (None, f"Bearer {token}"):
+            # Reads cached for the previous token may belong to another user
+            self._client.clear_cache()
+            self._client._etag_cache.clear()
 
-        # Is this a valid user token?
-        try:
-            self.get("/api/auth/user")
+        key = _token_key(self._client.base_url, token)
+        if key in _VALIDATED_TOKENS:
             return
-        except requests.HTTPError:
-            pass
+        ttl = decoded["exp"] - time.time()
 
-        # Is this a valid admin token?
-        try:
-            self.get("/api/auth/admin")
+        # Is this a valid user or admin token? Without role claims there is no way to
+        # tell which route will accept it, so both are asked at once
+        probes = _probe_order(decoded)
+        if _role_claims(decoded):
+            role = next((role for role, route in probes if self._probe(route)), None)
+        else:
+            role = self._probe_concurrently(probes)
+        if role is not None:
+            _VALIDATED_TOKENS.set(key, role, ttl)
             return
-        except requests.HTTPError:
-            pass
 
         if old_authorization is not None:
             self._client._session.headers["Authorization"] = old_authorization
@@ -106,6 +146,32 @@ class AuthenticationHandler(BaseHandler):
 
         raise ValueError("Invalid token")
 
+    def _probe(self, route: str) -> bool:
+        """Whether the current token is accepted by `route`."""
+        try:
+            self.get(route)
+            return True
+        except requests.HTTPError:
+            return False
+
+    def _probe_concurrently(self, probes: tuple[tuple[str, str], ...]) -> str | None:
+        """Send all probes at once and return the role of the first that succeeds."""
+
+        def probe(role: str, route: str) -> str | None:
+            return role if self._probe(route) else None
+
+        executor = ThreadPoolExecutor(max_workers=len(probes))
+        try:
+            futures = [executor.submit(probe, role, route) for role, route in probes]
+            for future in as_completed(futures):
+                role = future.result()
+                if role is not None:
+                    return role
+            return None
+        finally:
+            # Do not wait for the other probe once one has succeeded
+            executor.shutdown(wait=False)
+
 
 def decode_token(token: str) -> dict:
     """Decode a JWT token using the HS384 algorithm.
@@ -123,7 +189,9 @@ def decode_token(token: str) -> dict:
         decoded = jwt.decode(
             token,
             algorithms=["HS384"],
-            options={"verify_signature": False},
+            # The signature can only be checked by the server, which the token is
+            # sent to next; the expiry is checked here to fail early
+            options={"verify_signature": False, "verify_exp": True, "require": ["exp"]},
         )
         return decoded
     except jwt.ExpiredSignatureError:
@@ -1,16 +1,239 @@
-import json
-from typing import Any
+from __future__ import annotations
+
+import os
+import shutil
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from typing import Any, BinaryIO, Callable, Collection, Iterable, Iterator
+from urllib.parse import urlencode
+
+import requests
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError, SSLError
 
 from ..base_client import BaseClient
+from ..serialization import json_dumps, json_loads
 
 __all__ = ["BaseHandler"]
 
 
-class BaseHandler:
+def _env_chunk_size(name: str, default: int) -> int:
+    """A positive number of bytes from the environment variable `name`, or `default`
+    if it is unset. An invalid value is warned about and replaced by `default`, so it
+    cannot break importing the package."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        size = int(value)
+    except ValueError:
+        size = 0
+    if size <= 0:
+        warnings.warn(
+            f"Ignoring {name}={value!r}, which is not a positive integer;"
+            f" using {default} bytes.",
+            stacklevel=2,
+        )
+        return default
+    return size
+
+
+DOWNLOAD_CHUNK_SIZE = _env_chunk_size("AAI_DOWNLOAD_CHUNK_SIZE", 1 << 20)
+"""Default number of bytes read and written at a time when downloading files.
+
+Can be set with the `AAI_DOWNLOAD_CHUNK_SIZE` environment variable, to a positive
+number of bytes.
+"""
+
+_OCTET_STREAM = "application/octet-stream"
+_NOT_OCTET_STREAM_WARNING = (
+    "The response is not an octet stream. An error may have occurred."
+)
+
+
+@lru_cache(maxsize=512)
+def _to_camel_case(snake_str: str) -> str:
+    """Convert snake_case string to camelCase.
+
+    Memoized, since the same few keyword names are converted on every request.
+    """
+    components = snake_str.split("_")
+    return components[0] + "".join(x.capitalize() for x in components[1:])
+
+
+def _cache_key(route: str, params: dict | None) -> str:
+    """The key of a read in the client caches: the route and its sorted query."""
+    if not params:
+        return route
+    return f"{route}?{urlencode(sorted(params.items()))}"
+
+
+def _copy_raw(raw: Any, file: BinaryIO, chunk_size: int) -> None:
+    """Copy a `urllib3` response body to `file`, raising the same exceptions as
+    `requests.Response.iter_content` when the transfer fails."""
+    try:
+        shutil.copyfileobj(raw, file, chunk_size)
+    except ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e) from e
+    except DecodeError as e:
+        raise requests.exceptions.ContentDecodingError(e) from e
+    except ReadTimeoutError as e:
+        raise requests.exceptions.ConnectionError(e) from e
+    except SSLError as e:
+        raise requests.exceptions.SSLError(e) from e
+
+
+class _HandlerCore:
+    """The parts of a handler that do not send requests, shared by
+    :class:`BaseHandler` and the asyncio handlers: remembering missing endpoints,
+    writing downloads to disk and transforming request data."""
+
+    _client: Any
+
+    @staticmethod
+    def _json(response: Any) -> Any:
+        """Parse the JSON body of a response from either client transport."""
+        return json_loads(response.content)
+
+    def _has_endpoint(self, endpoint: str) -> bool:
+        """Whether the optional `endpoint`, e.g. "POST /static_analysis/batch", may
+        exist, i.e. the server has not yet answered it with a 404 or 405."""
+        return endpoint not in self._client._missing_endpoints
+
+    def _is_missing_endpoint(
+        self,
+        error: requests.HTTPError,
+        endpoint: str,
+        statuses: Collection[int] = (404, 405),
+    ) -> bool:
+        """Whether an error means the server does not provide `endpoint` at all.
+
+        Used to fall back to per-item requests when a bulk endpoint is unavailable.
+        The endpoint is remembered as missing, so later calls skip it.
+
+        Args:
+            error: The error raised by the request to `endpoint`
+            endpoint: The method and route of the bulk endpoint
+            statuses: The status codes that mean the endpoint is missing. Routes that
+            a server may read as a single item, e.g. "/project/file/batch", add the
+            400 and 422 of a malformed item request
+        """
+        if error.response is None or error.response.status_code not in statuses:
+            return False
+        self._client._missing_endpoints.add(endpoint)
+        return True
+
+    @staticmethod
+    def _warn_if_not_octet_stream(response: Any) -> None:
+        """Warn the caller of a download method if `response` is not a file.
+
+        Parameters such as "; charset=binary" and the case of the media type are
+        ignored.
+        """
+        content_type = response.headers.get("Content-Type", "")
+        if content_type.split(";", 1)[0].strip().lower() != _OCTET_STREAM:
+            warnings.warn(_NOT_OCTET_STREAM_WARNING, stacklevel=3)
+
+    @staticmethod
+    def _preallocate(response: Any, file: BinaryIO) -> bool:
+        """Reserve disk space for the body of `response` in the empty `file`, and
+        return whether it was reserved.
+
+        Allocating the whole file up front keeps multi-gigabyte checkpoints in few
+        extents. Only done when the body is not content-encoded, since the
+        Content-Length is then the size of the file. Best effort: skipped on
+        platforms without `posix_fallocate` and on files that do not support it.
+        Use :meth:`_preallocated` so the file does not keep the reserved size if the
+        download fails.
+        """
+        size = response.headers.get("Content-Length")
+        if (
+            not size
+            or not hasattr(os, "posix_fallocate")
+            or response.headers.get("Content-Encoding", "identity") != "identity"
+            # Allocating extends the file, so appended bytes would land after the gap
+            or "a" in getattr(file, "mode", "")
+        ):
+            return False
+        try:
+            fd = file.fileno()
+            os.posix_fallocate(fd, 0, int(size))
+            os.posix_fadvise(fd, 0, int(size), os.POSIX_FADV_SEQUENTIAL)
+        except (OSError, ValueError):
+            return False
+        return True
+
+    @staticmethod
+    @contextmanager
+    def _preallocated(response: Any, file: BinaryIO) -> Iterator[None]:
+        """Preallocate `file` with :meth:`_preallocate` while the body of `response`
+        is written to it.
+
+        On leaving, the file is truncated to the bytes written, so an interrupted
+        download leaves a short file rather than one padded with zeros to full size.
+        """
+        if not _HandlerCore._preallocate(response, file):
+            yield
+            return
+        try:
+            yield
+        finally:
+            file.truncate()
+
+    @staticmethod
+    def _release_page_cache(file: BinaryIO) -> None:
+        """Tell the kernel that the pages just written to `file` will not be read soon.
+
+        This starts writing them back and evicts those already on disk, so that a
+        multi-gigabyte download does not push hotter data out of the page cache.
+        Best effort, like :meth:`_preallocate`.
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        try:
+            file.flush()
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        except (OSError, ValueError):
+            pass
+
+    # Private helper methods for data transformation
+    _to_camel_case = staticmethod(_to_camel_case)
+
+    @staticmethod
+    def _convert_dict_to_json(value: Any) -> Any:
+        """Convert dict values to JSON strings, leave other types unchanged.
+
+        Args:
+            value: Value that may be a dict
+
+        Returns:
+            JSON string if value is a dict, otherwise the original value
+        """
+        if isinstance(value, dict):
+            return json_dumps(value)
+        return value
+
+    def _convert_kwargs_to_camel_case(self, kwargs: dict) -> dict:
+        """Convert snake_case keys in kwargs to camelCase.
+
+        Args:
+            kwargs: Dictionary with potentially snake_case keys
+
+        Returns:
+            Dictionary with camelCase keys
+        """
+        # Keys that are already camelCase are returned unchanged
+        return {_to_camel_case(key): value for key, value in kwargs.items()}
+
+
+class BaseHandler(_HandlerCore):
     """Base class for all API handlers.
 
     This class provides common functionality for making requests to the API
-    using the session from the parent client.
+    using the session from the parent client. All handlers of a client share that
+    session and its pool of keep-alive connections, so create handlers from one
+    long-lived client rather than a new client per call.
 
     Usage:
         >>> client = BaseClient("https://api.authentrics.ai")
@@ -47,43 +270,97 @@ class BaseHandler:
         """Make a PATCH request."""
         return self._client.patch(route, **kwargs)
 
-    # Private helper methods for data transformation
-    @staticmethod
-    def _to_camel_case(snake_str: str) -> str:
-        """Convert snake_case string to camelCase."""
-        components = snake_str.split('_')
-        return components[0] + ''.join(x.capitalize() for x in components[1:])
+    def _get_json_cached(self, route: str, params: dict | None = None) -> Any:
+        """GET `route` and parse the JSON body, reusing a recent result if the client
+        was created with a `cache_ttl`.
 
-    @staticmethod
-    def _convert_dict_to_json(value: Any) -> Any:
-        """Convert dict values to JSON strings, leave other types unchanged.
+        Cached results are shared between callers and must not be modified.
+        """
+        cache = self._client._cache
+        if cache is None:
+            return json_loads(self._get_revalidated(route, params=params))
+
+        key = _cache_key(route, params)
+        result = cache.get(key)
+        if result is None:
+            # Errors raise here, so only successful responses are cached
+            result = json_loads(self._get_revalidated(route, params=params))
+            cache.set(key, result)
+        return result
+
+    def _get_revalidated(
+        self, route: str, no_cache: bool = False, params: dict | None = None
+    ) -> bytes:
+        """GET `route` and return the body, revalidating a recent body by its ETag.
+
+        If the server sent an ETag for the route, the next read sends it in
+        `If-None-Match` and a 304 reuses the stored body, so nothing is downloaded.
+        The body is returned as bytes so every caller gets its own parsed copy.
 
         Args:
-            value: Value that may be a dict
+            route: The API route to read
+            no_cache: Neither send nor store an ETag for this read
+            params: Query parameters of the read
+        """
+        etag_cache = self._client._etag_cache
+        if no_cache:
+            return self.get(route, params=params).content
 
-        Returns:
-            JSON string if value is a dict, otherwise the original value
+        key = _cache_key(route, params)
+        cached = etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
+        response = self.get(route, params=params, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            etag_cache.set(key, cached)
+            return cached[1]
+
+        etag = response.headers.get("ETag")
+        if etag:
+            etag_cache.set(key, (etag, response.content))
+        else:
+            etag_cache.pop(key)
+        return response.content
+
+    # Private helpers for fanning out requests
+    @staticmethod
+    def _map_concurrently(
+        fn: Callable[[Any], Any], items: Iterable[Any], max_workers: int
+    ) -> list:
+        """Call `fn` on every item using up to `max_workers` threads.
+
+        Results are returned in the order of `items`. The first exception raised by
+        `fn` is re-raised once the pool has finished.
         """
-        if isinstance(value, dict):
-            return json.dumps(value)
-        return value
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fn, items))
 
-    def _convert_kwargs_to_camel_case(self, kwargs: dict) -> dict:
-        """Convert snake_case keys in kwargs to camelCase.
+    @staticmethod
+    def _copy_response(
+        response: Any, file: BinaryIO, chunk_size: int, preallocate: bool = True
+    ) -> None:
+        """Write a streamed response body from either client transport to `file`.
 
-        Args:
-            kwargs: Dictionary with potentially snake_case keys
+        With `preallocate`, the file is preallocated with :meth:`_preallocated`. Pass
+        False for files that are read back to resume a download, whose size must be
+        the number of bytes received even if the process is killed.
 
-        Returns:
-            Dictionary with camelCase keys
+        For `requests`, the raw stream is copied with `shutil.copyfileobj`, which
+        skips the per-chunk generator of `iter_content`. Chunks of a MiB or more are
+        larger than the file's buffer, so they are written with one `write` call each.
+        Errors while reading are raised as the `requests` exceptions `iter_content`
+        would raise.
         """
-        result = {}
-        for key, value in kwargs.items():
-            if '_' in key:
-                # Standard camelCase conversion
-                camel_key = self._to_camel_case(key)
-            else:
-                # Already camelCase or no conversion needed
-                camel_key = key
-            result[camel_key] = value
-        return result
+        preallocated = (
+            _HandlerCore._preallocated(response, file) if preallocate else nullcontext()
+        )
+        try:
+            with preallocated:
+                if isinstance(response, requests.Response):
+                    response.raw.decode_content = True
+                    _copy_raw(response.raw, file, chunk_size)
+                else:
+                    for chunk in response.iter_bytes(chunk_size=chunk_size):
+                        file.write(chunk)
+            _HandlerCore._release_page_cache(file)
+        finally:
+            response.close()
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import os
+import stat
+from os.path import basename
 from pathlib import Path
 
-from ..types import FileType, generate_multipart_json
+from ..types import (
+    FileType,
+    _file_type_value,
+    _generate_upload_stream,
+)
 from .base_handler import BaseHandler
 
 __all__ = ["BaseModelHandler"]
@@ -24,7 +31,7 @@ class BaseModelHandler(BaseHandler):
 
         Args:
             project_id: The ID of the project to upload the base model to.
-            file_path: The path to the base model file.
+            file_path: The path to the base model file or directory.
             model_format: The format of the base model file (must match the project's
             model format).
             base_model_name (Optional): The display name of the base model.
@@ -35,30 +42,32 @@ class BaseModelHandler(BaseHandler):
             The project with the new base model.
 
         Note:
-            If the checkpoint is a directory, e.g., a 🤗 checkpoint, please tar it first.
+            If the base model is a directory, e.g., a 🤗 checkpoint, it is uploaded as
+            an uncompressed tar archive named after the directory, like in
+            `CheckpointHandler.add_checkpoint`. No tar file is written to disk.
         """
         file_path = Path(file_path)
-        if file_path.is_dir():
-            raise ValueError(
-                f"File {file_path} is a directory."
-                " If this is a 🤗 checkpoint, please tar it first."
-            )
-        if not file_path.is_file():
+        try:
+            mode = file_path.stat().st_mode
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File {file_path} not found") from None
+        if not stat.S_ISREG(mode) and not stat.S_ISDIR(mode):
             raise FileNotFoundError(f"File {file_path} not found")
 
         data = {
             "projectId": project_id,
-            "format": FileType(model_format).value,
+            "format": _file_type_value(model_format),
         }
         if base_model_name is not None:
             data["fileName"] = base_model_name
         if tag is not None:
             data["tag"] = tag
 
-        return self.post(
-            "/project/base-model",
-            files=generate_multipart_json(file_path, **data),
-        ).json()
+        # Streamed from disk, so large models are not loaded into memory
+        with _generate_upload_stream(file_path, stat.S_ISDIR(mode), **data) as body:
+            return self._json(
+                self.post("/project/base-model", data=body, headers=body.headers)
+            )
 
     def delete_base_model(self, project_id: str, base_model_id: str) -> dict:
         """Delete a base model.
@@ -69,10 +78,12 @@ class BaseModelHandler(BaseHandler):
         Returns:
             The project without the deleted base model.
         """
-        return self.delete(
-            "/project/base-model",
-            json={"projectId": project_id, "fileId": base_model_id},
-        ).json()
+        return self._json(
+            self.delete(
+                "/project/base-model",
+                json={"projectId": project_id, "fileId": base_model_id},
+            )
+        )
 
     def update_base_model(
         self,
@@ -88,8 +99,9 @@ class BaseModelHandler(BaseHandler):
         Args:
             project_id: The ID of the project to update the base model in.
             base_model_id: The ID of the base model to update.
-            file_path (Optional): The path to the base model file. If None, only the
-            metadata of the base model is updated.
+            file_path (Optional): The path to the base model file or directory, which
+            is uploaded like in `upload_base_model`. If None, only the metadata of the
+            base model is updated.
             base_model_name (Optional): The display name of the base model.
             tag (Optional): The tag of the base model, for identifying the base model
             with the data it was trained on.
@@ -105,15 +117,17 @@ class BaseModelHandler(BaseHandler):
             data["fileName"] = base_model_name
         if tag is not None:
             data["tag"] = tag
-        return self.patch(
-            "/project/base-model",
-            files=generate_multipart_json(file_path, **data),
-        ).json()
+        # Streamed from disk, so large models are not loaded into memory
+        is_dir = file_path is not None and os.path.isdir(file_path)
+        with _generate_upload_stream(file_path, is_dir, **data) as body:
+            return self._json(
+                self.patch("/project/base-model", data=body, headers=body.headers)
+            )
 
     def add_external_base_model(
         self,
         project_id: str,
-        file_path: str,
+        file_path: str | Path,
         model_format: str | FileType,
         *,
         file_name: str | None = None,
@@ -136,18 +150,20 @@ class BaseModelHandler(BaseHandler):
         """
         data = {
             "projectId": project_id,
-            "filePath": file_path,
-            "format": FileType(model_format).value,
-            "fileName": file_name or file_path.rsplit("/", 1)[-1],
+            "filePath": os.fspath(file_path),
+            "format": _file_type_value(model_format),
+            "fileName": file_name or basename(file_path),
             "baseModel": True,
         }
         if tag is not None:
             data["tag"] = tag
 
-        return self.post(
-            "/project/file/external",
-            json=data,
-        ).json()
+        return self._json(
+            self.post(
+                "/project/file/external",
+                json=data,
+            )
+        )
 
     def update_external_base_model(
         self,
@@ -166,16 +182,18 @@ class BaseModelHandler(BaseHandler):
             "baseModel": True,
         }
         if model_format is not None:
-            data["format"] = FileType(model_format).value
+            data["format"] = _file_type_value(model_format)
         if file_path is not None:
-            data["filePath"] = file_path
-            data["fileName"] = file_name or file_path.rsplit("/", 1)[-1]
+            data["filePath"] = os.fspath(file_path)
+            data["fileName"] = file_name or basename(file_path)
         if file_name is not None:
             data["fileName"] = file_name
         if tag is not None:
             data["tag"] = tag
 
-        return self.patch(
-            "/project/file/external",
-            json=data,
-        ).json()
+        return self._json(
+            self.patch(
+                "/project/file/external",
+                json=data,
+            )
+        )
@@ -1,13 +1,54 @@
 from __future__ import annotations
 
-import warnings
+import os
+import stat
+from contextlib import closing
+from os.path import basename
 from pathlib import Path
 
-from ..types import FileType, generate_multipart_json
-from .base_handler import BaseHandler
+import requests
+
+from ..types import (
+    FileType,
+    _file_type_value,
+    _generate_upload_stream,
+    generate_multipart_stream,
+)
+from .base_handler import DOWNLOAD_CHUNK_SIZE, BaseHandler
 
 __all__ = ["CheckpointHandler"]
 
+# The batch routes below may be read as the single-item routes
+# "/project/file/{id}" and "/project/file_event/{id}" by a server without them, which
+# then rejects "batch" as an ID rather than answering with a 404
+_BATCH_MISSING_STATUSES = (400, 404, 405, 422)
+
+
+def _checkpoint_route(checkpoint_id: str) -> str:
+    return f"/project/file/{checkpoint_id}"
+
+
+def _select_checkpoints(project: dict, checkpoint_ids: list[str] | None) -> list[dict]:
+    """The checkpoints of `project` with the given IDs, or all if None."""
+    checkpoints = project["fileList"]
+    if checkpoint_ids is None:
+        return checkpoints
+    wanted = set(checkpoint_ids)
+    return [c for c in checkpoints if c["id"] in wanted]
+
+
+def _checkpoint_paths(checkpoints: list[dict], target_dir: Path) -> dict[str, Path]:
+    """The download path of each checkpoint in `target_dir`, by checkpoint ID.
+
+    Files are named after the checkpoint's display name, prefixed with its ID if
+    several checkpoints share a name.
+    """
+    names = [Path(c.get("fileName") or c["id"]).name for c in checkpoints]
+    return {
+        c["id"]: target_dir / (name if names.count(name) == 1 else f"{c['id']}_{name}")
+        for c, name in zip(checkpoints, names)
+    }
+
 
 class CheckpointHandler(BaseHandler):
     """A handler for interacting with model checkpoints in the Authentrics API."""
@@ -26,7 +67,7 @@ class CheckpointHandler(BaseHandler):
 
         Args:
             project_id: The ID of the project to upload the checkpoint to.
-            file_path: The path to the checkpoint file.
+            file_path: The path to the checkpoint file or directory.
             model_format: The format of the checkpoint file (must match the project's
             model format).
             checkpoint_name (Optional): The display name of the checkpoint.
@@ -37,31 +78,31 @@ class CheckpointHandler(BaseHandler):
             The project with the new checkpoint.
 
         Note:
-            If the checkpoint is a directory, e.g., a 🤗 checkpoint, please tar it first.
+            If the checkpoint is a directory, e.g., a 🤗 checkpoint, it is uploaded as
+            an uncompressed tar archive named after the directory. The archive is built
+            while it is sent, so no tar file is written to disk.
         """
         file_path = Path(file_path)
-        if file_path.is_dir():
-            raise ValueError(
-                f"File {file_path} is a directory."
-                " If this is a 🤗 checkpoint, please tar it first."
-            )
-        if not file_path.is_file():
+        try:
+            mode = file_path.stat().st_mode
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File {file_path} not found") from None
+        if not stat.S_ISREG(mode) and not stat.S_ISDIR(mode):
             raise FileNotFoundError(f"File {file_path} not found")
 
         data = {
             "projectId": project_id,
-            "format": FileType(model_format).value,
+            "format": _file_type_value(model_format),
+            **self._convert_kwargs_to_camel_case(kwargs),
         }
-        data.update(self._convert_kwargs_to_camel_case(kwargs))
         if checkpoint_name is not None:
             data["fileName"] = checkpoint_name
         if tag is not None:
             data["tag"] = tag
 
-        return self.post(
-            "/project/file",
-            files=generate_multipart_json(file_path, **data),
-        ).json()
+        # Streamed from disk, so large checkpoints are not loaded into memory
+        with _generate_upload_stream(file_path, stat.S_ISDIR(mode), **data) as body:
+            return self._json(self.post("/project/file", data=body, headers=body.headers))
 
     def download_checkpoint(
         self,
@@ -70,6 +111,7 @@ class CheckpointHandler(BaseHandler):
         new_checkpoint_path: str | Path,
         *,
         overwrite: bool = True,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
         **kwargs,
     ) -> None:
         """Download a checkpoint.
@@ -80,6 +122,7 @@ class CheckpointHandler(BaseHandler):
             new_checkpoint_path: The path to save the checkpoint to.
             overwrite: Whether to overwrite the checkpoint if it already exists.
             If False, an error will be raised if the checkpoint already exists.
+            chunk_size: The number of bytes to read and write at a time.
         """
 
         new_checkpoint_path = Path(new_checkpoint_path)
@@ -88,20 +131,15 @@ class CheckpointHandler(BaseHandler):
 
         new_checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(new_checkpoint_path, "wb") as f:
-            response = self.get(
-                f"/project/file/{checkpoint_id}",
-                params={"projectId": project_id, **kwargs},
-                stream=True,
-            )
-            if response.headers.get("Content-Type") != "application/octet-stream":
-                warnings.warn(
-                    "The response is not an octet stream. An error may have occurred.",
-                    stacklevel=1,
-                )
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+        # Request first, so an HTTP error does not truncate an existing file
+        response = self.get(
+            _checkpoint_route(checkpoint_id),
+            params={"projectId": project_id, **kwargs},
+            stream=True,
+        )
+        self._warn_if_not_octet_stream(response)
+        with closing(response), open(new_checkpoint_path, "wb") as f:
+            self._copy_response(response, f, chunk_size)
 
     def download_all_checkpoints(
         self,
@@ -109,6 +147,7 @@ class CheckpointHandler(BaseHandler):
         zip_file_path: str | Path,
         *,
         overwrite: bool = True,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
         **kwargs,
     ) -> None:
         """Download all checkpoints into a zip file.
@@ -118,6 +157,7 @@ class CheckpointHandler(BaseHandler):
             zip_file_path: The path to save the zip file to.
             overwrite: Whether to overwrite the checkpoint if it already exists.
             If False, an error will be raised if the checkpoint already exists.
+            chunk_size: The number of bytes to read and write at a time.
         """
 
         zip_file_path = Path(zip_file_path)
@@ -126,20 +166,63 @@ class CheckpointHandler(BaseHandler):
 
         zip_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(zip_file_path, "wb") as f:
-            response = self.get(
-                "/project/file",
-                params={"projectId": project_id, **kwargs},
-                stream=True,
+        # Request first, so an HTTP error does not truncate an existing file
+        response = self.get(
+            "/project/file",
+            params={"projectId": project_id, **kwargs},
+            stream=True,
+        )
+        self._warn_if_not_octet_stream(response)
+        with closing(response), open(zip_file_path, "wb") as f:
+            self._copy_response(response, f, chunk_size)
+
+    def download_checkpoints(
+        self,
+        project_id: str,
+        target_dir: str | Path,
+        *,
+        checkpoint_ids: list[str] | None = None,
+        max_workers: int = 8,
+        overwrite: bool = True,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> dict[str, Path]:
+        """Download checkpoints as separate files, several at a time.
+
+        Unlike `download_all_checkpoints`, which streams a single zip file, each
+        checkpoint is downloaded over its own connection, which is faster when a single
+        connection cannot saturate the link.
+
+        Args:
+            project_id: The ID of the project to get the checkpoints from.
+            target_dir: The directory to save the checkpoints to. Each file is named
+            after the checkpoint's display name, prefixed with its ID if several
+            checkpoints share a name.
+            checkpoint_ids (Optional): The IDs of the checkpoints to download. By
+            default, all checkpoints of the project are downloaded.
+            max_workers: The number of checkpoints to download at the same time.
+            overwrite: Whether to overwrite checkpoints that already exist.
+            If False, an error will be raised if a checkpoint already exists.
+            chunk_size: The number of bytes to read and write at a time.
+
+        Returns:
+            The path of each downloaded checkpoint, by checkpoint ID.
+        """
+        project = self._json(self.get(f"/project/{project_id}"))
+        checkpoints = _select_checkpoints(project, checkpoint_ids)
+
+        paths = _checkpoint_paths(checkpoints, Path(target_dir))
+
+        def download(checkpoint_id: str) -> None:
+            self.download_checkpoint(
+                project_id,
+                checkpoint_id,
+                paths[checkpoint_id],
+                overwrite=overwrite,
+                chunk_size=chunk_size,
             )
-            if response.headers.get("Content-Type") != "application/octet-stream":
-                warnings.warn(
-                    "The response is not an octet stream. An error may have occurred.",
-                    stacklevel=1,
-                )
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+
+        self._map_concurrently(download, paths, max_workers)
+        return paths
 
     def delete_checkpoint(
         self,
@@ -158,10 +241,62 @@ class CheckpointHandler(BaseHandler):
         """
         data = {"projectId": project_id, "fileId": checkpoint_id}
         if hard_delete is not None:
-            data["hardDelete"] = bool(hard_delete)
+            data["hardDelete"] = hard_delete
 
         self.delete("/project/file", json=data)
 
+    def delete_checkpoints(
+        self,
+        project_id: str,
+        checkpoint_ids: list[str],
+        *,
+        hard_delete: bool | None = None,
+        max_workers: int = 8,
+    ) -> None:
+        """Delete several checkpoints of a project in one request.
+
+        Args:
+            project_id: The ID of the project to delete the checkpoints from.
+            checkpoint_ids: The IDs of the checkpoints to delete.
+            hard_delete (Optional): Whether to hard delete the checkpoints. If not
+            provided, the checkpoints will be soft deleted.
+            max_workers: If the server does not provide the batch endpoint, the number
+            of checkpoints to delete concurrently instead.
+
+        Raises:
+            ValueError: If some of the checkpoints are not in the project. Nothing is
+            deleted then.
+        """
+        # The batch endpoint skips IDs that are not in the project, so check first
+        project = self._json(self.get(f"/project/{project_id}"))
+        known = {checkpoint["id"] for checkpoint in project["fileList"]}
+        unknown = [i for i in checkpoint_ids if i not in known]
+        if unknown:
+            raise ValueError(
+                f"Checkpoints not in project {project_id}: {', '.join(unknown)}"
+            )
+
+        data = {"projectId": project_id, "fileIds": checkpoint_ids}
+        if hard_delete is not None:
+            data["hardDelete"] = hard_delete
+
+        endpoint = "DELETE /project/file/batch"
+        if self._has_endpoint(endpoint):
+            try:
+                self.delete("/project/file/batch", json=data)
+                return
+            except requests.HTTPError as e:
+                if not self._is_missing_endpoint(e, endpoint, _BATCH_MISSING_STATUSES):
+                    raise
+
+        self._map_concurrently(
+            lambda checkpoint_id: self.delete_checkpoint(
+                project_id, checkpoint_id, hard_delete=hard_delete
+            ),
+            checkpoint_ids,
+            max_workers,
+        )
+
     def update_checkpoint(
         self,
         project_id: str,
@@ -190,32 +325,39 @@ class CheckpointHandler(BaseHandler):
             The project with the updated checkpoint.
         """
         if file_path is not None:
-            if model_format is None:
-                raise ValueError("model_format is required if file_path is provided")
-            if checkpoint_name is None:
-                raise ValueError("checkpoint_name is required if file_path is provided")
+            missing = [
+                name
+                for name, value in (
+                    ("model_format", model_format),
+                    ("checkpoint_name", checkpoint_name),
+                )
+                if value is None
+            ]
+            if missing:
+                raise ValueError(
+                    f"{' and '.join(missing)} {'is' if len(missing) == 1 else 'are'}"
+                    " required if file_path is provided"
+                )
 
-        data = {
-            "projectId": project_id,
-            "fileId": checkpoint_id,
-        }
+        data = {"projectId": project_id, "fileId": checkpoint_id}
         if checkpoint_name is not None:
             data["fileName"] = checkpoint_name
         if tag is not None:
             data["tag"] = tag
         if model_format is not None:
-            data["format"] = FileType(model_format).value
+            data["format"] = _file_type_value(model_format)
         data.update(self._convert_kwargs_to_camel_case(kwargs))
 
-        return self.patch(
-            "/project/file",
-            files=generate_multipart_json(file_path, **data),
-        ).json()
+        # Streamed from disk, so large checkpoints are not loaded into memory
+        with generate_multipart_stream(file_path, **data) as body:
+            return self._json(
+                self.patch("/project/file", data=body, headers=body.headers)
+            )
 
     def add_external_checkpoint(
         self,
         project_id: str,
-        file_path: str,
+        file_path: str | Path,
         model_format: str | FileType,
         *,
         file_name: str | None = None,
@@ -239,18 +381,20 @@ class CheckpointHandler(BaseHandler):
         """
         data = {
             "projectId": project_id,
-            "filePath": file_path,
-            "format": FileType(model_format).value,
-            "fileName": file_name or file_path.rsplit("/", 1)[-1],
+            "filePath": os.fspath(file_path),
+            "format": _file_type_value(model_format),
+            "fileName": file_name or basename(file_path),
+            **self._convert_kwargs_to_camel_case(kwargs),
         }
-        data.update(self._convert_kwargs_to_camel_case(kwargs))
         if tag is not None:
             data["tag"] = tag
 
-        return self.post(
-            "/project/file/external",
-            json=data,
-        ).json()
+        return self._json(
+            self.post(
+                "/project/file/external",
+                json=data,
+            )
+        )
 
     def update_external_checkpoint(
         self,
@@ -264,25 +408,24 @@ class CheckpointHandler(BaseHandler):
         **kwargs,
     ) -> dict:
         """Update an external checkpoint."""
-        data = {
-            "projectId": project_id,
-            "fileId": checkpoint_id,
-        }
+        data = {"projectId": project_id, "fileId": checkpoint_id}
         if model_format is not None:
-            data["format"] = FileType(model_format).value
+            data["format"] = _file_type_value(model_format)
         if file_path is not None:
-            data["filePath"] = file_path
-            data["fileName"] = file_name or file_path.rsplit("/", 1)[-1]
+            data["filePath"] = os.fspath(file_path)
+            data["fileName"] = file_name or basename(file_path)
         if file_name is not None:
             data["fileName"] = file_name
         if tag is not None:
             data["tag"] = tag
         data.update(self._convert_kwargs_to_camel_case(kwargs))
 
-        return self.patch(
-            "/project/file/external",
-            json=data,
-        ).json()
+        return self._json(
+            self.patch(
+                "/project/file/external",
+                json=data,
+            )
+        )
 
     def trigger_file_event(self, project_id: str, checkpoint_id: str, **kwargs) -> None:
         """Trigger the calculation of the summary scores and validation of a checkpoint.
@@ -291,6 +434,47 @@ class CheckpointHandler(BaseHandler):
             project_id: The ID of the project to trigger the file event for.
             checkpoint_id: The ID of the checkpoint to trigger the file event for.
         """
-        data = {"projectId": project_id, "fileId": checkpoint_id}
-        data.update(self._convert_kwargs_to_camel_case(kwargs))
+        data = {
+            "projectId": project_id,
+            "fileId": checkpoint_id,
+            **self._convert_kwargs_to_camel_case(kwargs),
+        }
         self.post("/project/file_event", json=data)
+
+    def trigger_file_events(
+        self,
+        project_id: str,
+        checkpoint_ids: list[str],
+        *,
+        max_workers: int = 8,
+        **kwargs,
+    ) -> None:
+        """Trigger the file event of several checkpoints in one request.
+
+        Args:
+            project_id: The ID of the project the checkpoints belong to.
+            checkpoint_ids: The IDs of the checkpoints to trigger the file event for.
+            max_workers: If the server does not provide the batch endpoint, the number
+            of file events to trigger concurrently instead.
+        """
+        data = {
+            "projectId": project_id,
+            "fileIds": checkpoint_ids,
+            **self._convert_kwargs_to_camel_case(kwargs),
+        }
+        endpoint = "POST /project/file_event/batch"
+        if self._has_endpoint(endpoint):
+            try:
+                self.post("/project/file_event/batch", json=data)
+                return
+            except requests.HTTPError as e:
+                if not self._is_missing_endpoint(e, endpoint, _BATCH_MISSING_STATUSES):
+                    raise
+
+        self._map_concurrently(
+            lambda checkpoint_id: self.trigger_file_event(
+                project_id, checkpoint_id, **kwargs
+            ),
+            checkpoint_ids,
+            max_workers,
+        )
@@ -1,13 +1,46 @@
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
-from typing import Any
-
-from ..types import ComparisonType, MOEAnalysisType, generate_multipart_json
-from .base_handler import BaseHandler
+from typing import TYPE_CHECKING, Any, Iterable
+
+from ..cache import TTLCache
+from ..serialization import json_dumps
+from ..types import (
+    ComparisonType,
+    MOEAnalysisType,
+    _comparison_type_value,
+    _moe_analysis_type_value,
+    generate_multipart_stream,
+)
+from .base_handler import DOWNLOAD_CHUNK_SIZE, BaseHandler
+
+if TYPE_CHECKING:
+    from ..base_client import BaseClient
 
 __all__ = ["DynamicHandler"]
 
+_RESULT_CACHE_TTL = 60 * 60
+"""Number of seconds the result of an analysis called with `cache=True` is kept."""
+
+
+def _file_digest(path: str | Path) -> bytes:
+    """A hash of the contents of the file at `path`."""
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def _unique_layer_names(layer_names: Iterable[str]) -> list[str]:
+    """The layer names without repeats, in the order they were first given.
+
+    Layer lists built programmatically often repeat names, which only makes the
+    request and the analysis larger.
+    """
+    return list(dict.fromkeys(layer_names))
+
 
 class DynamicHandler(BaseHandler):
     """A handler for interacting with dynamic analysis in the Authentrics API.
@@ -15,6 +48,16 @@ class DynamicHandler(BaseHandler):
     Dynamic analysis is any analysis that is performed during a model inference.
     """
 
+    def __init__(self, client: BaseClient) -> None:
+        super().__init__(client)
+        self._results = TTLCache(maxsize=256, ttl=_RESULT_CACHE_TTL)
+        """Results of single-stimulus analyses called with `cache=True`."""
+
+    def clear_cache(self) -> None:
+        """Forget the results kept for single-stimulus analyses called with
+        `cache=True`."""
+        self._results.clear()
+
     def comparative_analysis(
         self,
         project_id: str,
@@ -23,6 +66,7 @@ class DynamicHandler(BaseHandler):
         *,
         layer_names: list[str] | None = None,
         inference_config: dict | str | None = None,
+        cache: bool = False,
         **kwargs,
     ) -> dict:
         """Run a comparative analysis for a single stimulus file.
@@ -36,6 +80,10 @@ class DynamicHandler(BaseHandler):
             inference_config: Optional inference configuration to use for the analysis.
             If a string is provided, it is assumed to be a JSON string and will be parsed
             as a dictionary.
+            cache: Whether to reuse the result of an earlier call with the same stimulus
+            content and arguments, made with the same login in the last hour, instead
+            of uploading the stimulus again. Cached results are shared between calls,
+            so do not modify them.
 
         Returns:
             dict: The analysis results.
@@ -43,10 +91,6 @@ class DynamicHandler(BaseHandler):
         Raises:
             FileNotFoundError: If the stimulus file does not exist.
         """
-        stimulus_path = Path(stimulus_path)
-        if not stimulus_path.exists():
-            raise FileNotFoundError(f"Stimulus file {stimulus_path} not found")
-
         data: dict[str, Any] = {
             "projectId": project_id,
             "fileId": checkpoint_id,
@@ -54,19 +98,18 @@ class DynamicHandler(BaseHandler):
         if inference_config is not None:
             data["inferenceConfigJson"] = self._convert_dict_to_json(inference_config)
         if layer_names is not None:
-            data["layerNames"] = layer_names
+            data["layerNames"] = _unique_layer_names(layer_names)
         data.update(self._convert_kwargs_to_camel_case(kwargs))
 
-        return self.post(
-            "/dynamic_analysis/comparative",
-            files=generate_multipart_json(stimulus_path, **data),
-        ).json()
+        return self._post_stimulus(
+            "/dynamic_analysis/comparative", stimulus_path, data, cache
+        )
 
     def batch_comparative_analysis(
         self,
         project_id: str,
         checkpoint_id: str,
-        stimulus_paths: list[str],
+        stimulus_paths: Iterable[str],
         *,
         layer_names: list[str] | None = None,
         inference_config: dict | str | None = None,
@@ -80,7 +123,7 @@ class DynamicHandler(BaseHandler):
             checkpoint_id: The ID of the checkpoint to use for analysis.
             layer_names: Optional list of layer names to analyze. Default is to use all
             layers.
-            stimulus_paths: List of paths to external stimulus files to analyze, stored
+            stimulus_paths: Paths to external stimulus files to analyze, stored
             in the same bucket as the checkpoint.
             inference_config: Optional inference configuration to use for the analysis.
             If a string is provided, it is assumed to be a JSON string and will be parsed
@@ -93,16 +136,16 @@ class DynamicHandler(BaseHandler):
         data = {
             "projectId": project_id,
             "fileId": checkpoint_id,
-            "stimulusPaths": stimulus_paths,
+            "stimulusPaths": list(stimulus_paths),
             "batchSize": batch_size,
         }
         if inference_config is not None:
             data["inferenceConfigJson"] = self._convert_dict_to_json(inference_config)
         if layer_names is not None:
-            data["layerNames"] = layer_names
+            data["layerNames"] = _unique_layer_names(layer_names)
         data.update(self._convert_kwargs_to_camel_case(kwargs))
 
-        return self.post("/dynamic_analysis/comparative/batch", json=data).json()
+        return self._json(self.post("/dynamic_analysis/comparative/batch", json=data))
 
     def contribution_analysis(
         self,
@@ -113,6 +156,7 @@ class DynamicHandler(BaseHandler):
         comparison_type: ComparisonType | str = ComparisonType.CHOSEN,
         layer_names: list[str] | None = None,
         inference_config: dict | str | None = None,
+        cache: bool = False,
         **kwargs,
     ) -> dict:
         """Run a contribution analysis for a single stimulus file.
@@ -127,32 +171,31 @@ class DynamicHandler(BaseHandler):
             inference_config: Optional inference configuration to use for the analysis.
             If a string is provided, it is assumed to be a JSON string and will be parsed
             as a dictionary.
+            cache: Whether to reuse the result of an earlier call with the same stimulus
+            content and arguments, made with the same login in the last hour, instead
+            of uploading the stimulus again. Cached results are shared between calls,
+            so do not modify them.
         """
-        stimulus_path = Path(stimulus_path)
-        if not stimulus_path.exists():
-            raise FileNotFoundError(f"Stimulus file {stimulus_path} not found")
-
         data = {
             "projectId": project_id,
             "fileId": checkpoint_id,
-            "comparisonType": ComparisonType(comparison_type).value,
+            "comparisonType": _comparison_type_value(comparison_type),
         }
         if layer_names is not None:
-            data["layerNames"] = layer_names
+            data["layerNames"] = _unique_layer_names(layer_names)
         if inference_config is not None:
             data["inferenceConfigJson"] = self._convert_dict_to_json(inference_config)
         data.update(self._convert_kwargs_to_camel_case(kwargs))
 
-        return self.post(
-            "/dynamic_analysis/contribution",
-            files=generate_multipart_json(stimulus_path, **data),
-        ).json()
+        return self._post_stimulus(
+            "/dynamic_analysis/contribution", stimulus_path, data, cache
+        )
 
     def batch_contribution_analysis(
         self,
         project_id: str,
         checkpoint_id: str,
-        stimulus_paths: list[str],
+        stimulus_paths: Iterable[str],
         *,
         comparison_type: ComparisonType | str = ComparisonType.CHOSEN,
         layer_names: list[str] | None = None,
@@ -166,7 +209,7 @@ class DynamicHandler(BaseHandler):
         Args:
             project_id: The ID of the project to analyze.
             checkpoint_id: The ID of the checkpoint to use for analysis.
-            stimulus_paths: List of paths to external stimulus files to analyze, stored
+            stimulus_paths: Paths to external stimulus files to analyze, stored
             in the same bucket as the checkpoint.
             comparison_type: The type of comparison to perform.
             layer_names: Optional list of layer names to analyze. Default is to use all
@@ -183,27 +226,29 @@ class DynamicHandler(BaseHandler):
         data = {
             "projectId": project_id,
             "fileId": checkpoint_id,
-            "stimulusPaths": stimulus_paths,
+            "stimulusPaths": list(stimulus_paths),
             "batchSize": batch_size,
-            "comparisonType": ComparisonType(comparison_type).value,
+            "comparisonType": _comparison_type_value(comparison_type),
             "unchangedActivationThreshold": str(unchanged_activation_threshold),
         }
         if layer_names is not None:
-            data["layerNames"] = layer_names
+            data["layerNames"] = _unique_layer_names(layer_names)
         if inference_config is not None:
             data["inferenceConfigJson"] = self._convert_dict_to_json(inference_config)
         data.update(self._convert_kwargs_to_camel_case(kwargs))
 
-        return self.post(
-            "/dynamic_analysis/contribution/batch",
-            json=data,
-        ).json()
+        return self._json(
+            self.post(
+                "/dynamic_analysis/contribution/batch",
+                json=data,
+            )
+        )
 
     def batch_correlation_analysis(
         self,
         project_id: str,
         checkpoint_id: str,
-        stimulus_paths: list[str],
+        stimulus_paths: Iterable[str],
         *,
         layer_names: list[str] | None = None,
         batch_size: int = 1,
@@ -215,7 +260,7 @@ class DynamicHandler(BaseHandler):
         Args:
             project_id: The ID of the project to analyze.
             checkpoint_id: The ID of the checkpoint to use for analysis.
-            stimulus_paths: List of paths to external stimulus files to analyze, stored
+            stimulus_paths: Paths to external stimulus files to analyze, stored
             in the same bucket as the checkpoint.
             layer_names: Optional list of layer names to analyze. Default is to use all
             layers.
@@ -227,16 +272,16 @@ class DynamicHandler(BaseHandler):
         data = {
             "projectId": project_id,
             "fileId": checkpoint_id,
-            "stimulusPaths": stimulus_paths,
+            "stimulusPaths": list(stimulus_paths),
             "batchSize": batch_size,
         }
         if layer_names is not None:
-            data["layerNames"] = layer_names
+            data["layerNames"] = _unique_layer_names(layer_names)
         if inference_config is not None:
             data["inferenceConfigJson"] = self._convert_dict_to_json(inference_config)
         data.update(self._convert_kwargs_to_camel_case(kwargs))
 
-        return self.post("/dynamic_analysis/correlation/batch", json=data).json()
+        return self._json(self.post("/dynamic_analysis/correlation/batch", json=data))
 
     def direct_inference(
         self,
@@ -246,6 +291,7 @@ class DynamicHandler(BaseHandler):
         *,
         base_model_path: str | None = None,
         inference_config: dict | str | None = None,
+        cache: bool = False,
         **kwargs,
     ) -> dict:
         """Run a direct inference for a single stimulus file.
@@ -260,6 +306,10 @@ class DynamicHandler(BaseHandler):
             inference_config: Optional inference configuration to use for inference.
             If a string is provided, it is assumed to be a JSON string and will be parsed
             as a dictionary.
+            cache: Whether to reuse the result of an earlier call with the same stimulus
+            content and arguments, made with the same login in the last hour, instead
+            of uploading the stimulus again. Cached results are shared between calls,
+            so do not modify them.
 
         Returns:
             dict: The analysis results.
@@ -267,10 +317,6 @@ class DynamicHandler(BaseHandler):
         Raises:
             FileNotFoundError: If the stimulus file does not exist.
         """
-        stimulus_path = Path(stimulus_path)
-        if not stimulus_path.exists():
-            raise FileNotFoundError(f"Stimulus file {stimulus_path} not found")
-
         data: dict[str, Any] = {
             "modelPath": model_path,
             "format": format,
@@ -281,16 +327,15 @@ class DynamicHandler(BaseHandler):
             data["inferenceConfigJson"] = self._convert_dict_to_json(inference_config)
         data.update(self._convert_kwargs_to_camel_case(kwargs))
 
-        return self.post(
-            "/dynamic_analysis/inference",
-            files=generate_multipart_json(stimulus_path, **data),
-        ).json()
+        return self._post_stimulus(
+            "/dynamic_analysis/inference", stimulus_path, data, cache
+        )
 
     def batch_direct_inference(
         self,
         model_path: str,
         format: str,
-        stimulus_paths: list[str],
+        stimulus_paths: Iterable[str],
         *,
         base_model_path: str | None = None,
         inference_config: dict | str | None = None,
@@ -303,7 +348,7 @@ class DynamicHandler(BaseHandler):
             model_path: Path to the storage location of the model file to use for
             inference.
             format: The format of the model file (must match the project's model format).
-            stimulus_paths: List of paths to external stimulus files to analyze, stored
+            stimulus_paths: Paths to external stimulus files to analyze, stored
             in the same bucket as the model.
             base_model_path: Path to the storage location of the base model file to use
             for inference.
@@ -314,7 +359,7 @@ class DynamicHandler(BaseHandler):
         data = {
             "modelPath": model_path,
             "format": format,
-            "stimulusPaths": stimulus_paths,
+            "stimulusPaths": list(stimulus_paths),
             "batchSize": batch_size,
         }
         if base_model_path is not None:
@@ -323,7 +368,7 @@ class DynamicHandler(BaseHandler):
             data["inferenceConfigJson"] = self._convert_dict_to_json(inference_config)
         data.update(self._convert_kwargs_to_camel_case(kwargs))
 
-        return self.post("/dynamic_analysis/inference/batch", json=data).json()
+        return self._json(self.post("/dynamic_analysis/inference/batch", json=data))
 
     def sensitivity_analysis(
         self,
@@ -332,6 +377,7 @@ class DynamicHandler(BaseHandler):
         stimulus_path: str | Path,
         scaling_factor: float,
         inference_config: dict | str | None = None,
+        cache: bool = False,
         **kwargs,
     ) -> dict:
         """Run a sensitivity analysis for a single stimulus file.
@@ -344,16 +390,16 @@ class DynamicHandler(BaseHandler):
             inference_config: Optional inference configuration to use for the analysis.
             If a string is provided, it is assumed to be a JSON string and will be parsed
             as a dictionary.
+            cache: Whether to reuse the result of an earlier call with the same stimulus
+            content and arguments, made with the same login in the last hour, instead
+            of uploading the stimulus again. Cached results are shared between calls,
+            so do not modify them.
 
         Note: For the scaling factor, 0.0 means the influence of the checkpoint is not
         changed, 1.0 means the influence of the checkpoint is fully applied, and -1.0
         means the influence of the checkpoint is fully removed (as in
         `StaticHandler.exclude()`).
         """
-        stimulus_path = Path(stimulus_path)
-        if not stimulus_path.exists():
-            raise FileNotFoundError(f"Stimulus file {stimulus_path} not found")
-
         data = {
             "projectId": project_id,
             "fileId": checkpoint_id,
@@ -363,16 +409,15 @@ class DynamicHandler(BaseHandler):
             data["inferenceConfigJson"] = self._convert_dict_to_json(inference_config)
         data.update(self._convert_kwargs_to_camel_case(kwargs))
 
-        return self.post(
-            "/dynamic_analysis/sensitivity",
-            files=generate_multipart_json(stimulus_path, **data),
-        ).json()
+        return self._post_stimulus(
+            "/dynamic_analysis/sensitivity", stimulus_path, data, cache
+        )
 
     def batch_sensitivity_analysis(
         self,
         project_id: str,
         checkpoint_id: str,
-        stimulus_paths: list[str],
+        stimulus_paths: Iterable[str],
         scaling_factor: float,
         *,
         batch_size: int = 1,
@@ -384,7 +429,7 @@ class DynamicHandler(BaseHandler):
         Args:
             project_id: The ID of the project to analyze.
             checkpoint_id: The ID of the checkpoint to use for analysis.
-            stimulus_paths: List of paths to external stimulus files to analyze, stored
+            stimulus_paths: Paths to external stimulus files to analyze, stored
             in the same bucket as the checkpoint.
             scaling_factor: The scaling factor of the change to the checkpoint.
             batch_size: Number of files to process in each batch. Defaults to 1.
@@ -397,7 +442,7 @@ class DynamicHandler(BaseHandler):
         data = {
             "projectId": project_id,
             "fileId": checkpoint_id,
-            "stimulusPaths": stimulus_paths,
+            "stimulusPaths": list(stimulus_paths),
             "batchSize": batch_size,
             "scalingFactor": str(scaling_factor),
         }
@@ -405,10 +450,12 @@ class DynamicHandler(BaseHandler):
             data["inferenceConfigJson"] = self._convert_dict_to_json(inference_config)
         data.update(self._convert_kwargs_to_camel_case(kwargs))
 
-        return self.post(
-            "/dynamic_analysis/sensitivity/batch",
-            json=data,
-        ).json()
+        return self._json(
+            self.post(
+                "/dynamic_analysis/sensitivity/batch",
+                json=data,
+            )
+        )
 
     def mixture_of_experts_analysis(
         self,
@@ -420,6 +467,7 @@ class DynamicHandler(BaseHandler):
         analysis_type: MOEAnalysisType | str = MOEAnalysisType.EXPERT,
         num_experts: int | None = None,
         inference_config: dict | str | None = None,
+        cache: bool = False,
         **kwargs,
     ) -> dict:
         """Run a mixture of experts analysis for a single stimulus file.
@@ -436,16 +484,16 @@ class DynamicHandler(BaseHandler):
             inference_config: Optional inference configuration to use for the analysis.
             If a string is provided, it is assumed to be a JSON string and will be parsed
             as a dictionary.
+            cache: Whether to reuse the result of an earlier call with the same stimulus
+            content and arguments, made with the same login in the last hour, instead
+            of uploading the stimulus again. Cached results are shared between calls,
+            so do not modify them.
         """
-        stimulus_path = Path(stimulus_path)
-        if not stimulus_path.exists():
-            raise FileNotFoundError(f"Stimulus file {stimulus_path} not found")
-
         data = {
             "projectId": project_id,
             "fileId": checkpoint_id,
-            "layerNames": layer_names,
-            "analysisType": MOEAnalysisType(analysis_type).value,
+            "layerNames": _unique_layer_names(layer_names),
+            "analysisType": _moe_analysis_type_value(analysis_type),
         }
         if num_experts is not None:
             data["numExperts"] = num_experts
@@ -453,16 +501,13 @@ class DynamicHandler(BaseHandler):
             data["inferenceConfigJson"] = self._convert_dict_to_json(inference_config)
         data.update(self._convert_kwargs_to_camel_case(kwargs))
 
-        return self.post(
-            "/dynamic_analysis/moe",
-            files=generate_multipart_json(stimulus_path, **data),
-        ).json()
+        return self._post_stimulus("/dynamic_analysis/moe", stimulus_path, data, cache)
 
     def batch_mixture_of_experts_analysis(
         self,
         project_id: str,
         checkpoint_id: str,
-        stimulus_paths: list[str],
+        stimulus_paths: Iterable[str],
         *,
         analysis_type: MOEAnalysisType | str = MOEAnalysisType.EXPERT,
         layer_names: list[str],
@@ -476,7 +521,7 @@ class DynamicHandler(BaseHandler):
         Args:
             project_id: The ID of the project to analyze.
             checkpoint_id: The ID of the checkpoint to use for analysis.
-            stimulus_paths: List of paths to external stimulus files to analyze, stored
+            stimulus_paths: Paths to external stimulus files to analyze, stored
             in the same bucket as the checkpoint.
             layer_names: List of layer names to analyze. Must be either router/gate layers
             or expert layers.
@@ -493,10 +538,10 @@ class DynamicHandler(BaseHandler):
         data = {
             "projectId": project_id,
             "fileId": checkpoint_id,
-            "stimulusPaths": stimulus_paths,
+            "stimulusPaths": list(stimulus_paths),
             "batchSize": batch_size,
-            "analysisType": MOEAnalysisType(analysis_type).value,
-            "layerNames": layer_names,
+            "analysisType": _moe_analysis_type_value(analysis_type),
+            "layerNames": _unique_layer_names(layer_names),
         }
         if num_experts is not None:
             data["numExperts"] = num_experts
@@ -504,17 +549,19 @@ class DynamicHandler(BaseHandler):
             data["inferenceConfigJson"] = self._convert_dict_to_json(inference_config)
         data.update(self._convert_kwargs_to_camel_case(kwargs))
 
-        return self.post(
-            "/dynamic_analysis/moe/batch",
-            json=data,
-        ).json()
+        return self._json(
+            self.post(
+                "/dynamic_analysis/moe/batch",
+                json=data,
+            )
+        )
 
     def zero_train_optimizer(
         self,
         project_id: str,
         scaling_factor_limit: float,
         *,
-        stimulus_paths: list[str],
+        stimulus_paths: Iterable[str],
         expected_output_path: str,
         batch_size: int = 1,
         inference_config: dict | str | None = None,
@@ -526,7 +573,7 @@ class DynamicHandler(BaseHandler):
             project_id: The ID of the project to analyze.
             scaling_factor_limit: The limit on the scaling factor of the change to the
             checkpoint. Must be greater than 0.0.
-            stimulus_paths: List of paths to external stimulus files to analyze, stored
+            stimulus_paths: Paths to external stimulus files to analyze, stored
             in the same bucket as the checkpoint.
             expected_output_path: Path to the expected output file in the same bucket as
             the checkpoint. Currently must be a CSV file of the expected output tensor.
@@ -543,7 +590,7 @@ class DynamicHandler(BaseHandler):
         data = {
             "projectId": project_id,
             "scalingFactorLimit": scaling_factor_limit,
-            "stimulusPaths": stimulus_paths,
+            "stimulusPaths": list(stimulus_paths),
             "expectedOutputPath": expected_output_path,
             "batchSize": batch_size,
         }
@@ -551,7 +598,41 @@ class DynamicHandler(BaseHandler):
             data["inferenceConfigJson"] = self._convert_dict_to_json(inference_config)
         data.update(self._convert_kwargs_to_camel_case(kwargs))
 
-        return self.post(
-            "/dynamic_analysis/zto/batch",
-            json=data,
-        ).json()
+        return self._json(
+            self.post(
+                "/dynamic_analysis/zto/batch",
+                json=data,
+            )
+        )
+
+    def _authorization_digest(self) -> bytes:
+        """A hash of the client's current token, so cached results are not returned
+        to another user logged in on the same client."""
+        authorization = self._client._session.headers.get("Authorization", "")
+        return hashlib.blake2b(authorization.encode(), digest_size=16).digest()
+
+    def _post_stimulus(
+        self, route: str, stimulus_path: str | Path, data: dict, cache: bool
+    ) -> dict:
+        """POST a stimulus file with its form fields, streamed from disk.
+
+        With `cache`, the result is kept under the stimulus' content hash, the
+        fields and the login, and returned for later calls with the same content and
+        fields by the same user.
+        """
+        # Opened first, so a missing file or a directory is reported the same way
+        with generate_multipart_stream(stimulus_path, **data) as body:
+            if not cache:
+                return self._json(self.post(route, data=body, headers=body.headers))
+
+            key = (
+                route,
+                _file_digest(stimulus_path),
+                json_dumps(data),
+                self._authorization_digest(),
+            )
+            result = self._results.get(key)
+            if result is None:
+                result = self._json(self.post(route, data=body, headers=body.headers))
+                self._results.set(key, result)
+            return result
@@ -1,14 +1,43 @@
+from __future__ import annotations
+
+import requests
+
+from ..serialization import json_loads
 from .base_handler import BaseHandler
 
 __all__ = ["MembershipHandler"]
 
+# Not ".../user/batch", which a server without the batch route would read as the
+# member "batch" and answer with a 400 or 403 rather than a 404
+_BATCH_ROUTE = "/project/{}/users:batch"
+
+
+def _member_payload(email: str, permissions: list[str], **kwargs) -> dict:
+    """The request body for adding a member to a project."""
+    return {"emailAddress": email, "permissions": permissions, **kwargs}
+
+
+def _member_update_payload(permissions: list[str], extra: dict) -> dict:
+    """The request body for updating a member of a project.
+
+    Args:
+        extra: Additional camelCase fields, which take precedence.
+    """
+    return {"permissions": permissions, **extra}
+
 
 class MembershipHandler(BaseHandler):
     """A handler for interacting with the Authentrics API membership endpoints."""
 
-    def get_project_members(self, project_id: str) -> list[dict]:
-        """Get all members on a project."""
-        return self.get(f"/project/{project_id}/user").json()
+    def get_project_members(
+        self, project_id: str, *, no_cache: bool = False
+    ) -> list[dict]:
+        """Get all members on a project.
+
+        A repeated call is revalidated with the ETag of the previous response. Pass
+        `no_cache=True` to skip this.
+        """
+        return json_loads(self._get_revalidated(f"/project/{project_id}/user", no_cache))
 
     def add_project_member(
         self,
@@ -19,15 +48,77 @@ class MembershipHandler(BaseHandler):
         **kwargs,
     ) -> dict:
         """Add a member to a project."""
-        return self.post(
-            f"/project/{project_id}/user",
-            json={"emailAddress": email, "permissions": permissions, **kwargs},
-        ).json()
+        return self._json(
+            self.post(
+                f"/project/{project_id}/user",
+                json=_member_payload(email, permissions, **kwargs),
+            )
+        )
+
+    def add_project_members(
+        self, project_id: str, members: list[dict], *, max_workers: int = 8
+    ) -> list[dict]:
+        """Add several members to a project in one request.
+
+        Args:
+            project_id: The ID of the project to add the members to.
+            members: The members to add, each a dict of the keyword arguments of
+            `add_project_member` other than `project_id`.
+            max_workers: If the server does not provide the batch endpoint, the number
+            of members to add concurrently instead.
+
+        Returns:
+            The added members, in the order of `members`.
+        """
+        endpoint = f"POST {_BATCH_ROUTE}"
+        if self._has_endpoint(endpoint):
+            try:
+                return self._json(
+                    self.post(
+                        _BATCH_ROUTE.format(project_id),
+                        json={"members": [_member_payload(**m) for m in members]},
+                    )
+                )
+            except requests.HTTPError as e:
+                if not self._is_missing_endpoint(e, endpoint):
+                    raise
+
+        return self._map_concurrently(
+            lambda member: self.add_project_member(project_id=project_id, **member),
+            members,
+            max_workers,
+        )
 
     def delete_project_member(self, project_id: str, user_id: str) -> None:
         """Delete a member from a project."""
         self.delete(f"/project/{project_id}/user/{user_id}")
 
+    def delete_project_members(
+        self, project_id: str, user_ids: list[str], *, max_workers: int = 8
+    ) -> None:
+        """Delete several members from a project in one request.
+
+        Args:
+            project_id: The ID of the project to delete the members from.
+            user_ids: The IDs of the users to delete.
+            max_workers: If the server does not provide the batch endpoint, the number
+            of members to delete concurrently instead.
+        """
+        endpoint = f"DELETE {_BATCH_ROUTE}"
+        if self._has_endpoint(endpoint):
+            try:
+                self.delete(_BATCH_ROUTE.format(project_id), json={"userIds": user_ids})
+                return
+            except requests.HTTPError as e:
+                if not self._is_missing_endpoint(e, endpoint):
+                    raise
+
+        self._map_concurrently(
+            lambda user_id: self.delete_project_member(project_id, user_id),
+            user_ids,
+            max_workers,
+        )
+
     def update_project_member(
         self,
         *,
@@ -37,10 +128,51 @@ class MembershipHandler(BaseHandler):
         **kwargs,
     ) -> dict:
         """Update a member's details on a project."""
-        data = {"permissions": permissions}
-        data.update(self._convert_kwargs_to_camel_case(kwargs))
+        data = _member_update_payload(
+            permissions, self._convert_kwargs_to_camel_case(kwargs)
+        )
+
+        return self._json(
+            self.patch(
+                f"/project/{project_id}/user/{user_id}",
+                json=data,
+            )
+        )
+
+    def update_project_members(
+        self, project_id: str, members: list[dict], *, max_workers: int = 8
+    ) -> list[dict]:
+        """Update several members of a project in one request.
+
+        Args:
+            project_id: The ID of the project the members belong to.
+            members: The updates, each a dict of the keyword arguments of
+            `update_project_member` other than `project_id`.
+            max_workers: If the server does not provide the batch endpoint, the number
+            of members to update concurrently instead.
+
+        Returns:
+            The updated members, in the order of `members`.
+        """
+        endpoint = f"PATCH {_BATCH_ROUTE}"
+        if self._has_endpoint(endpoint):
+            try:
+                return self._json(
+                    self.patch(
+                        _BATCH_ROUTE.format(project_id),
+                        json={
+                            "members": [
+                                self._convert_kwargs_to_camel_case(m) for m in members
+                            ]
+                        },
+                    )
+                )
+            except requests.HTTPError as e:
+                if not self._is_missing_endpoint(e, endpoint):
+                    raise
 
-        return self.patch(
-            f"/project/{project_id}/user/{user_id}",
-            json=data,
-        ).json()
+        return self._map_concurrently(
+            lambda member: self.update_project_member(project_id=project_id, **member),
+            members,
+            max_workers,
+        )
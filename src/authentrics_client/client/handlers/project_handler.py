@@ -1,62 +1,135 @@
 from __future__ import annotations
 
-from ..types import FileType
+from typing import Any
+
+from ..serialization import json_loads
+from ..types import FileType, _file_type_value
 from .base_handler import BaseHandler
 
 __all__ = ["ProjectHandler"]
 
+_PROJECT_INDEX_KEY = "/project#name"
+"""Client cache key of the projects indexed by name."""
+
+
+def _find_project(projects: list[dict], name: str) -> dict | None:
+    """The first of `projects` named `name`, if any."""
+    return next((project for project in projects if project["name"] == name), None)
+
 
 class ProjectHandler(BaseHandler):
     """A handler for interacting with the Authentrics API project endpoints."""
 
-    def get_projects(self) -> list[dict]:
-        """Get all projects."""
-        return self.get("/project").json()
+    def get_projects(self, *, no_cache: bool = False) -> list[dict]:
+        """Get all projects.
+
+        A repeated call is revalidated with the ETag of the previous response, so an
+        unchanged list is not downloaded again. Pass `no_cache=True` to skip this.
+        """
+        return json_loads(self._get_revalidated("/project", no_cache))
 
     def get_project_by_id(self, project_id: str) -> dict:
-        """Get a project by ID."""
-        return self.get(f"/project/{project_id}").json()
+        """Get a project by ID.
+
+        If the client was created with a `cache_ttl`, a recent result may be returned
+        without contacting the server. It is shared between calls, so do not modify it.
+        """
+        return self._get_json_cached(f"/project/{project_id}")
+
+    def invalidate(self, project_id: str) -> None:
+        """Drop the cached result of `get_project_by_id` for a project, e.g. after it
+        was changed by another client."""
+        if self._client._cache is not None:
+            self._client._cache.pop(f"/project/{project_id}")
 
-    def get_model_metadata(self, project_id: str) -> dict | None:
+    def get_model_metadata(
+        self, project_id: str, *, no_cache: bool = False
+    ) -> dict | None:
         """Get the metadata for a project's model.
 
+        A repeated call is revalidated with the ETag of the previous response. Pass
+        `no_cache=True` to skip this.
+
         Returns:
             The metadata for a project's model, or None if the project has no metadata.
         """
-        response = self.get(f"/project/{project_id}/metadata")
-        if len(response.content) == 0:
+        content = self._get_revalidated(f"/project/{project_id}/metadata", no_cache)
+        if len(content) == 0:
             return None
-        return response.json()
+        return json_loads(content)
 
     def get_project_by_name(self, name: str) -> dict | None:
-        """Get a project by name."""
-        projects = self.get_projects()
-        for project in projects:
-            if project["name"] == name:
+        """Get a project by name.
+
+        The name is sent as a query parameter so the server only returns the matching
+        projects. Servers that ignore the parameter return every project, so the
+        result is still filtered here. If the client was created with a `cache_ttl`,
+        those projects are also indexed by name, so further lookups are answered
+        without a request.
+        """
+        cache = self._client._cache
+        if cache is not None:
+            project = cache.get(_PROJECT_INDEX_KEY, {}).get(name)
+            if project is not None:
                 return project
-        return None
+
+        projects = self._json(self.get("/project", params={"name": name}))
+        if cache is not None and len(projects) > 1:
+            # Reversed, so the first project with a name wins as in the scan below
+            cache.set(
+                _PROJECT_INDEX_KEY,
+                {project["name"]: project for project in projects[::-1]},
+            )
+        return _find_project(projects, name)
 
     def create_project(
         self, name: str, description: str, model_format: str | FileType, **kwargs
     ) -> dict:
         """Create a project."""
-        return self.post(
-            "/project",
-            json={
-                "name": name,
-                "description": description,
-                "format": FileType(model_format).value,
-                **kwargs,
-            },
-        ).json()
-
-    def delete_project(self, *project_ids: str, hard_delete: bool | None = None) -> None:
-        """Delete one or more projects."""
-        data = {"projectIds": list(project_ids)}
+        return self._json(
+            self.post(
+                "/project",
+                json={
+                    "name": name,
+                    "description": description,
+                    "format": _file_type_value(model_format),
+                    **kwargs,
+                },
+            )
+        )
+
+    def delete_project(
+        self,
+        *project_ids: str,
+        hard_delete: bool | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """Delete one or more projects.
+
+        Args:
+            *project_ids: The IDs of the projects to delete.
+            hard_delete (Optional): Whether to hard delete the projects. If not
+            provided, the projects will be soft deleted.
+            max_workers (Optional): If given, each project is deleted in its own
+            request, with up to this many at once, so that one slow deletion does not
+            hold up the others. By default, all projects are deleted in one request.
+        """
+        # The tuple is encoded as a JSON array, so it is not copied into a list
+        data: dict[str, Any] = {"projectIds": project_ids}
         if hard_delete is not None:
-            data["hardDelete"] = bool(hard_delete)
+            data["hardDelete"] = hard_delete
+
+        if max_workers is None or len(project_ids) <= 1:
+            self.delete("/project", json=data)
+            return
 
-        self.delete("/project", json=data)
+        self._map_concurrently(
+            lambda project_id: self.delete(
+                "/project", json={**data, "projectIds": (project_id,)}
+            ),
+            project_ids,
+            max_workers,
+        )
 
     def update_project(
         self,
@@ -74,10 +147,12 @@ class ProjectHandler(BaseHandler):
         if description is not None:
             data["description"] = description
         if model_format is not None:
-            data["format"] = FileType(model_format).value
+            data["format"] = _file_type_value(model_format)
         data.update(self._convert_kwargs_to_camel_case(kwargs))
 
-        return self.patch(
-            "/project",
-            json={"projectId": project_id, **data},
-        ).json()
+        return self._json(
+            self.patch(
+                "/project",
+                json={"projectId": project_id, **data},
+            )
+        )
@@ -3,11 +3,73 @@ from __future__ import annotations
 import warnings
 from pathlib import Path
 
-from .base_handler import BaseHandler
+import requests
+
+from .base_handler import DOWNLOAD_CHUNK_SIZE, BaseHandler
 
 __all__ = ["ResultHandler"]
 
 
+def _artifact_route(project_id: str) -> str:
+    return f"/project/{project_id}/analysis/result/artifact"
+
+
+def _stream_params(request_id: str) -> dict[str, str]:
+    """The query of a STREAM mode artifact download."""
+    return {"requestId": request_id, "mode": "STREAM"}
+
+
+def _artifact_paths(request_ids: list[str], target_dir: str | Path) -> dict[str, Path]:
+    """The file each artifact is downloaded to, by request ID."""
+    target_dir = Path(target_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    return {request_id: target_dir / request_id for request_id in request_ids}
+
+
+def _warn_if_not_artifact(response) -> None:
+    """Warn if a STREAM mode response does not look like an artifact."""
+    # Backend sets "application/octet-stream" for streaming mode
+    content_type = response.headers.get("Content-Type", "")
+    if not content_type.startswith("application"):
+        warnings.warn(
+            f"Unexpected content type '{content_type}'. "
+            f"The response might not be a valid artifact.",
+            stacklevel=1,
+        )
+
+
+def _validator(response) -> str | None:
+    """The value to send in `If-Range` when resuming the download of `response`: a
+    strong ETag, or else the Last-Modified date."""
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+def _content_range(response) -> tuple[int | None, int | None]:
+    """The first byte and the complete length in a `Content-Range` header, either
+    None if missing or unknown."""
+    value = response.headers.get("Content-Range", "")
+    unit, _, spec = value.partition(" ")
+    if unit != "bytes":
+        return None, None
+    range_, _, length = spec.partition("/")
+    start = range_.split("-", 1)[0]
+    return (
+        int(start) if start.isdigit() else None,
+        int(length) if length.isdigit() else None,
+    )
+
+
+def _identity_length(response) -> int | None:
+    """The size of the artifact sent whole in `response`, or None if unknown."""
+    length = response.headers.get("Content-Length")
+    if not length or response.headers.get("Content-Encoding", "identity") != "identity":
+        return None
+    return int(length)
+
+
 class ResultHandler(BaseHandler):
     """A handler for interacting with analysis results in the Authentrics API."""
 
@@ -17,10 +79,12 @@ class ResultHandler(BaseHandler):
     def getAnalysisResults(self, project_id: str) -> list[dict]:
         """
         Get all analysis result metadata for a project.
+
+        A repeated call is revalidated with the ETag of the previous response, and
+        if the client was created with a `cache_ttl`, a recent result may be returned
+        without contacting the server. Do not modify a result that may be cached.
         """
-        response = self.get(f"/project/{project_id}/analysis/result")
-        response.raise_for_status()
-        return response.json()
+        return self._get_json_cached(f"/project/{project_id}/analysis/result")
 
     # ---------------------------------------------------------
     # GET RESULT BY REQUEST ID (metadata)
@@ -30,13 +94,30 @@ class ResultHandler(BaseHandler):
     ) -> list[dict]:
         """
         Get analysis result metadata for a single requestId.
+
+        Cached and revalidated like `getAnalysisResults`.
         """
-        response = self.get(
+        return self._get_json_cached(
             f"/project/{project_id}/analysis/result",
             params={"requestId": request_id},
         )
-        response.raise_for_status()
-        return response.json()
+
+    # ---------------------------------------------------------
+    # GET RESULTS BY REQUEST IDS (metadata)
+    # ---------------------------------------------------------
+    def getAnalysisResultsByRequestIds(
+        self, project_id: str, request_ids: list[str], *, max_workers: int = 16
+    ) -> dict[str, list[dict]]:
+        """
+        Get analysis result metadata for several requestIds, with up to
+        `max_workers` requests at once. Returns the metadata by requestId.
+        """
+        results = self._map_concurrently(
+            lambda request_id: self.getAnalysisResultByRequestId(project_id, request_id),
+            request_ids,
+            max_workers,
+        )
+        return dict(zip(request_ids, results))
 
     # ---------------------------------------------------------
     # GET SIGNED URL (default mode is SIGNED on backend)
@@ -53,7 +134,7 @@ class ResultHandler(BaseHandler):
             params={"requestId": request_id},
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response)
 
     # ---------------------------------------------------------
     # DOWNLOAD ARTIFACT (STREAM mode)
@@ -65,20 +146,72 @@ class ResultHandler(BaseHandler):
         file_path: str | Path,
         *,
         overwrite: bool = True,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        resume: bool = False,
     ) -> None:
         """
-        Download the analysis result artifact (streams bytes).
+        Download the analysis result artifact (streams bytes), `chunk_size` bytes at
+        a time.
+
+        With `resume`, the artifact is written to `<file_path>.part` and only renamed
+        to `file_path` once complete. If an earlier download was interrupted, the
+        rest of the artifact is requested with a `Range` header and appended to the
+        partial file. The header is sent with `If-Range` and the ETag (or
+        Last-Modified date) of the first response, kept in `<file_path>.part.etag`,
+        so an artifact that changed in between is sent whole and replaces the
+        partial file. Servers that ignore the header send the whole artifact again.
+        A download that ends before the length the server announced raises a
+        `requests` exception and keeps the partial file for the next call.
         """
         file_path = Path(file_path)
 
         if file_path.exists() and not overwrite:
             raise FileExistsError(f"File {file_path} already exists.")
 
-        response = self.get(
-            f"/project/{project_id}/analysis/result/artifact",
-            params={"requestId": request_id, "mode": "STREAM"},
-            stream=True,
-        )
+        part_path = file_path.with_name(file_path.name + ".part")
+        validator_path = file_path.with_name(file_path.name + ".part.etag")
+        headers = {}
+        offset = 0
+        if resume:
+            # Ranges count encoded bytes, so ask for the artifact as it is stored
+            headers["Accept-Encoding"] = "identity"
+            if part_path.exists() and validator_path.exists():
+                # The partial file is never preallocated, so its size is the number
+                # of bytes received
+                offset = part_path.stat().st_size
+                headers["Range"] = f"bytes={offset}-"
+                headers["If-Range"] = validator_path.read_text()
+
+        try:
+            response = self.get(
+                _artifact_route(project_id),
+                params=_stream_params(request_id),
+                headers=headers,
+                stream=True,
+            )
+        except requests.HTTPError as e:
+            if (
+                "Range" not in headers
+                or e.response is None
+                or e.response.status_code != 416
+            ):
+                raise
+            e.response.close()
+            if _content_range(e.response)[1] == offset:
+                # The partial file already holds the whole artifact
+                part_path.replace(file_path)
+                validator_path.unlink()
+                return
+            # The partial file does not fit the artifact; start again
+            part_path.unlink()
+            return self.downloadAnalysisResultArtifact(
+                project_id,
+                request_id,
+                file_path,
+                overwrite=overwrite,
+                chunk_size=chunk_size,
+                resume=resume,
+            )
 
         # Fail early if server returned error JSON
         try:
@@ -87,17 +220,82 @@ class ResultHandler(BaseHandler):
             print("Error response:", response.text)
             raise
 
-        # Backend sets "application/octet-stream" for streaming mode
-        content_type = response.headers.get("Content-Type", "")
-        if not content_type.startswith("application"):
-            warnings.warn(
-                f"Unexpected content type '{content_type}'. "
-                f"The response might not be a valid artifact.",
-                stacklevel=1,
+        _warn_if_not_artifact(response)
+
+        if not resume:
+            # Stream to file
+            with open(file_path, "wb") as f:
+                self._copy_response(response, f, chunk_size)
+            return
+
+        append = response.status_code == 206
+        start, length = _content_range(response)
+        if append and start != offset:
+            # Not the rest of the partial file; start again
+            response.close()
+            part_path.unlink()
+            return self.downloadAnalysisResultArtifact(
+                project_id,
+                request_id,
+                file_path,
+                overwrite=overwrite,
+                chunk_size=chunk_size,
+                resume=resume,
             )
+        if not append:
+            validator = _validator(response)
+            if validator is None:
+                validator_path.unlink(missing_ok=True)
+            else:
+                validator_path.write_text(validator)
+            length = _identity_length(response)
 
-        # Stream to file
-        with open(file_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+        with open(part_path, "ab" if append else "wb") as f:
+            self._copy_response(response, f, chunk_size, preallocate=False)
+            received = f.tell()
+        if length is not None and received != length:
+            # Kept, so the next call resumes from what was received
+            raise requests.exceptions.ChunkedEncodingError(
+                f"Received {received} of {length} bytes of the artifact"
+            )
+        part_path.replace(file_path)
+        validator_path.unlink(missing_ok=True)
+
+    # ---------------------------------------------------------
+    # DOWNLOAD SEVERAL ARTIFACTS (STREAM mode)
+    # ---------------------------------------------------------
+    def downloadAnalysisResultArtifacts(
+        self,
+        project_id: str,
+        request_ids: list[str],
+        target_dir: str | Path,
+        *,
+        overwrite: bool = True,
+        max_workers: int = 8,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        resume: bool = False,
+    ) -> dict[str, Path]:
+        """
+        Download the artifacts of several requests into `target_dir`, each named
+        after its request ID, with up to `max_workers` downloads at once.
+
+        `chunk_size` and `resume` are passed to `downloadAnalysisResultArtifact`, so
+        with `resume`, calling this again after an interruption only downloads the
+        rest of the unfinished artifacts.
+
+        Returns the path of each downloaded artifact, by request ID.
+        """
+        paths = _artifact_paths(request_ids, target_dir)
+        self._map_concurrently(
+            lambda request_id: self.downloadAnalysisResultArtifact(
+                project_id,
+                request_id,
+                paths[request_id],
+                overwrite=overwrite,
+                chunk_size=chunk_size,
+                resume=resume,
+            ),
+            paths,
+            max_workers,
+        )
+        return paths
@@ -3,11 +3,40 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from ..types import ComparisonType
-from .base_handler import BaseHandler
+import requests
+
+from ..types import ComparisonType, _comparison_type_value
+from .base_handler import DOWNLOAD_CHUNK_SIZE, BaseHandler
 
 __all__ = ["StaticHandler"]
 
+_BATCH_ENDPOINT = "POST /static_analysis/batch"
+
+
+def _analysis_data(
+    ids: dict[str, Any],
+    comparison_type: ComparisonType | str,
+    weight_names: list[str] | None,
+    bias_names: list[str] | None,
+    extra: dict[str, Any],
+) -> dict[str, Any]:
+    """Build the body of a static analysis request.
+
+    Args:
+        ids: The project and checkpoint ID fields.
+        extra: Additional camelCase fields, which take precedence.
+    """
+    data: dict[str, Any] = {
+        **ids,
+        "comparisonType": _comparison_type_value(comparison_type),
+    }
+    if weight_names is not None:
+        data["weightNames"] = weight_names
+    if bias_names is not None:
+        data["biasNames"] = bias_names
+    data.update(extra)
+    return data
+
 
 class StaticHandler(BaseHandler):
     """A handler for running static analysis on a project.
@@ -43,18 +72,68 @@ class StaticHandler(BaseHandler):
         Returns:
             A dictionary containing the static analysis results.
         """
-        data: dict[str, Any] = {
-            "projectId": project_id,
-            "fileId": checkpoint_id,
-            "comparisonType": ComparisonType(comparison_type).value,
-        }
-        if weight_names is not None:
-            data["weightNames"] = weight_names
-        if bias_names is not None:
-            data["biasNames"] = bias_names
-        data.update(self._convert_kwargs_to_camel_case(kwargs))
+        data = _analysis_data(
+            {"projectId": project_id, "fileId": checkpoint_id},
+            comparison_type,
+            weight_names,
+            bias_names,
+            self._convert_kwargs_to_camel_case(kwargs),
+        )
+        return self._json(self.post("/static_analysis", json=data))
+
+    def static_analysis_batch(
+        self,
+        project_id: str,
+        checkpoint_ids: list[str],
+        *,
+        comparison_type: ComparisonType | str = ComparisonType.CHOSEN,
+        weight_names: list[str] | None = None,
+        bias_names: list[str] | None = None,
+        max_workers: int = 8,
+        **kwargs,
+    ) -> list[dict]:
+        """Run static analysis on several checkpoints of a project in one request.
 
-        return self.post("/static_analysis", json=data).json()
+        Args:
+            project_id: The ID of the project to run static analysis on.
+            checkpoint_ids: The IDs of the checkpoints to run static analysis on.
+            comparison_type: The comparison to perform (default: 'CHOSEN').
+            weight_names: The names of the weights to include in the analysis. By default,
+            all weights are included.
+            bias_names: The names of the biases to include in the analysis. By default,
+            all biases are included.
+            max_workers: If the server does not provide the batch endpoint, the number
+            of single-checkpoint analyses to run concurrently instead.
+
+        Returns:
+            The static analysis results, in the same order as `checkpoint_ids`.
+        """
+        data = _analysis_data(
+            {"projectId": project_id, "fileIds": checkpoint_ids},
+            comparison_type,
+            weight_names,
+            bias_names,
+            self._convert_kwargs_to_camel_case(kwargs),
+        )
+
+        if self._has_endpoint(_BATCH_ENDPOINT):
+            try:
+                return self._json(self.post("/static_analysis/batch", json=data))
+            except requests.HTTPError as e:
+                if not self._is_missing_endpoint(e, _BATCH_ENDPOINT):
+                    raise
+
+        def analyze(checkpoint_id: str) -> dict:
+            return self.static_analysis(
+                project_id=project_id,
+                checkpoint_id=checkpoint_id,
+                comparison_type=comparison_type,
+                weight_names=weight_names,
+                bias_names=bias_names,
+                **kwargs,
+            )
+
+        return self._map_concurrently(analyze, checkpoint_ids, max_workers)
 
     def exclude(
         self,
@@ -63,6 +142,7 @@ class StaticHandler(BaseHandler):
         checkpoints_to_exclude: list[str],
         new_checkpoint_path: str | Path,
         overwrite: bool = False,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
         **kwargs,
     ):
         """Edit the latest checkpoint to exclude the selected checkpoints.
@@ -73,6 +153,7 @@ class StaticHandler(BaseHandler):
             new_checkpoint_path: The path to save the new checkpoint to.
             overwrite: Whether to overwrite the new checkpoint if it already exists.
             If False, an error will be raised if the new checkpoint already exists.
+            chunk_size: The number of bytes to read and write at a time.
         """
         new_checkpoint_path = Path(new_checkpoint_path)
         if new_checkpoint_path.exists() and not overwrite:
@@ -86,15 +167,9 @@ class StaticHandler(BaseHandler):
 
         new_checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
 
+        response = self.post("/edit", json=data, stream=True)
         with open(new_checkpoint_path, "wb") as f:
-            response = self.post(
-                "/edit",
-                json=data,
-                stream=True,
-            )
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+            self._copy_response(response, f, chunk_size)
 
     def metatune(
         self,
@@ -104,6 +179,7 @@ class StaticHandler(BaseHandler):
         scaling_factors: list[float],
         new_checkpoint_path: str | Path,
         overwrite: bool = False,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
         **kwargs,
     ) -> None:
         """Edit the latest checkpoint to vary the influence of the selected checkpoints.
@@ -116,6 +192,7 @@ class StaticHandler(BaseHandler):
             new_checkpoint_path: The path to save the new checkpoint to.
             overwrite: Whether to overwrite the new checkpoint if it already exists.
             If False, an error will be raised if the new checkpoint already exists.
+            chunk_size: The number of bytes to read and write at a time.
 
         Note: For the scaling factors, 0.0 means the influence of the checkpoint is not
         changed, 1.0 means the influence of the checkpoint is fully applied, and -1.0
@@ -140,12 +217,6 @@ class StaticHandler(BaseHandler):
 
         new_checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
 
+        response = self.post("/metatune", json=data, stream=True)
         with open(new_checkpoint_path, "wb") as f:
-            response = self.post(
-                "/metatune",
-                json=data,
-                stream=True,
-            )
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+            self._copy_response(response, f, chunk_size)
@@ -9,8 +9,13 @@ class UserHandler(BaseHandler):
     """A handler for interacting with the Authentrics API user endpoints."""
 
     def get_user(self) -> dict:
-        """Get the current user."""
-        return self.get("/api/auth/user").json()
+        """Get the current user.
+
+        A repeated call is revalidated with the ETag of the previous response. If the
+        client was created with a `cache_ttl`, a recent result may be returned without
+        contacting the server. It is shared between calls, so do not modify it.
+        """
+        return self._get_json_cached("/api/auth/user")
 
     def update_user(
         self,
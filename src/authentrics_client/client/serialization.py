@@ -0,0 +1,60 @@
+"""JSON encoding and decoding, using `orjson` when it is installed.
+
+`orjson` parses large responses (e.g. a project's file list) several times faster
+than the standard library. Install it with the 'speedups' extra.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ["json_dumpb", "json_dumps", "json_loads"]
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse a JSON document."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. about NaN or invalid UTF-8); let the standard
+            # library decide, so both raise or accept the same documents
+            pass
+    return json.loads(data)
+
+
+def json_dumpb(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize `obj` to compact UTF-8 encoded JSON, e.g. for a request body.
+
+    `orjson` produces bytes directly, so this skips decoding to and re-encoding
+    from `str`, which copies large bodies twice. With `indent`, the output is
+    indented by two spaces, e.g. for a file meant to be read by people.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except orjson.JSONEncodeError:
+            pass
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize `obj` to a compact JSON string."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the standard library accepts
+            pass
+    return json.dumps(obj, separators=(",", ":"))
@@ -1,11 +1,27 @@
 from __future__ import annotations
 
-import json
+import io
+import os
+import stat
+import tarfile
+from bisect import bisect_right
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import IO, Any, Iterator, Optional, Union
 
-__all__ = ["FileType", "ComparisonType", "MOEAnalysisType"]
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
+
+from .serialization import json_dumps
+
+__all__ = [
+    "FileType",
+    "ComparisonType",
+    "MOEAnalysisType",
+    "MultipartStream",
+    "TarStream",
+]
 
 
 class MethodType(Enum):
@@ -50,6 +66,18 @@ class MOEAnalysisType(Enum):
     ROUTER = "ROUTER"
 
 
+@lru_cache(maxsize=None)
+def _comparison_type_value(comparison_type: str | ComparisonType) -> str:
+    """The API value of a comparison type, memoized like :func:`_file_type_value`."""
+    return ComparisonType(comparison_type).value
+
+
+@lru_cache(maxsize=None)
+def _moe_analysis_type_value(analysis_type: str | MOEAnalysisType) -> str:
+    """The API value of a MoE analysis type, memoized like :func:`_file_type_value`."""
+    return MOEAnalysisType(analysis_type).value
+
+
 def generate_multipart_json(
     filepath: Path | str | None, **kwargs
 ) -> dict[str, tuple[Optional[str], Any, Optional[str]]]:
@@ -70,6 +98,10 @@ def generate_multipart_json(
         The `file` field is always included as the last field as the triple
         `(<filename>, <file>, <content_type=None>)`. The other fields are added as
         `(None, <value>, <content_type="text/plain">)`.
+
+        The file is opened here and must be closed by the caller once the request is
+        sent, e.g. with `with fields["file"][1]:`. :func:`generate_multipart_stream`
+        closes it along with the stream.
     """
 
     d: dict[str, tuple[Optional[str], Any, Optional[str]]] = {}
@@ -78,9 +110,9 @@ def generate_multipart_json(
         if isinstance(value, (str, bytes, int, float, bool)):
             d[name] = (None, value, "text/plain")
         elif isinstance(value, (list, tuple)):
-            d[name] = (None, ",".join(str(v) for v in value), "text/plain")
+            d[name] = (None, ",".join(map(str, value)), "text/plain")
         elif isinstance(value, dict):
-            d[name] = (None, json.dumps(value), "text/plain")
+            d[name] = (None, json_dumps(value), "text/plain")
         else:
             raise ValueError(f"Unsupported type: {type(value)}")
 
@@ -89,9 +121,14 @@ def generate_multipart_json(
 
     filepath = Path(filepath)
 
-    if filepath.is_dir():
+    # One stat() rather than is_dir() + is_file(), which matters on network storage
+    try:
+        mode = filepath.stat().st_mode
+    except FileNotFoundError:
+        mode = 0
+    if stat.S_ISDIR(mode):
         raise ValueError("Directory uploads are not supported")
-    if not filepath.is_file():
+    if not stat.S_ISREG(mode):
         raise FileNotFoundError(f"Could not locate file at {filepath}")
 
     # Open the file in binary mode and pass it directly to requests
@@ -100,6 +137,264 @@ def generate_multipart_json(
     return d
 
 
+@lru_cache(maxsize=256)
+def _part_headers(
+    name: str, filename: Optional[str], content_type: Optional[str]
+) -> bytes:
+    """The encoded headers of a multipart field.
+
+    Memoized, since analyses run over many files send the same form fields each time.
+    """
+    field = RequestField(name=name, data=b"", filename=filename)
+    field.make_multipart(content_type=content_type)
+    return field.render_headers().encode("utf-8")
+
+
+class _ConcatenatedStream(io.RawIOBase):
+    """A seekable read-only stream of byte strings and slices of open files.
+
+    The files are only read as the stream is, one chunk at a time. Closing the stream
+    closes them.
+    """
+
+    CHUNK_SIZE = 1 << 16
+    """Number of bytes produced per iteration."""
+
+    def __init__(
+        self,
+        segments: list[Union[bytes, tuple[IO[bytes], int, int]]],
+        files: list[IO[bytes]],
+    ) -> None:
+        """Create the stream from `segments`, each either bytes or a `(file, start,
+        size)` slice of one of `files`."""
+        super().__init__()
+        self._segments = segments
+        self._files = files
+        self._offsets: list[int] = []
+        self._length = 0
+        for segment in self._segments:
+            self._offsets.append(self._length)
+            self._length += len(segment) if isinstance(segment, bytes) else segment[2]
+        self._position = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        while chunk := self.read(self.CHUNK_SIZE):
+            yield chunk
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._length
+        elif whence != os.SEEK_SET:
+            raise ValueError(f"Invalid whence: {whence}")
+        if offset < 0:
+            raise ValueError(f"Negative seek position: {offset}")
+        self._position = offset
+        return offset
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._length - self._position
+        chunks = []
+        while size > 0 and self._position < self._length:
+            index = bisect_right(self._offsets, self._position) - 1
+            within = self._position - self._offsets[index]
+            segment = self._segments[index]
+            if isinstance(segment, bytes):
+                chunk = segment[within : within + size]
+            else:
+                file, start, length = segment
+                file.seek(start + within)
+                chunk = file.read(min(size, length - within))
+                if not chunk:
+                    raise OSError(f"{getattr(file, 'name', file)} shrank during upload")
+            chunks.append(chunk)
+            self._position += len(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        for file in self._files:
+            file.close()
+        super().close()
+
+
+class MultipartStream(_ConcatenatedStream):
+    """A multipart/form-data body that reads its file fields from disk as it is sent.
+
+    `requests` reads every file given through `files=` into memory before sending it.
+    This object produces the same body in chunks instead, so an upload only holds one
+    chunk of the file at a time. Send it as `data=` together with :attr:`headers`.
+
+    The stream is seekable, which lets `urllib3` rewind it when a request is retried.
+    Closing it closes the file objects it was built from.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, tuple[Optional[str], Any, Optional[str]]],
+        boundary: Optional[str] = None,
+    ) -> None:
+        """Create the body from `(filename, value, content_type)` fields, as returned
+        by :func:`generate_multipart_json`. Values with a `read` method must be seekable
+        binary files, such as a :class:`TarStream`; everything else is sent as text.
+        """
+        self.boundary = boundary or choose_boundary()
+        segments: list[Union[bytes, tuple[IO[bytes], int, int]]] = []
+        files: list[IO[bytes]] = []
+
+        pending = b""
+        for name, (filename, value, content_type) in fields.items():
+            pending += f"--{self.boundary}\r\n".encode("latin-1")
+            pending += _part_headers(name, filename, content_type)
+
+            if hasattr(value, "read"):
+                files.append(value)
+                start = value.tell()
+                size = value.seek(0, os.SEEK_END) - start
+                value.seek(start)
+                segments.append(pending)
+                segments.append((value, start, size))
+                pending = b"\r\n"
+            else:
+                if not isinstance(value, bytes):
+                    value = str(value).encode("utf-8")
+                pending += value + b"\r\n"
+        pending += f"--{self.boundary}--\r\n".encode("latin-1")
+        segments.append(pending)
+        super().__init__(segments, files)
+
+    @property
+    def content_type(self) -> str:
+        """The value of the Content-Type header for this body."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """The Content-Type and Content-Length headers to send with this body."""
+        return {"Content-Type": self.content_type, "Content-Length": str(self._length)}
+
+
+class TarStream(_ConcatenatedStream):
+    """An uncompressed tar archive of a directory, read from the directory's files as
+    it is sent.
+
+    The archive is the same as `tarfile.open(name, "w").add(directory)` would write,
+    but no archive file is written to disk. The files are opened when the stream is
+    created and must not change size until it is closed. Use it as the file of a
+    :class:`MultipartStream` to upload e.g. a 🤗 checkpoint directory.
+    """
+
+    def __init__(self, directory: str | Path, arcname: Optional[str] = None) -> None:
+        """Create the archive of `directory`, stored under `arcname` (by default the
+        directory's name)."""
+        directory = Path(directory)
+        segments: list[Union[bytes, tuple[IO[bytes], int, int]]] = []
+        files: list[IO[bytes]] = []
+
+        # Only used for its header settings and hard link tracking
+        with tarfile.open(fileobj=io.BytesIO(), mode="w") as tar:
+            try:
+                for path, name in _tar_members(
+                    directory, directory.name if arcname is None else arcname
+                ):
+                    info = tar.gettarinfo(path, name)
+                    if info is None:
+                        continue  # sockets and the like, which tarfile skips too
+                    segments.append(info.tobuf(tar.format, tar.encoding, tar.errors))
+                    if info.isreg() and info.size:
+                        file = open(path, "rb")
+                        files.append(file)
+                        _advise_sequential(file)
+                        segments.append((file, 0, info.size))
+                        if info.size % tarfile.BLOCKSIZE:
+                            padding = tarfile.BLOCKSIZE - info.size % tarfile.BLOCKSIZE
+                            segments.append(tarfile.NUL * padding)
+            except BaseException:
+                for file in files:
+                    file.close()
+                raise
+
+        # The end-of-archive marker, padded to a whole record like tarfile does
+        size = sum(len(s) if isinstance(s, bytes) else s[2] for s in segments)
+        size += 2 * tarfile.BLOCKSIZE
+        end = 2 * tarfile.BLOCKSIZE + -size % tarfile.RECORDSIZE
+        segments.append(tarfile.NUL * end)
+        super().__init__(segments, files)
+
+
+def _tar_members(path: Path, name: str) -> Iterator[tuple[Path, str]]:
+    """The paths and archive names of `path` and everything under it, in the order
+    `TarFile.add` adds them."""
+    yield path, name
+    if path.is_dir() and not path.is_symlink():
+        for child in sorted(os.listdir(path)):
+            yield from _tar_members(path / child, f"{name}/{child}")
+
+
+def _advise_sequential(file: IO[bytes]) -> None:
+    """Tell the kernel that `file` will be read from start to end, so it reads ahead
+    further. Best effort: skipped where `posix_fadvise` is not available."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        pass
+
+
+def generate_multipart_stream(filepath: Path | str | None, **kwargs) -> MultipartStream:
+    """Generate a multipart/form-data body that streams the file from disk.
+
+    Takes the same arguments as :func:`generate_multipart_json`, but returns a
+    :class:`MultipartStream` to send as `data=` with its `headers`, instead of a dict
+    for `files=`.
+    """
+    fields = generate_multipart_json(filepath, **kwargs)
+    try:
+        return MultipartStream(fields)
+    except BaseException:
+        if "file" in fields:
+            fields["file"][1].close()
+        raise
+
+
+def _generate_upload_stream(
+    path: Path | str | None, is_dir: bool, **kwargs
+) -> MultipartStream:
+    """Like :func:`generate_multipart_stream`, but a directory, e.g. a 🤗 checkpoint,
+    is sent as an uncompressed tar archive named `<directory>.tar`, built by
+    :class:`TarStream` while it is sent."""
+    if not is_dir:
+        return generate_multipart_stream(path, **kwargs)
+    fields = generate_multipart_json(None, **kwargs)
+    path = Path(path)
+    fields["file"] = (f"{path.name}.tar", TarStream(path), None)
+    try:
+        return MultipartStream(fields)
+    except BaseException:
+        fields["file"][1].close()
+        raise
+
+
 class FileType(Enum):
     """The type of a model checkpoint.
 
@@ -118,3 +413,25 @@ class FileType(Enum):
     """Hugging Face checkpoint file for text generation (e.g., Llama)"""
     HF_IT2T = "HF_IMAGE_TEXT_TO_TEXT"
     """Hugging Face checkpoint file for image text to text (e.g., Gemma)"""
+
+    @classmethod
+    def _missing_(cls, value: object) -> Optional[FileType]:
+        """Also accept member names and lowercase strings, e.g. "onnx" or "hf_text".
+
+        Exact values are resolved by `Enum`'s own value lookup before this is called.
+        """
+        if isinstance(value, str):
+            return _FILE_TYPE_ALIASES.get(value.upper())
+        return None
+
+
+_FILE_TYPE_ALIASES = {
+    **{member.name: member for member in FileType},
+    **{member.value: member for member in FileType},
+}
+
+
+@lru_cache(maxsize=None)
+def _file_type_value(model_format: str | FileType) -> str:
+    """The API value of a model format, memoized for scripts that upload in a loop."""
+    return FileType(model_format).value
@@ -1,12 +1,30 @@
-try:
-    import click  # noqa: F401
-    import transformers  # noqa: F401
-except ImportError:
-    raise ImportError(
-        "The transformers module requires the 'transformers' extra to be installed."
-        " Please install with: pip install authentrics-client[transformers]"
-    ) from None
+from typing import TYPE_CHECKING
 
-from .callback import AuthentricsCallback
+if TYPE_CHECKING:
+    from .callback import AuthentricsCallback
 
 __all__ = ["AuthentricsCallback"]
+
+
+def __getattr__(name: str):
+    # `transformers` pulls in torch and takes seconds to import, so it is only
+    # imported once the callback is used.
+    if name in __all__:
+        try:
+            import click  # noqa: F401
+            import transformers  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "The transformers module requires the 'transformers' extra to be"
+                " installed. Please install with:"
+                " pip install authentrics-client[transformers]"
+            ) from None
+
+        from . import callback
+
+        return getattr(callback, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
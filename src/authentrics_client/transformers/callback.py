@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-import json
+import atexit
 import logging
-import tarfile
+import logging.handlers
+import queue
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from transformers import (
@@ -14,6 +17,49 @@ from transformers import (
 
 from .. import AuthentricsClient, FileType
 from ..cli import TOKEN_PATH
+from ..client.cache import TTLCache
+from ..client.handlers.authentication_handler import decode_token
+from ..client.serialization import json_dumpb, json_loads
+
+LOG_QUEUE_SIZE = 1024
+
+# Clients by (url, token), so callbacks created one after the other (e.g. one per
+# hyperparameter search trial) share a logged in session and its open connections.
+# Each entry expires with its token.
+_CLIENTS = TTLCache(maxsize=16)
+
+
+class _BlockingQueueHandler(logging.handlers.QueueHandler):
+    """Blocks on a full queue instead of reporting the record as failed."""
+
+    def enqueue(self, record: logging.LogRecord):
+        self.queue.put(record)
+
+
+class _BlockingQueueListener(logging.handlers.QueueListener):
+    """Blocks on a full queue when stopping instead of raising ``queue.Full``."""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+def _default_logger() -> logging.Logger:
+    """The module's logger, which formats and writes its records to stderr from a
+    background thread. The handler is added once, however many callbacks use it."""
+    logger = logging.getLogger(__name__)
+    if not any(isinstance(h, _BlockingQueueHandler) for h in logger.handlers):
+        handler = logging.StreamHandler()
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+        )
+        log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        listener = _BlockingQueueListener(log_queue, handler)
+        listener.start()
+        # writes out the records still queued when the interpreter exits
+        atexit.register(listener.stop)
+        logger.addHandler(_BlockingQueueHandler(log_queue))
+        logger.setLevel(logging.INFO)
+    return logger
 
 
 class AuthentricsCallback(TrainerCallback):
@@ -29,7 +75,12 @@ class AuthentricsCallback(TrainerCallback):
         False).
         model_format (str | FileType): The format of the model files.
         logger (logging.Logger | None, optional): Logger instance to use. If None, a
-        default logger is created.
+        default logger is created, which writes from a background thread.
+        background_upload (bool, optional): Whether to tar, upload and analyze saved
+        checkpoints in a background thread, so training continues meanwhile
+        (default: True).
+        analysis_batch_size (int, optional): Number of uploaded checkpoints to run the
+        static analysis for in one request (default: 1).
     """
 
     def __init__(
@@ -39,6 +90,8 @@ class AuthentricsCallback(TrainerCallback):
         model_format: str | FileType,
         save_stats_local: bool = False,
         logger: logging.Logger | None = None,
+        background_upload: bool = True,
+        analysis_batch_size: int = 1,
     ):
         """Initialize the AuthentricsCallback.
 
@@ -52,6 +105,13 @@ class AuthentricsCallback(TrainerCallback):
             model_format (str | FileType): The format of the model files.
             logger (logging.Logger | None, optional): Logger instance to use. If None, a
             default logger is created.
+            background_upload (bool, optional): Whether to tar, upload and analyze
+            saved checkpoints in a background thread (default: True). Uploads run one
+            at a time, in the order the checkpoints were saved, and are waited for at
+            the end of training.
+            analysis_batch_size (int, optional): Number of uploaded checkpoints to run
+            the static analysis for in one request (default: 1). Checkpoints wait for
+            the analysis until enough are uploaded, or until the end of training.
         """
         # check if we are logged in and already have a token
         self.session = self._check_authorization()
@@ -60,17 +120,19 @@ class AuthentricsCallback(TrainerCallback):
         self.features = features
         self.model_format = FileType(model_format)
         self.logger = logger
+        self._io_pool = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="authentrics-upload")
+            if background_upload
+            else None
+        )
+        self._pending: list[Future] = []
+        self.analysis_batch_size = analysis_batch_size
+        self._analysis_queue: list[tuple[Path, str, dict]] = []
 
         self.project = self.session.project.get_project_by_name(self.project_name)
 
         if self.logger is None:
-            self.logger = logging.getLogger(__name__)
-            handler = logging.StreamHandler()
-            handler.setFormatter(
-                logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-            )
-            self.logger.addHandler(handler)
-            self.logger.setLevel(logging.INFO)
+            self.logger = _default_logger()
 
         if self.project is None:
             self.logger.info("Project not found, Creating new project")
@@ -82,18 +144,38 @@ class AuthentricsCallback(TrainerCallback):
         else:
             files = self.project["fileList"]
             self.logger.info(
-                f"Found project with project name: {self.project_name}."
-                " Current analysis of all checkpoints:"
+                "Found project with project name: %s. Current analysis of all"
+                " checkpoints:",
+                self.project_name,
             )
             for file in files:
                 self.logger.info(
-                    f"File Name: {file['fileName']}\n"
-                    f"Weight Contr: {file['totalWeightContribution']}\n"
-                    f"Bias Contr: {file['totalBiasContribution']}"
+                    "File Name: %s\nWeight Contr: %s\nBias Contr: %s",
+                    file["fileName"],
+                    file["totalWeightContribution"],
+                    file["totalBiasContribution"],
                 )
             if len(files) == 0:
                 self.logger.info("No checkpoints found")
 
+    def on_step_end(
+        self,
+        args: TrainingArguments,
+        state: TrainerState,
+        control: TrainerControl,
+        **kwargs,
+    ):
+        self._wait_before_rotation(args, control)
+
+    def on_epoch_end(
+        self,
+        args: TrainingArguments,
+        state: TrainerState,
+        control: TrainerControl,
+        **kwargs,
+    ):
+        self._wait_before_rotation(args, control)
+
     def on_save(
         self,
         args: TrainingArguments,
@@ -103,44 +185,99 @@ class AuthentricsCallback(TrainerCallback):
     ):
         output_dir = Path(args.output_dir)
 
-        checkpoint_name = self._add_checkpoint(output_dir, state)
+        if self._io_pool is None:
+            self._upload_and_analyze(output_dir, state.global_step)
+            return
+
+        # Report errors of finished uploads now rather than at the end of training
+        for future in [f for f in self._pending if f.done()]:
+            self._pending.remove(future)
+            future.result()
+        self._pending.append(
+            self._io_pool.submit(self._upload_and_analyze, output_dir, state.global_step)
+        )
+
+    def on_train_end(
+        self,
+        args: TrainingArguments,
+        state: TrainerState,
+        control: TrainerControl,
+        **kwargs,
+    ):
+        self._wait_for_uploads()
+        if self._analysis_queue:
+            self._run_analyses()
+
+    def _wait_before_rotation(self, args: TrainingArguments, control: TrainerControl):
+        """With a save limit, the coming save may delete a checkpoint that is still
+        waiting to be uploaded, so wait for the uploads first."""
+        if control.should_save and args.save_total_limit is not None:
+            self._wait_for_uploads()
+
+    def _wait_for_uploads(self):
+        """Wait for the pending background uploads, raising the first error."""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def _upload_and_analyze(self, output_dir: Path, global_step: int):
+        checkpoint_name = self._add_checkpoint(output_dir, global_step)
 
         files = self.project["fileList"]
         if len(files) < 2:
             self.logger.info("1st checkpoint, not running the static analysis")
             return
 
-        self.logger.info(f"Running Static Analysis for file: {files[-1]['fileName']}")
-        static_analysis = self.session.static.static_analysis(
-            project_id=self.project["id"],
-            checkpoint_id=files[-1]["id"],
-            comparison_type="CHOSEN",
-        )
+        self._analysis_queue.append((output_dir, checkpoint_name, files[-1]))
+        if len(self._analysis_queue) >= self.analysis_batch_size:
+            self._run_analyses()
+
+    def _run_analyses(self):
+        """Run the static analysis for the queued checkpoints and report the results."""
+        queue, self._analysis_queue = self._analysis_queue, []
+        for _, _, file in queue:
+            self.logger.info("Running Static Analysis for file: %s", file["fileName"])
+
+        if len(queue) == 1:
+            results = [
+                self.session.static.static_analysis(
+                    project_id=self.project["id"],
+                    checkpoint_id=queue[0][2]["id"],
+                    comparison_type="CHOSEN",
+                )
+            ]
+        else:
+            results = self.session.static.static_analysis_batch(
+                self.project["id"],
+                [file["id"] for _, _, file in queue],
+                comparison_type="CHOSEN",
+            )
 
-        self.logger.info("Summary status of the current saved checkpoint...")
-        self.logger.info(
-            f"Weight Summary Score: {static_analysis['weight_summary_score']}"
-        )
-        self.logger.info(f"Bias Summary Score: {static_analysis['bias_summary_score']}")
+        for (output_dir, checkpoint_name, _), static_analysis in zip(queue, results):
+            self.logger.info("Summary status of the current saved checkpoint...")
+            self.logger.info(
+                "Weight Summary Score: %s", static_analysis["weight_summary_score"]
+            )
+            self.logger.info(
+                "Bias Summary Score: %s", static_analysis["bias_summary_score"]
+            )
 
-        if self.save_stats_local:
-            self._save_stats(output_dir, checkpoint_name, static_analysis)
+            if self.save_stats_local:
+                self._save_stats(output_dir, checkpoint_name, static_analysis)
 
-    def _add_checkpoint(self, output_dir: Path, state: TrainerState):
+    def _add_checkpoint(self, output_dir: Path, global_step: int):
         assert self.project is not None, "Project not found, initialization failed"
 
-        ckpt_dir = f"checkpoint-{state.global_step}"
+        ckpt_dir = f"checkpoint-{global_step}"
         artifact_path = output_dir / ckpt_dir
         checkpoint_name = f"{ckpt_dir}-{len(self.project['fileList']) + 1}"
 
-        tar_path = output_dir / f"{checkpoint_name}.tar"
-
-        self._tar_directory(artifact_path, tar_path)
-        self.logger.info(f"Uploading checkpoint artifacts in {ckpt_dir}...")
+        # Uploaded as a tar archive built while it is sent, with no tar file on disk
+        self.logger.info("Uploading checkpoint artifacts in %s...", ckpt_dir)
 
         self.project = self.session.checkpoint.add_checkpoint(
             self.project["id"],
-            tar_path,
+            artifact_path,
             self.model_format.value,
             checkpoint_name=checkpoint_name,
         )
@@ -148,33 +285,28 @@ class AuthentricsCallback(TrainerCallback):
         return checkpoint_name
 
     def _save_stats(self, output_dir: Path, checkpoint_name: str, static_analysis: dict):
-        final_output = {}
-
-        for feature in self.features:
-            if feature in static_analysis:
-                final_output[feature] = static_analysis[feature]
-            else:
-                self.logger.error(f"Feature: {feature} not available for response")
-
-        if len(self.features) == 0:
+        if not self.features:
             final_output = static_analysis
+        else:
+            final_output = {}
+            for feature in self.features:
+                if feature in static_analysis:
+                    final_output[feature] = static_analysis[feature]
+                else:
+                    self.logger.error("Feature: %s not available for response", feature)
 
         project_output_dir = self._create_output_dir(output_dir)
         file_name = project_output_dir / f"static_analysis_{checkpoint_name}.json"
 
-        self.logger.info(f"Created analysis response with file name: {file_name}")
-
-        with open(file_name, "w") as file:
-            json.dump(final_output, file, indent=4)
+        self.logger.info("Created analysis response with file name: %s", file_name)
 
-    def _tar_directory(self, directory: Path, tar_filename: Path):
-        with tarfile.open(tar_filename, "w") as tar:
-            tar.add(directory, arcname=directory.name)
+        with open(file_name, "wb") as file:
+            file.write(json_dumpb(final_output, indent=True))
 
     def _check_authorization(self) -> AuthentricsClient:
         if TOKEN_PATH.exists():
-            with TOKEN_PATH.open("r", encoding="utf-8") as file:
-                data = json.load(file)
+            with TOKEN_PATH.open("rb") as file:
+                data = json_loads(file.read())
                 if "token" not in data or "url" not in data:
                     raise ValueError("Invalid token file, please login again")
 
@@ -186,14 +318,26 @@ class AuthentricsCallback(TrainerCallback):
             ) from None
 
     def _check_token_validity(self, data: dict[str, str]) -> AuthentricsClient:
+        try:
+            expires_in = decode_token(data["token"])["exp"] - time.time()
+        except ValueError:
+            raise ValueError("Expired token. Please login again") from None
+
+        key = (data["url"], data["token"])
+        session = _CLIENTS.get(key)
+        if session is not None:
+            return session
+
         try:
             session = AuthentricsClient(data["url"])
+            # Logging in with a token already checks it against the server
             session.auth.login(token=data["token"])
-            session.project.get_projects()
-            return session
         except Exception:
             raise ValueError("Expired token. Please login again") from None
 
+        _CLIENTS.set(key, session, expires_in)
+        return session
+
     def _create_output_dir(self, output_dir: Path) -> Path:
         output_path = output_dir / self.project_name
         output_path.mkdir(parents=True, exist_ok=True)
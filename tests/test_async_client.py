@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Callable
+
+import jwt
+import pytest
+
+from authentrics_client.client.async_client import AsyncAuthentricsClient
+
+httpx = pytest.importorskip("httpx")
+
+URL = "https://example.com"
+
+
+def run(
+    handler: Callable[[httpx.Request], httpx.Response],
+    call: Callable[[AsyncAuthentricsClient], object],
+):
+    """Run `call` on a client whose requests are answered by `handler`."""
+
+    async def main():
+        client = AsyncAuthentricsClient(URL)
+        headers = client._session.headers
+        await client._session.aclose()
+        client._session = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), headers=headers
+        )
+        async with client:
+            return await call(client)
+
+    return asyncio.run(main())
+
+
+def body(request: httpx.Request) -> dict:
+    return json.loads(request.content)
+
+
+def test_admin_get_user_by_email_filters_exact_match():
+    users = [{"emailAddress": "bob@example.com"}, {"emailAddress": "b@example.com"}]
+
+    def handler(request):
+        assert request.url.path == "/api/auth/admin/user"
+        assert request.url.params["emailAddress"] == "b@example.com"
+        return httpx.Response(200, json=users)
+
+    user = run(handler, lambda client: client.admin.get_user_by_email("b@example.com"))
+
+    assert user == {"emailAddress": "b@example.com"}
+
+
+def test_auth_login_sends_credentials_and_sets_token():
+    token = jwt.encode({"exp": int(time.time() + 3600)}, "s" * 48, "HS384")
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path == "/api/auth/login":
+            return httpx.Response(200, content=token.encode())
+        if request.url.path == "/api/auth/user":
+            return httpx.Response(200)
+        return httpx.Response(403)
+
+    async def login(client):
+        await client.auth.login(username="alice", password="secret")
+        return client._session.headers["Authorization"]
+
+    assert run(handler, login) == f"Bearer {token}"
+    assert body(requests[0]) == {"username": "alice", "password": "secret"}
+
+
+def test_checkpoint_download_checkpoints_selects_ids(tmp_path):
+    project = {"fileList": [{"id": "a", "name": "a.pt"}, {"id": "b", "name": "b.pt"}]}
+
+    def handler(request):
+        if request.url.path == "/project/p1":
+            return httpx.Response(200, json=project)
+        assert request.url.path == "/project/file/b"
+        assert request.url.params["projectId"] == "p1"
+        return httpx.Response(
+            200,
+            content=b"weights",
+            headers={"Content-Type": "application/octet-stream"},
+        )
+
+    paths = run(
+        handler,
+        lambda client: client.checkpoint.download_checkpoints(
+            "p1", tmp_path, checkpoint_ids=["b"]
+        ),
+    )
+
+    assert list(paths) == ["b"]
+    assert paths["b"].read_bytes() == b"weights"
+
+
+def test_membership_update_puts_kwargs_after_permissions():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"id": "u1"})
+
+    run(
+        handler,
+        lambda client: client.membership.update_project_member(
+            project_id="p1", user_id="u1", permissions=["READ"], display_name="Al"
+        ),
+    )
+
+    assert requests[0].method == "PATCH"
+    assert requests[0].url.path == "/project/p1/user/u1"
+    assert body(requests[0]) == {"permissions": ["READ"], "displayName": "Al"}
+
+
+def test_project_get_project_by_name_filters_exact_match():
+    projects = [{"name": "model-2"}, {"name": "model"}]
+
+    def handler(request):
+        assert request.url.params["name"] == "model"
+        return httpx.Response(200, json=projects)
+
+    project = run(handler, lambda client: client.project.get_project_by_name("model"))
+
+    assert project == {"name": "model"}
+
+
+def test_result_download_streams_artifact(tmp_path):
+    def handler(request):
+        assert request.url.path == "/project/p1/analysis/result/artifact"
+        assert dict(request.url.params) == {"requestId": "r1", "mode": "STREAM"}
+        return httpx.Response(
+            200,
+            content=b"artifact",
+            headers={"Content-Type": "application/octet-stream"},
+        )
+
+    run(
+        handler,
+        lambda client: client.result.downloadAnalysisResultArtifact(
+            "p1", "r1", tmp_path / "r1"
+        ),
+    )
+
+    assert (tmp_path / "r1").read_bytes() == b"artifact"
+
+
+def test_static_batch_falls_back_when_endpoint_is_missing():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path == "/static_analysis/batch":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"fileId": body(request)["fileId"]})
+
+    async def analyze_twice(client):
+        first = await client.static.static_analysis_batch("p1", ["a", "b"])
+        second = await client.static.static_analysis_batch("p1", ["c"])
+        return first, second
+
+    first, second = run(handler, analyze_twice)
+
+    assert first == [{"fileId": "a"}, {"fileId": "b"}]
+    assert second == [{"fileId": "c"}]
+    # The missing endpoint is only tried once
+    paths = [request.url.path for request in requests]
+    assert paths.count("/static_analysis/batch") == 1
@@ -0,0 +1,95 @@
+import pytest
+
+from authentrics_client import AuthentricsClient
+from authentrics_client.client import cache as cache_module
+from authentrics_client.client.cache import SQLiteCache, TTLCache
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "cache" / "metadata.sqlite"
+
+
+def test_get_returns_stored_pair(path):
+    cache = SQLiteCache(path)
+    cache.set("/project", ('"v1"', b"[]"))
+
+    assert cache.get("/project") == ('"v1"', b"[]")
+    assert cache.get("/other") is None
+
+
+def test_set_evicts_least_recently_stored_beyond_maxsize(path, clock):
+    cache = SQLiteCache(path, maxsize=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, ('"v1"', key.encode()))
+        clock.now += 1
+
+    assert cache.get("a") is None
+    assert cache.get("b") == ('"v1"', b"b")
+    assert cache.get("c") == ('"v1"', b"c")
+
+
+def test_expired_entries_are_ignored_and_purged(path, clock):
+    cache = SQLiteCache(path, ttl=60)
+    cache.set("old", ('"v1"', b"old"))
+    clock.now += 61
+
+    assert cache.get("old") is None
+    cache.set("new", ('"v1"', b"new"))
+    rows = cache._connection.execute("SELECT key FROM responses").fetchall()
+    assert rows == [("new",)]
+
+
+def test_namespaces_are_isolated(path):
+    first = SQLiteCache(path, namespace="https://a.example.com")
+    second = SQLiteCache(path, namespace="https://b.example.com")
+    first.set("/project", ('"a"', b"a"))
+    second.set("/project", ('"b"', b"b"))
+
+    first.clear()
+
+    assert first.get("/project") is None
+    assert second.get("/project") == ('"b"', b"b")
+
+
+def test_clear_mode_empties_the_file_when_opened(path, monkeypatch):
+    cache = SQLiteCache(path)
+    cache.set("/project", ('"v1"', b"[]"))
+    cache.close()
+
+    monkeypatch.setenv("AAI_METADATA_CACHE", "clear")
+
+    assert SQLiteCache(path).get("/project") is None
+
+
+def test_ignore_mode_keeps_etags_in_memory(path, monkeypatch):
+    monkeypatch.setenv("AAI_METADATA_CACHE", "ignore")
+
+    client = AuthentricsClient("https://example.com", metadata_cache=path)
+
+    assert isinstance(client._etag_cache, TTLCache)
+    assert not path.exists()
+
+
+def test_metadata_cache_is_used_by_default(path, monkeypatch):
+    monkeypatch.delenv("AAI_METADATA_CACHE", raising=False)
+
+    client = AuthentricsClient("https://example.com", metadata_cache=path)
+
+    assert isinstance(client._etag_cache, SQLiteCache)
+    assert client._etag_cache.namespace == client.base_url
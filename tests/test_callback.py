@@ -0,0 +1,87 @@
+import logging
+import time
+from pathlib import Path
+from unittest import mock
+
+import jwt
+import pytest
+
+pytest.importorskip("transformers")
+
+from authentrics_client.client.handlers import StaticHandler  # noqa: E402
+from authentrics_client.transformers import callback as callback_module  # noqa: E402
+from authentrics_client.transformers.callback import AuthentricsCallback  # noqa: E402
+
+RESULT = {"weight_summary_score": 0.5, "bias_summary_score": 0.25}
+
+
+def make_callback(queue: list[tuple[Path, str, dict]]) -> AuthentricsCallback:
+    """A callback with a session whose static handler only has StaticHandler's
+    methods, without logging in or looking up the project."""
+    callback = AuthentricsCallback.__new__(AuthentricsCallback)
+    callback.session = mock.Mock()
+    callback.session.static = mock.create_autospec(StaticHandler, instance=True)
+    callback.project = {"id": "project-1", "fileList": []}
+    callback.logger = logging.getLogger(__name__)
+    callback.save_stats_local = False
+    callback._analysis_queue = list(queue)
+    return callback
+
+
+def queued(*checkpoint_ids: str) -> list[tuple[Path, str, dict]]:
+    return [
+        (Path("out"), f"checkpoint-{i}", {"id": checkpoint_id, "fileName": i})
+        for i, checkpoint_id in enumerate(checkpoint_ids)
+    ]
+
+
+def test_run_analyses_batches_queued_checkpoints():
+    callback = make_callback(queued("file-1", "file-2"))
+    callback.session.static.static_analysis_batch.return_value = [RESULT, RESULT]
+
+    callback._run_analyses()
+
+    callback.session.static.static_analysis_batch.assert_called_once_with(
+        "project-1", ["file-1", "file-2"], comparison_type="CHOSEN"
+    )
+    assert callback._analysis_queue == []
+
+
+def test_run_analyses_single_checkpoint():
+    callback = make_callback(queued("file-1"))
+    callback.session.static.static_analysis.return_value = RESULT
+
+    callback._run_analyses()
+
+    callback.session.static.static_analysis.assert_called_once_with(
+        project_id="project-1", checkpoint_id="file-1", comparison_type="CHOSEN"
+    )
+    callback.session.static.static_analysis_batch.assert_not_called()
+
+
+def make_token(expires_in: float) -> str:
+    return jwt.encode({"exp": int(time.time() + expires_in)}, "s" * 48, "HS384")
+
+
+def test_check_token_validity_reuses_client(monkeypatch):
+    monkeypatch.setattr(callback_module, "_CLIENTS", callback_module.TTLCache())
+    client_class = mock.Mock()
+    monkeypatch.setattr(callback_module, "AuthentricsClient", client_class)
+    data = {"url": "https://example.com", "token": make_token(3600)}
+    callback = AuthentricsCallback.__new__(AuthentricsCallback)
+
+    first = callback._check_token_validity(data)
+    second = callback._check_token_validity(data)
+
+    assert first is second
+    client_class.assert_called_once_with("https://example.com")
+
+
+def test_check_token_validity_rejects_expired_cached_token(monkeypatch):
+    monkeypatch.setattr(callback_module, "_CLIENTS", callback_module.TTLCache())
+    data = {"url": "https://example.com", "token": make_token(-60)}
+    callback_module._CLIENTS.set((data["url"], data["token"]), mock.Mock(), 3600)
+    callback = AuthentricsCallback.__new__(AuthentricsCallback)
+
+    with pytest.raises(ValueError, match="Expired token"):
+        callback._check_token_validity(data)
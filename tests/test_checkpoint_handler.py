@@ -0,0 +1,109 @@
+import json
+from unittest import mock
+
+import pytest
+import requests
+
+from authentrics_client.client.handlers import CheckpointHandler
+
+
+def make_handler() -> CheckpointHandler:
+    client = mock.Mock()
+    client._missing_endpoints = set()
+    return CheckpointHandler(client)
+
+
+def test_extra_kwargs_override_explicit_fields():
+    handler = make_handler()
+
+    handler.trigger_file_event("project-1", "file-1", file_id="file-2", force=True)
+
+    handler._client.post.assert_called_once_with(
+        "/project/file_event",
+        json={"projectId": "project-1", "fileId": "file-2", "force": True},
+    )
+
+
+def http_error(status_code: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(response=response)
+
+
+def fail_route(route: str, status_code: int):
+    """A side effect that rejects requests to `route` with `status_code`."""
+
+    def request(path, **kwargs):
+        if path == route:
+            raise http_error(status_code)
+        return mock.Mock()
+
+    return request
+
+
+@pytest.mark.parametrize("status_code", [400, 404, 405, 422])
+def test_trigger_file_events_falls_back_to_single_events(status_code):
+    handler = make_handler()
+    handler._client.post.side_effect = fail_route(
+        "/project/file_event/batch", status_code
+    )
+
+    handler.trigger_file_events("project-1", ["file-1", "file-2"], max_workers=1)
+    handler.trigger_file_events("project-1", ["file-3"])
+
+    assert handler._client.post.call_args_list == [
+        mock.call(
+            "/project/file_event/batch",
+            json={"projectId": "project-1", "fileIds": ["file-1", "file-2"]},
+        ),
+        mock.call(
+            "/project/file_event", json={"projectId": "project-1", "fileId": "file-1"}
+        ),
+        mock.call(
+            "/project/file_event", json={"projectId": "project-1", "fileId": "file-2"}
+        ),
+        # The batch route is not tried again
+        mock.call(
+            "/project/file_event", json={"projectId": "project-1", "fileId": "file-3"}
+        ),
+    ]
+
+
+def test_trigger_file_events_raises_other_errors():
+    handler = make_handler()
+    handler._client.post.side_effect = fail_route("/project/file_event/batch", 403)
+
+    with pytest.raises(requests.HTTPError):
+        handler.trigger_file_events("project-1", ["file-1"])
+    assert handler._client.post.call_count == 1
+
+
+def with_checkpoints(handler: CheckpointHandler, *checkpoint_ids: str) -> None:
+    project = {"id": "project-1", "fileList": [{"id": i} for i in checkpoint_ids]}
+    handler._client.get.return_value.content = json.dumps(project).encode()
+
+
+def test_delete_checkpoints_falls_back_to_single_deletes():
+    handler = make_handler()
+    with_checkpoints(handler, "file-1", "file-2")
+    handler._client.delete.side_effect = fail_route("/project/file/batch", 400)
+
+    handler.delete_checkpoints("project-1", ["file-1", "file-2"], max_workers=1)
+
+    assert handler._client.delete.call_args_list == [
+        mock.call(
+            "/project/file/batch",
+            json={"projectId": "project-1", "fileIds": ["file-1", "file-2"]},
+        ),
+        mock.call("/project/file", json={"projectId": "project-1", "fileId": "file-1"}),
+        mock.call("/project/file", json={"projectId": "project-1", "fileId": "file-2"}),
+    ]
+
+
+def test_delete_checkpoints_rejects_checkpoints_of_other_projects():
+    handler = make_handler()
+    with_checkpoints(handler, "file-1")
+
+    with pytest.raises(ValueError, match="file-2"):
+        handler.delete_checkpoints("project-1", ["file-1", "file-2"])
+    handler._client.delete.assert_not_called()
@@ -0,0 +1,35 @@
+import os
+
+import pytest
+import requests
+
+from authentrics_client.client.handlers.base_handler import BaseHandler
+
+MIB = 1 << 20
+
+
+def test_copy_response(tmp_path, file_server):
+    file_server.content = os.urandom(3 * MIB)
+    path = tmp_path / "checkpoint"
+
+    with open(path, "wb") as f:
+        response = requests.get(file_server.url, stream=True)
+        BaseHandler._copy_response(response, f, MIB)
+
+    assert path.read_bytes() == file_server.content
+
+
+def test_copy_response_raises_requests_error_when_interrupted(tmp_path, file_server):
+    file_server.content = os.urandom(3 * MIB)
+    file_server.truncate_after = MIB
+
+    path = tmp_path / "checkpoint"
+
+    with open(path, "wb") as f:
+        response = requests.get(file_server.url, stream=True)
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            BaseHandler._copy_response(response, f, MIB)
+
+    # Not left preallocated to the full size with a zero-filled tail
+    assert path.read_bytes() == file_server.content[: path.stat().st_size]
+    assert path.stat().st_size <= MIB
@@ -0,0 +1,39 @@
+from unittest import mock
+
+from authentrics_client.client.handlers import DynamicHandler
+
+
+def make_handler() -> DynamicHandler:
+    client = mock.Mock()
+    client._session.headers = {"Authorization": "Bearer token-1"}
+    client.post.return_value.content = b'{"score": 1}'
+    return DynamicHandler(client)
+
+
+def analyze(handler: DynamicHandler, stimulus_path) -> dict:
+    return handler.sensitivity_analysis(
+        "project-1", "file-1", stimulus_path, scaling_factor=0.5, cache=True
+    )
+
+
+def test_cached_result_is_reused(tmp_path):
+    stimulus_path = tmp_path / "stimulus.csv"
+    stimulus_path.write_text("1,2,3")
+    handler = make_handler()
+
+    assert analyze(handler, stimulus_path) == {"score": 1}
+    assert analyze(handler, stimulus_path) == {"score": 1}
+
+    assert handler._client.post.call_count == 1
+
+
+def test_cached_result_is_not_shared_with_another_login(tmp_path):
+    stimulus_path = tmp_path / "stimulus.csv"
+    stimulus_path.write_text("1,2,3")
+    handler = make_handler()
+
+    analyze(handler, stimulus_path)
+    handler._client._session.headers["Authorization"] = "Bearer token-2"
+    analyze(handler, stimulus_path)
+
+    assert handler._client.post.call_count == 2
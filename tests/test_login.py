@@ -0,0 +1,71 @@
+import json
+import time
+
+import jwt
+import pytest
+
+from authentrics_client.cli import login as login_module
+from authentrics_client.cli.login import load_cached_token, store_token
+
+URL = "https://example.com"
+
+
+@pytest.fixture(autouse=True)
+def token_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(login_module, "BASE_DIR", tmp_path)
+    monkeypatch.setattr(login_module, "TOKEN_PATH", tmp_path / "token.json")
+    return tmp_path / "token.json"
+
+
+def make_token(expires_in: float) -> str:
+    return jwt.encode({"exp": int(time.time() + expires_in)}, "s" * 48, "HS384")
+
+
+def test_load_cached_token_returns_stored_token():
+    token = make_token(3600)
+    store_token(token, URL, "alice")
+
+    assert load_cached_token(URL, "alice") == token
+
+
+def test_load_cached_token_rejects_other_owner_or_url():
+    store_token(make_token(3600), URL, "alice")
+
+    assert load_cached_token(URL, "bob") is None
+    assert load_cached_token("https://other.example.com", "alice") is None
+
+
+def test_load_cached_token_rejects_expired_token():
+    store_token(make_token(-60), URL, "alice")
+
+    assert load_cached_token(URL, "alice") is None
+
+
+def test_load_cached_token_rejects_token_past_ttl(token_path):
+    store_token(make_token(3600), URL, "alice")
+    data = json.loads(token_path.read_text())
+    data["COD"] -= login_module.TOKEN_TTL_NS
+    token_path.write_text(json.dumps(data))
+
+    assert load_cached_token(URL, "alice") is None
+
+
+def test_load_cached_token_refuses_symlink(tmp_path, token_path):
+    store_token(make_token(3600), URL, "alice")
+    target = tmp_path / "elsewhere.json"
+    token_path.replace(target)
+    token_path.symlink_to(target)
+
+    assert load_cached_token(URL, "alice") is None
+
+
+def test_store_token_replaces_symlink(tmp_path, token_path):
+    target = tmp_path / "elsewhere.json"
+    target.write_text("{}")
+    token_path.symlink_to(target)
+
+    store_token(make_token(3600), URL, "alice")
+
+    assert not token_path.is_symlink()
+    assert target.read_text() == "{}"
+    assert token_path.stat().st_mode & 0o777 == 0o600
@@ -0,0 +1,92 @@
+import io
+import os
+
+import pytest
+import requests
+
+from authentrics_client.client.types import (
+    MultipartStream,
+    generate_multipart_json,
+    generate_multipart_stream,
+)
+
+FORM = {"projectId": "project-1", "tags": ["a", "b"], "config": {"k": 1}, "step": 3}
+
+
+def requests_body(path, **kwargs) -> tuple[bytes, str]:
+    """The body `requests` encodes for the same fields, and its boundary."""
+    fields = generate_multipart_json(path, **kwargs)
+    try:
+        request = requests.Request("POST", "http://localhost", files=fields).prepare()
+    finally:
+        if "file" in fields:
+            fields["file"][1].close()
+    boundary = request.headers["Content-Type"].partition("boundary=")[2]
+    return request.body, boundary
+
+
+def stream_body(path, boundary: str, **kwargs) -> MultipartStream:
+    return MultipartStream(generate_multipart_json(path, **kwargs), boundary)
+
+
+@pytest.mark.parametrize(
+    ("filename", "content"),
+    [
+        ("model.onnx", os.urandom(200_000)),
+        ("empty.onnx", b""),
+        ("modèle-é.onnx", b"weights"),
+    ],
+)
+def test_body_matches_requests(tmp_path, filename, content):
+    path = tmp_path / filename
+    path.write_bytes(content)
+    expected, boundary = requests_body(path, **FORM)
+
+    with stream_body(path, boundary, **FORM) as stream:
+        assert stream.read() == expected
+        assert len(stream) == len(expected)
+        assert stream.headers == {
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Content-Length": str(len(expected)),
+        }
+
+
+def test_body_without_file_matches_requests():
+    expected, boundary = requests_body(None, **FORM)
+
+    with stream_body(None, boundary, **FORM) as stream:
+        assert stream.read() == expected
+
+
+def test_stream_reads_in_chunks_and_seeks(tmp_path):
+    path = tmp_path / "model.onnx"
+    path.write_bytes(os.urandom(100_000))
+    expected, boundary = requests_body(path, **FORM)
+
+    with stream_body(path, boundary, **FORM) as stream:
+        assert b"".join(iter(lambda: stream.read(777), b"")) == expected
+        assert stream.read() == b""
+
+        assert stream.seek(0) == 0
+        assert b"".join(stream) == expected
+
+        stream.seek(1000)
+        assert stream.read(5000) == expected[1000:6000]
+        assert stream.tell() == 6000
+        stream.seek(-10, io.SEEK_CUR)
+        assert stream.read(10) == expected[5990:6000]
+        stream.seek(-100, io.SEEK_END)
+        assert stream.read() == expected[-100:]
+        with pytest.raises(ValueError):
+            stream.seek(-1)
+
+
+def test_close_closes_file(tmp_path):
+    path = tmp_path / "model.onnx"
+    path.write_bytes(b"weights")
+    stream = generate_multipart_stream(path, projectId="project-1")
+    file = stream._files[0]
+
+    stream.close()
+
+    assert file.closed
@@ -0,0 +1,101 @@
+import os
+from unittest import mock
+
+import pytest
+import requests
+
+from authentrics_client import AuthentricsClient
+from authentrics_client.client.handlers import ResultHandler
+
+
+def make_handler() -> ResultHandler:
+    return ResultHandler(mock.Mock())
+
+
+def test_download_artifacts_forwards_resume_and_chunk_size(tmp_path, monkeypatch):
+    handler = make_handler()
+    download = mock.Mock()
+    monkeypatch.setattr(handler, "downloadAnalysisResultArtifact", download)
+
+    paths = handler.downloadAnalysisResultArtifacts(
+        "project-1", ["request-1"], tmp_path, chunk_size=4096, resume=True
+    )
+
+    assert paths == {"request-1": tmp_path / "request-1"}
+    download.assert_called_once_with(
+        "project-1",
+        "request-1",
+        tmp_path / "request-1",
+        overwrite=True,
+        chunk_size=4096,
+        resume=True,
+    )
+
+
+MIB = 1 << 20
+
+
+def download(file_server, path, **kwargs) -> None:
+    client = AuthentricsClient(file_server.url)
+    client.result.downloadAnalysisResultArtifact(
+        "project-1", "request-1", path, resume=True, **kwargs
+    )
+
+
+def test_resume_after_interrupted_download(tmp_path, file_server):
+    file_server.content = os.urandom(3 * MIB)
+    file_server.truncate_after = MIB
+    path = tmp_path / "artifact"
+
+    with pytest.raises(requests.RequestException):
+        download(file_server, path)
+    part_path = tmp_path / "artifact.part"
+    received = part_path.stat().st_size
+    assert 0 < received <= MIB
+    assert part_path.read_bytes() == file_server.content[:received]
+    assert not path.exists()
+
+    download(file_server, path)
+
+    assert path.read_bytes() == file_server.content
+    assert file_server.requests[-1]["Range"] == f"bytes={received}-"
+    assert file_server.requests[-1]["If-Range"] == '"v1"'
+    assert not part_path.exists()
+    assert not (tmp_path / "artifact.part.etag").exists()
+
+
+def test_resume_restarts_when_artifact_changed(tmp_path, file_server):
+    file_server.content = os.urandom(3 * MIB)
+    file_server.truncate_after = MIB
+    path = tmp_path / "artifact"
+    with pytest.raises(requests.RequestException):
+        download(file_server, path)
+
+    file_server.content = os.urandom(2 * MIB)
+    file_server.etag = '"v2"'
+    download(file_server, path)
+
+    assert path.read_bytes() == file_server.content
+
+
+def test_resume_completes_whole_partial_file(tmp_path, file_server):
+    file_server.content = os.urandom(MIB)
+    path = tmp_path / "artifact"
+    (tmp_path / "artifact.part").write_bytes(file_server.content)
+    (tmp_path / "artifact.part.etag").write_text('"v1"')
+
+    download(file_server, path)
+
+    assert path.read_bytes() == file_server.content
+    assert len(file_server.requests) == 1
+
+
+def test_resume_restarts_when_partial_file_is_too_long(tmp_path, file_server):
+    file_server.content = os.urandom(MIB)
+    path = tmp_path / "artifact"
+    (tmp_path / "artifact.part").write_bytes(file_server.content + b"\0" * 10)
+    (tmp_path / "artifact.part.etag").write_text('"v1"')
+
+    download(file_server, path)
+
+    assert path.read_bytes() == file_server.content
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+import requests
+
+from authentrics_client import AuthentricsClient
+
+
+def response(status_code: int, content: bytes = b"", etag: str | None = None):
+    r = requests.Response()
+    r.status_code = status_code
+    r._content = content
+    if etag is not None:
+        r.headers["ETag"] = etag
+    return r
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = AuthentricsClient("https://example.com", cache_ttl=60)
+    monkeypatch.setattr(client._session, "request", mock.Mock())
+    return client
+
+
+def sent_headers(client: AuthentricsClient) -> list[dict | None]:
+    return [call.kwargs.get("headers") for call in client._session.request.mock_calls]
+
+
+def test_not_modified_reuses_stored_body(client):
+    client._session.request.side_effect = [
+        response(200, b'[{"id": "p1"}]', etag='"v1"'),
+        response(304),
+    ]
+
+    assert client.project.get_projects() == [{"id": "p1"}]
+    assert client.project.get_projects() == [{"id": "p1"}]
+
+    assert sent_headers(client) == [None, {"If-None-Match": '"v1"'}]
+
+
+def test_changed_body_replaces_stored_body(client):
+    client._session.request.side_effect = [
+        response(200, b'[{"id": "p1"}]', etag='"v1"'),
+        response(200, b'[{"id": "p2"}]', etag='"v2"'),
+        response(304),
+    ]
+
+    client.project.get_projects()
+    assert client.project.get_projects() == [{"id": "p2"}]
+    assert client.project.get_projects() == [{"id": "p2"}]
+
+    assert sent_headers(client)[2] == {"If-None-Match": '"v2"'}
+
+
+def test_no_cache_skips_revalidation(client):
+    client._session.request.side_effect = [
+        response(200, b"[]", etag='"v1"'),
+        response(200, b"[]", etag='"v1"'),
+    ]
+
+    client.project.get_projects()
+    client.project.get_projects(no_cache=True)
+
+    assert sent_headers(client) == [None, None]
+
+
+def test_cached_read_is_invalidated_by_other_requests(client):
+    client._session.request.side_effect = [
+        response(200, b'{"id": "p1", "name": "a"}'),
+        response(200, b"{}"),
+        response(200, b'{"id": "p1", "name": "b"}'),
+    ]
+
+    assert client.project.get_project_by_id("p1")["name"] == "a"
+    assert client.project.get_project_by_id("p1")["name"] == "a"
+    client.project.update_project("p1", name="b")
+    assert client.project.get_project_by_id("p1")["name"] == "b"
+
+    assert client._session.request.call_count == 3
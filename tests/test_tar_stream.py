@@ -0,0 +1,70 @@
+import io
+import os
+import tarfile
+
+import pytest
+
+from authentrics_client.client.types import TarStream
+
+
+def tarfile_archive(directory, arcname=None) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        tar.add(directory, arcname=directory.name if arcname is None else arcname)
+    return buffer.getvalue()
+
+
+def test_matches_tarfile(tmp_path):
+    directory = tmp_path / "checkpoint"
+    (directory / "nested" / "deeper").mkdir(parents=True)
+    (directory / "model.safetensors").write_bytes(os.urandom(100_000))
+    (directory / "empty.json").write_bytes(b"")
+    (directory / "nested" / "deeper" / "block.bin").write_bytes(os.urandom(512))
+    (directory / "empty_dir").mkdir()
+    os.link(directory / "model.safetensors", directory / "hardlink.safetensors")
+    (directory / "symlink.json").symlink_to("empty.json")
+    (directory / "dangling").symlink_to("missing")
+    long_dir = directory / ("d" * 120)
+    long_dir.mkdir()
+    (long_dir / ("f" * 120 + ".bin")).write_bytes(b"long name")
+    (directory / ("n" * 200)).write_bytes(b"long file name")
+
+    with TarStream(directory) as stream:
+        archive = stream.read()
+
+    assert archive == tarfile_archive(directory)
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        # Members are added in sorted order, so the second name is the link
+        assert tar.getmember("checkpoint/model.safetensors").islnk()
+        assert tar.getmember("checkpoint/symlink.json").issym()
+
+
+def test_arcname(tmp_path):
+    directory = tmp_path / "checkpoint"
+    directory.mkdir()
+    (directory / "config.json").write_text("{}")
+
+    with TarStream(directory, arcname="renamed") as stream:
+        assert stream.read() == tarfile_archive(directory, "renamed")
+
+
+def test_empty_directory(tmp_path):
+    directory = tmp_path / "checkpoint"
+    directory.mkdir()
+
+    with TarStream(directory) as stream:
+        archive = stream.read()
+
+    assert archive == tarfile_archive(directory)
+    assert len(stream) % tarfile.RECORDSIZE == 0
+
+
+def test_file_that_shrinks_is_reported(tmp_path):
+    directory = tmp_path / "checkpoint"
+    directory.mkdir()
+    (directory / "model.bin").write_bytes(b"x" * 2048)
+
+    with TarStream(directory) as stream:
+        (directory / "model.bin").write_bytes(b"x")
+        with pytest.raises(OSError, match="shrank"):
+            stream.read()